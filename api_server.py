@@ -4,18 +4,38 @@ JobSpy API Server for n8n Cloud Integration
 Provides REST API endpoints to scrape jobs from various job boards
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 import pandas as pd
-import json
+import gzip
+import math
 from datetime import datetime
 import traceback
 import logging
+import os
+import threading
+from contextlib import nullcontext
 from typing import Optional, List, Dict, Any, Union
 
 # Import JobSpy
-from jobspy import scrape_jobs
+from jobspy import scrape_jobs, iter_jobs, fetch_details, configure_converter, JobStore
+from jobspy.cache import configure_cache, configure_detail_cache, get_cache, get_detail_cache
+from jobspy.circuit import get_circuit_breaker
+from jobspy.job_queue import QueueFull, SearchQueue
+from jobspy import metrics, serialize
 from jobspy.model import Site, Country
+from jobspy.profiling import phase, profiling
+from jobspy.proxy import proxy_stats
+from jobspy.ratelimit import get_rate_limiter
+from jobspy.scheduler import get_scheduler
+from jobspy.singleflight import get_single_flight
+from jobspy.util import desired_order
+
+# brotli is optional, gzip is always offered
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +44,80 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # Enable CORS for n8n Cloud
 
+# Repeated searches are served from the result cache; set JOBSPY_CACHE_PATH to
+# keep it on disk across restarts
+configure_cache(
+    path=os.environ.get('JOBSPY_CACHE_PATH'),
+    default_ttl=float(os.environ.get('JOBSPY_CACHE_TTL', 900))
+)
+# Parsed job detail pages are reused across searches when JOBSPY_DETAIL_CACHE_PATH
+# (a SQLite file) or JOBSPY_DETAIL_CACHE_TTL (in memory) is set
+detail_cache_path = os.environ.get('JOBSPY_DETAIL_CACHE_PATH')
+detail_cache_ttl = os.environ.get('JOBSPY_DETAIL_CACHE_TTL')
+if detail_cache_path or detail_cache_ttl:
+    configure_detail_cache(
+        path=detail_cache_path,
+        ttl=float(detail_cache_ttl or 24 * 60 * 60)
+    )
+# Description conversion runs on this many worker processes (0 = inline)
+configure_converter(workers=int(os.environ.get('JOBSPY_CONVERTER_WORKERS', 0)))
+# Requests with "store" or "only_new" record the jobs they return here, so a
+# later "only_new" search can skip them; opened the first time it's needed
+job_store_path = os.environ.get('JOBSPY_STORE_PATH', 'jobspy_jobs.db')
+job_store: Optional[JobStore] = None
+job_store_lock = threading.Lock()
+# Searches submitted with ?async=true run on background workers; the queue is
+# kept in SQLite so queued searches survive a restart, and is opened (and its
+# workers started) the first time it's needed
+search_queue: Optional[SearchQueue] = None
+search_queue_lock = threading.Lock()
+
+def get_job_store() -> JobStore:
+    """The API's JobStore, opened on first use"""
+    global job_store
+    with job_store_lock:
+        if job_store is None:
+            job_store = JobStore(job_store_path)
+        return job_store
+
+def get_search_queue() -> SearchQueue:
+    """The API's SearchQueue, opened with its workers on first use"""
+    global search_queue
+    with search_queue_lock:
+        if search_queue is None:
+            search_queue = SearchQueue(
+                lambda params, progress: run_search(params, progress),
+                path=os.environ.get('JOBSPY_QUEUE_PATH', 'jobspy_queue.db'),
+                workers=int(os.environ.get('JOBSPY_QUEUE_WORKERS', 2)),
+                max_pending=int(os.environ.get('JOBSPY_QUEUE_MAX_PENDING', 100))
+            )
+        return search_queue
+
+def dataframe_to_records(jobs_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a jobs DataFrame to records json_response can encode"""
+    return serialize.jobs_to_records(jobs_df)
+
+# Responses smaller than this aren't worth compressing
+MIN_COMPRESS_BYTES = 1024
+
+def json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Encode payload with jobspy.serialize (orjson when installed) and compress it
+    with brotli or gzip when the client's Accept-Encoding allows
+    """
+    body = serialize.dumps(payload)
+    response = Response(body, status=status, content_type='application/json')
+    if len(body) >= MIN_COMPRESS_BYTES:
+        encodings = request.accept_encodings
+        if brotli is not None and encodings['br']:
+            response.set_data(brotli.compress(body, quality=4))
+            response.headers['Content-Encoding'] = 'br'
+        elif encodings['gzip']:
+            response.set_data(gzip.compress(body, compresslevel=5))
+            response.headers['Content-Encoding'] = 'gzip'
+        response.headers.add('Vary', 'Accept-Encoding')
+    return response
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -33,6 +127,97 @@ def health_check():
         "service": "jobspy-api"
     })
 
+def search_params(data: Dict[str, Any]) -> Dict[str, Any]:
+    """scrape_jobs / iter_jobs keyword arguments from a /scrape-jobs payload, with defaults"""
+    return {
+        "site_name": data.get('site_name', ['indeed', 'linkedin']),
+        "search_term": data.get('search_term'),
+        "google_search_term": data.get('google_search_term'),
+        "location": data.get('location'),
+        "distance": data.get('distance', 50),
+        "is_remote": data.get('is_remote', False),
+        "job_type": data.get('job_type'),
+        "easy_apply": data.get('easy_apply'),
+        "results_wanted": data.get('results_wanted', 15),
+        "country_indeed": data.get('country_indeed', 'USA'),
+        "proxies": data.get('proxies'),
+        "description_format": data.get('description_format', 'markdown'),
+        "linkedin_fetch_description": data.get('linkedin_fetch_description', False),
+        "linkedin_company_ids": data.get('linkedin_company_ids'),
+        "offset": data.get('offset', 0),
+        "hours_old": data.get('hours_old'),
+        "enforce_annual_salary": data.get('enforce_annual_salary', False),
+        "verbose": data.get('verbose', 0),
+        "user_agent": data.get('user_agent'),
+        "deadline_seconds": data.get('deadline_seconds'),
+        "listing_only": data.get('listing_only', False),
+        "use_cache": data.get('use_cache', False),
+        # only searches that ask to be recorded, or to skip recorded jobs, touch the store
+        "job_store": get_job_store() if data.get('store') or data.get('only_new') else None,
+        "only_new": data.get('only_new', False),
+        # identical searches arriving while one runs share its result
+        "coalesce": data.get('coalesce', False),
+    }
+
+def search_summary(params: Dict[str, Any], sites: Dict[str, Any], total_jobs: int) -> Dict[str, Any]:
+    """The metadata block of a /scrape-jobs response"""
+    return {
+        "search_term": params["search_term"],
+        "location": params["location"],
+        "sites_searched": params["site_name"],
+        "timestamp": datetime.now().isoformat(),
+        "results_wanted": params["results_wanted"],
+        "actual_results": total_jobs,
+        "deadline_seconds": params["deadline_seconds"],
+        "only_new": params["only_new"],
+        # per-site job counts, cache hits and whether the deadline cut a site short
+        "sites": sites,
+        "truncated": any(stats["truncated"] for stats in sites.values())
+    }
+
+def run_search(data: Dict[str, Any], progress: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run a /scrape-jobs search and build its response
+    :param progress: dict scrape_jobs fills in with per-site progress as it runs
+    """
+    params = search_params(data)
+    profile = data.get('profile', False)
+    
+    logger.info(f"Scraping jobs for: {params['search_term']} in {params['location']}")
+    
+    # Optional per-site, per-phase timing breakdown, plus a cProfile dump
+    # when JOBSPY_PROFILE_DIR is set
+    profile_path = None
+    if profile and os.environ.get('JOBSPY_PROFILE_DIR'):
+        profile_path = os.path.join(
+            os.environ['JOBSPY_PROFILE_DIR'],
+            f"scrape-{datetime.now():%Y%m%d-%H%M%S-%f}.prof"
+        )
+    with profiling(profile_path) if profile else nullcontext() as search_profile:
+        # Call JobSpy
+        jobs_df = scrape_jobs(**params, metadata=progress)
+    
+        # Convert DataFrame to JSON-serializable format
+        with phase('records'):
+            jobs_list = dataframe_to_records(jobs_df)
+    
+    response = {
+        "success": True,
+        "total_jobs": len(jobs_list),
+        "jobs": jobs_list,
+        "metadata": search_summary(params, jobs_df.attrs.get("sites", {}), len(jobs_list))
+    }
+    # whether this request shared an identical search that was already running,
+    # and how many requests shared the search that produced the result
+    response["metadata"]["coalesced"] = jobs_df.attrs.get("coalesced", False)
+    response["metadata"]["shared_with"] = jobs_df.attrs.get("shared_with", 0)
+    if search_profile is not None:
+        # seconds per phase per site, request counts and bytes downloaded
+        response["metadata"]["profile"] = search_profile.to_dict()
+    
+    logger.info(f"Successfully scraped {len(jobs_list)} jobs")
+    return response
+
 @app.route('/scrape-jobs', methods=['POST'])
 def scrape_jobs_endpoint():
     """
@@ -51,8 +236,17 @@ def scrape_jobs_endpoint():
         "linkedin_fetch_description": false,
         "description_format": "markdown",
         "proxies": null,
-        "offset": 0
+        "offset": 0,
+        "deadline_seconds": 25,
+        "use_cache": false,
+        "store": false,
+        "only_new": false,
+        "listing_only": false,
+        "coalesce": false,
+        "profile": false
     }
+    Add ?async=true to queue the search and get a job_id back straight away,
+    then poll GET /scrape-jobs/<job_id> for its progress and result.
     """
     try:
         # Get JSON data from request
@@ -60,89 +254,157 @@ def scrape_jobs_endpoint():
         if not data:
             return jsonify({"error": "No JSON data provided"}), 400
         
-        # Extract parameters with defaults
-        site_name = data.get('site_name', ['indeed', 'linkedin'])
-        search_term = data.get('search_term')
-        location = data.get('location')
-        results_wanted = data.get('results_wanted', 15)
-        country_indeed = data.get('country_indeed', 'USA')
-        hours_old = data.get('hours_old')
-        is_remote = data.get('is_remote', False)
-        job_type = data.get('job_type')
-        easy_apply = data.get('easy_apply')
-        linkedin_fetch_description = data.get('linkedin_fetch_description', False)
-        description_format = data.get('description_format', 'markdown')
-        proxies = data.get('proxies')
-        offset = data.get('offset', 0)
-        google_search_term = data.get('google_search_term')
-        distance = data.get('distance', 50)
-        linkedin_company_ids = data.get('linkedin_company_ids')
-        enforce_annual_salary = data.get('enforce_annual_salary', False)
-        verbose = data.get('verbose', 0)
-        user_agent = data.get('user_agent')
-        
         # Validate required parameters
-        if not search_term:
+        if not data.get('search_term'):
             return jsonify({"error": "search_term is required"}), 400
         
-        logger.info(f"Scraping jobs for: {search_term} in {location}")
+        if request.args.get('async', '').lower() in ('true', '1'):
+            try:
+                job_id = get_search_queue().submit(data)
+            except QueueFull as e:
+                return jsonify({"success": False, "error": str(e)}), 503
+            logger.info(f"Queued search {job_id} for: {data['search_term']}")
+            return jsonify({
+                "success": True,
+                "job_id": job_id,
+                "status": "queued",
+                "status_url": f"/scrape-jobs/{job_id}"
+            }), 202
         
-        # Call JobSpy
-        jobs_df = scrape_jobs(
-            site_name=site_name,
-            search_term=search_term,
-            google_search_term=google_search_term,
-            location=location,
-            distance=distance,
-            is_remote=is_remote,
-            job_type=job_type,
-            easy_apply=easy_apply,
-            results_wanted=results_wanted,
-            country_indeed=country_indeed,
-            proxies=proxies,
-            description_format=description_format,
-            linkedin_fetch_description=linkedin_fetch_description,
-            linkedin_company_ids=linkedin_company_ids,
-            offset=offset,
-            hours_old=hours_old,
-            enforce_annual_salary=enforce_annual_salary,
-            verbose=verbose,
-            user_agent=user_agent
-        )
+        return json_response(run_search(data))
         
-        # Convert DataFrame to JSON-serializable format
-        jobs_list = jobs_df.to_dict('records')
+    except Exception as e:
+        logger.error(f"Error scraping jobs: {str(e)}")
+        logger.error(traceback.format_exc())
+        return jsonify({
+            "success": False,
+            "error": str(e),
+            "traceback": traceback.format_exc()
+        }), 500
+
+def job_to_record(row: Dict[str, Any]) -> Dict[str, Any]:
+    """An iter_jobs row with the same fields and values as a /scrape-jobs job"""
+    record = {}
+    for column in desired_order:
+        value = row.get(column)
+        if isinstance(value, float) and math.isnan(value):
+            value = None
+        record[column] = value
+    return record
+
+@app.route('/scrape-jobs/stream', methods=['POST'])
+def scrape_jobs_stream():
+    """
+    Same payload as /scrape-jobs, but each job is written as soon as its scraper
+    finds it, one JSON object per line (NDJSON), and the stream ends with a
+    {"summary": {...}} line holding the usual metadata. With ?format=sse or
+    "Accept: text/event-stream" it is sent as Server-Sent Events instead: "job"
+    events, then a "summary" event. A search that fails part way through ends
+    with an {"error": "..."} line / "error" event. Streams can't be coalesced,
+    "coalesce": true is refused with a 400.
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({"error": "No JSON data provided"}), 400
+    if not data.get('search_term'):
+        return jsonify({"error": "search_term is required"}), 400
+    if data.get('coalesce'):
+        return jsonify({"error": "coalesce is not supported when streaming"}), 400
+    
+    params = search_params(data)
+    del params['coalesce']
+    sse = (
+        request.args.get('format') == 'sse'
+        or request.accept_mimetypes.best == 'text/event-stream'
+    )
+    
+    def encode(kind: str, payload: Any) -> str:
+        if sse:
+            return f"event: {kind}\ndata: {serialize.dumps(payload).decode()}\n\n"
+        return serialize.dumps(payload if kind == 'job' else {kind: payload}).decode() + "\n"
+    
+    def generate():
+        metadata = {}
+        total_jobs = 0
+        try:
+            for row in iter_jobs(**params, metadata=metadata):
+                total_jobs += 1
+                yield encode('job', job_to_record(row))
+        except Exception as e:
+            logger.error(f"Error streaming jobs: {str(e)}")
+            logger.error(traceback.format_exc())
+            yield encode('error', str(e))
+            return
+        logger.info(f"Successfully streamed {total_jobs} jobs")
+        yield encode('summary', search_summary(params, metadata.get('sites', {}), total_jobs))
+    
+    logger.info(f"Streaming jobs for: {params['search_term']} in {params['location']}")
+    return Response(
+        stream_with_context(generate()),
+        content_type='text/event-stream' if sse else 'application/x-ndjson',
+        # keep proxies (nginx, ngrok) from buffering the stream
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/scrape-jobs/<job_id>', methods=['GET'])
+def scrape_job_status(job_id):
+    """
+    Status of a search queued with POST /scrape-jobs?async=true: "queued" (with
+    its position), "running" with per-site progress, then "done" with the same
+    response a synchronous /scrape-jobs returns under "result", or "failed"
+    """
+    task = get_search_queue().get(job_id)
+    if task is None:
+        return jsonify({"error": "Unknown or expired job_id"}), 404
+    return json_response(task)
+
+@app.route('/queue/stats', methods=['GET'])
+def queue_stats():
+    """Searches queued, running and finished in the background queue"""
+    return jsonify(get_search_queue().stats())
+
+@app.route('/job-details', methods=['POST'])
+def job_details_endpoint():
+    """
+    Fetch descriptions for jobs picked from a listing_only search
+    Expected JSON payload:
+    {
+        "job_ids": ["li-4012345678", "gd-1009876543", "zr-abc123"],
+        "description_format": "markdown",
+        "country_indeed": "USA",
+        "proxies": null
+    }
+    BDJobs jobs are passed by job_url instead of id.
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No JSON data provided"}), 400
+        
+        job_ids = data.get('job_ids')
+        if not job_ids or not isinstance(job_ids, list):
+            return jsonify({"error": "job_ids must be a non-empty list"}), 400
         
-        # Clean up the data for JSON serialization
-        for job in jobs_list:
-            # Convert any non-serializable objects
-            for key, value in job.items():
-                if pd.isna(value):
-                    job[key] = None
-                elif isinstance(value, (pd.Timestamp, datetime)):
-                    job[key] = value.isoformat()
-                elif hasattr(value, 'isoformat'):  # Handle other datetime-like objects
-                    job[key] = value.isoformat()
+        logger.info(f"Fetching details for {len(job_ids)} jobs")
         
-        response = {
+        details_df = fetch_details(
+            job_ids,
+            description_format=data.get('description_format', 'markdown'),
+            country_indeed=data.get('country_indeed', 'USA'),
+            proxies=data.get('proxies'),
+            user_agent=data.get('user_agent')
+        )
+        jobs_list = dataframe_to_records(details_df)
+        
+        return json_response({
             "success": True,
             "total_jobs": len(jobs_list),
             "jobs": jobs_list,
-            "metadata": {
-                "search_term": search_term,
-                "location": location,
-                "sites_searched": site_name,
-                "timestamp": datetime.now().isoformat(),
-                "results_wanted": results_wanted,
-                "actual_results": len(jobs_list)
-            }
-        }
-        
-        logger.info(f"Successfully scraped {len(jobs_list)} jobs")
-        return jsonify(response)
+            "failed": sum(1 for job in jobs_list if job.get("error"))
+        })
         
     except Exception as e:
-        logger.error(f"Error scraping jobs: {str(e)}")
+        logger.error(f"Error fetching job details: {str(e)}")
         logger.error(traceback.format_exc())
         return jsonify({
             "success": False,
@@ -150,6 +412,49 @@ def scrape_jobs_endpoint():
             "traceback": traceback.format_exc()
         }), 500
 
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """Result cache hit/miss counts, overall and per site"""
+    return jsonify(get_cache().stats())
+
+@app.route('/cache/details/stats', methods=['GET'])
+def detail_cache_stats():
+    """Detail cache hit/miss counts, overall and per site"""
+    detail_cache = get_detail_cache()
+    if detail_cache is None:
+        return jsonify({"error": "Detail cache is not enabled"}), 404
+    return jsonify(detail_cache.stats())
+
+@app.route('/rate-limits', methods=['GET'])
+def rate_limits():
+    """Current request rate, throttled responses and wait time per job board host"""
+    return jsonify(get_rate_limiter().stats())
+
+@app.route('/proxies', methods=['GET'])
+def proxies():
+    """Success, throttling, latency and quarantine of every proxy used, per job board"""
+    return jsonify(proxy_stats())
+
+@app.route('/circuits', methods=['GET'])
+def circuits():
+    """Circuit breaker state, recent failures and skipped searches per job board"""
+    return jsonify(get_circuit_breaker().stats())
+
+@app.route('/coalescing', methods=['GET'])
+def coalescing():
+    """Searches run, and identical concurrent searches that shared their result"""
+    return jsonify(get_single_flight().stats())
+
+@app.route('/scheduler', methods=['GET'])
+def scheduler_stats():
+    """Page lookahead setting, and scrapes fetching results pages ahead"""
+    return jsonify(get_scheduler().stats())
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Request, scrape and conversion metrics in the Prometheus text format"""
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
 @app.route('/sites', methods=['GET'])
 def get_available_sites():
     """Get list of available job sites"""
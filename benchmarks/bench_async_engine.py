@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: threaded scrape_jobs vs scrape_jobs_async against the mock job board
+
+Runs --searches concurrent multi-site searches (Indeed, LinkedIn, Naukri,
+Google) both ways, the threaded path as one thread per search the way the
+Flask API runs it, and reports wall time, jobs/sec and peak thread count.
+
+    python benchmarks/bench_async_engine.py --searches 10 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mock_job_board import MockJobBoard
+
+from jobspy import scrape_jobs, scrape_jobs_async
+from jobspy.aio import get_connection_pool
+
+SITES = ["indeed", "linkedin", "naukri", "google"]
+
+
+class PeakThreads:
+    def __init__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(0.01):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def search_kwargs(args) -> dict:
+    return dict(
+        site_name=SITES,
+        search_term="software engineer",
+        location="Austin, TX",
+        results_wanted=args.results,
+        linkedin_fetch_description=args.details,
+        verbose=0,
+    )
+
+
+def run_threaded(args) -> tuple[float, int, int]:
+    with PeakThreads() as threads:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.searches) as executor:
+            frames = list(
+                executor.map(
+                    lambda _: scrape_jobs(**search_kwargs(args)), range(args.searches)
+                )
+            )
+        elapsed = time.perf_counter() - start
+    return elapsed, sum(len(df) for df in frames), threads.peak
+
+
+def run_async(args) -> tuple[float, int, int]:
+    async def main():
+        frames = await asyncio.gather(
+            *(scrape_jobs_async(**search_kwargs(args)) for _ in range(args.searches))
+        )
+        await get_connection_pool().close()
+        return frames
+
+    with PeakThreads() as threads:
+        start = time.perf_counter()
+        frames = asyncio.run(main())
+        elapsed = time.perf_counter() - start
+    return elapsed, sum(len(df) for df in frames), threads.peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--searches", type=int, default=10)
+    parser.add_argument("--results", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--details", action="store_true")
+    args = parser.parse_args()
+
+    board = MockJobBoard(latency=args.latency).start()
+    board.point_scrapers_here()
+    try:
+        for name, runner in (("threaded", run_threaded), ("asyncio", run_async)):
+            elapsed, jobs, peak = runner(args)
+            print(
+                f"{name:9} {elapsed:7.2f} s  {jobs / elapsed:8.1f} jobs/s  "
+                f"{jobs:6d} jobs  peak threads {peak}"
+            )
+    finally:
+        board.stop()
+
+
+if __name__ == "__main__":
+    main()
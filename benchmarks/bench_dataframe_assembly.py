@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: DataFrame assembly in scrape_jobs
+
+Compares the previous per-job DataFrame + concat path against the columnar
+builder on synthetic JobPosts, and checks both build the same DataFrame.
+
+    python benchmarks/bench_dataframe_assembly.py --jobs 10000
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from jobspy import _build_jobs_df, _normalize_job
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+)
+from jobspy.util import desired_order
+
+SITES = ["linkedin", "indeed", "glassdoor", "zip_recruiter", "google", "naukri"]
+
+
+def make_jobs(count: int, seed: int = 7) -> list[tuple[str, JobPost]]:
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        site = SITES[i % len(SITES)]
+        has_comp = rng.random() < 0.5
+        jobs.append(
+            (
+                site,
+                JobPost(
+                    id=f"{site[:2]}-{i}",
+                    title=f"Software Engineer {i}",
+                    company_name=f"Company {i % 300}",
+                    job_url=f"https://example.com/{site}/{i}",
+                    location=Location(city="Austin", state="TX", country=Country.USA),
+                    description=(
+                        "Build things. $120,000 - $150,000 a year. " * 20
+                        if not has_comp
+                        else "Build things. " * 40
+                    ),
+                    job_type=[JobType.FULL_TIME] if i % 3 else None,
+                    compensation=(
+                        Compensation(
+                            interval=CompensationInterval.YEARLY,
+                            min_amount=100000 + i,
+                            max_amount=150000 + i,
+                        )
+                        if has_comp
+                        else None
+                    ),
+                    date_posted=date(2025, 1, 1) + timedelta(days=i % 60),
+                    emails=["jobs@example.com"] if i % 7 == 0 else None,
+                    is_remote=bool(i % 2),
+                    skills=["python", "sql"] if site == "naukri" else None,
+                ),
+            )
+        )
+    return jobs
+
+
+def legacy_build(job_rows: list[dict]) -> pd.DataFrame:
+    """The per-job DataFrame path scrape_jobs used before the columnar builder"""
+    jobs_dfs = [pd.DataFrame([job_data]) for job_data in job_rows]
+    filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+    jobs_df = pd.concat(filtered_dfs, ignore_index=True)
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    jobs_df = jobs_df[desired_order]
+    return jobs_df.sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    ).reset_index(drop=True)
+
+
+def timed(fn, *args, repeat: int = 1) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.jobs)
+    normalize_s = timed(
+        lambda: [_normalize_job(job, site, Country.USA) for site, job in jobs]
+    )
+    rows = [_normalize_job(job, site, Country.USA) for site, job in jobs]
+
+    # the per-job path is slow enough that it runs once, for timing and checking
+    start = time.perf_counter()
+    legacy_df = legacy_build(rows)
+    legacy_s = time.perf_counter() - start
+    columnar_s = timed(_build_jobs_df, rows, repeat=args.repeat)
+    pd.testing.assert_frame_equal(_build_jobs_df(rows), legacy_df)
+
+    print(f"jobs:                 {args.jobs}")
+    print(f"normalize rows:       {normalize_s:8.3f} s")
+    print(f"per-job frame+concat: {legacy_s:8.3f} s")
+    print(f"columnar builder:     {columnar_s:8.3f} s")
+    print(f"speedup:              {legacy_s / columnar_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: description conversion throughput
+
+Converts real-sized job description HTML (~5 KB, the size of a typical Indeed
+description) to markdown three ways: inline on one thread, inline on a thread
+pool the way the scrapers' worker threads did it, and batched on the
+jobspy.converter process pool.
+
+    python benchmarks/bench_description_conversion.py --descriptions 1000 --workers 4
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from jobspy.converter import configure_converter, convert_descriptions
+from jobspy.model import DescriptionFormat
+from jobspy.util import markdown_converter
+
+SECTION = (
+    "<h3>{heading}</h3><p>{company} is looking for a <b>{title}</b> to help us "
+    "scale the systems behind our marketplace. You will partner with product, "
+    "design and data science to ship features used by millions of people.</p>"
+    "<ul>"
+    + "".join(
+        f"<li>Point {i}: design, build and operate services in <i>Python</i> "
+        f"and <a href='https://example.com/stack'>Go</a> with care</li>"
+        for i in range(8)
+    )
+    + "</ul>"
+)
+HEADINGS = [
+    "About the role",
+    "What you'll do",
+    "What you'll bring",
+    "Nice to have",
+    "Benefits",
+]
+
+
+def make_descriptions(count: int) -> list[str]:
+    return [
+        "<div>"
+        + "".join(
+            SECTION.format(
+                heading=heading, company=f"Company {n % 50}", title=f"Engineer {n}"
+            )
+            for heading in HEADINGS
+        )
+        + f"<p>Compensation: $120,000 - $160,000 a year. Contact jobs{n}@example.com</p></div>"
+        for n in range(count)
+    ]
+
+
+def timed(label: str, fn, count: int) -> list:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.2f}s {count / elapsed:10.0f} descriptions/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--descriptions", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--threads", type=int, default=20)
+    args = parser.parse_args()
+
+    descriptions = make_descriptions(args.descriptions)
+    size = sum(map(len, descriptions)) // len(descriptions)
+    print(
+        f"{args.descriptions} descriptions, {size} bytes avg, "
+        f"{args.workers} workers, {os.cpu_count()} cpus\n"
+    )
+
+    expected = timed(
+        "inline, 1 thread",
+        lambda: [markdown_converter(html) for html in descriptions],
+        args.descriptions,
+    )
+    with ThreadPoolExecutor(args.threads) as executor:
+        threaded = timed(
+            f"inline, {args.threads} threads",
+            lambda: list(executor.map(markdown_converter, descriptions)),
+            args.descriptions,
+        )
+
+    configure_converter(workers=args.workers)
+    # start the workers before timing
+    convert_descriptions(descriptions[: args.workers * 16], DescriptionFormat.MARKDOWN)
+    pooled = timed(
+        f"process pool, {args.workers} workers",
+        lambda: convert_descriptions(descriptions, DescriptionFormat.MARKDOWN),
+        args.descriptions,
+    )
+    configure_converter(workers=0)
+
+    assert threaded == expected and pooled == expected, "outputs differ"
+    print("\noutputs identical")
+
+
+if __name__ == "__main__":
+    main()
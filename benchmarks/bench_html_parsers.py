@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: HTML parse time per site and parser backend
+
+Parses the saved pages in benchmarks/fixtures with every installed
+BeautifulSoup backend (jobspy.util.set_html_parser), timing the parse alone
+and the parse plus each scraper's own field extraction, and checks the
+extracted fields match the original full-tree html.parser output exactly.
+
+    python benchmarks/bench_html_parsers.py --repeat 50
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from bs4.exceptions import FeatureNotFound
+
+from jobspy.bayt import BaytScraper
+from jobspy.bdjobs import BDJobs
+from jobspy.bdjobs.util import find_job_listings
+from jobspy.linkedin import LinkedIn
+from jobspy.model import DescriptionFormat, ScraperInput, Site
+from jobspy.util import parse_html, set_html_parser
+from jobspy.ziprecruiter import ZipRecruiter
+
+FIXTURES = Path(__file__).parent / "fixtures"
+BACKENDS = ["html.parser", "lxml", "html5lib"]
+
+
+def _scraper(scraper_class, site: Site, offline: bool = False):
+    # ZipRecruiter's __init__ posts a session event, the parsers don't need it
+    scraper = scraper_class.__new__(scraper_class) if offline else scraper_class()
+    scraper.scraper_input = ScraperInput(
+        site_type=[site], description_format=DescriptionFormat.HTML, listing_only=True
+    )
+    return scraper
+
+
+linkedin = _scraper(LinkedIn, Site.LINKEDIN)
+ziprecruiter = _scraper(ZipRecruiter, Site.ZIP_RECRUITER, offline=True)
+bayt = _scraper(BaytScraper, Site.BAYT)
+bdjobs = _scraper(BDJobs, Site.BDJOBS)
+
+
+def linkedin_search(html: str, parse_only=LinkedIn.job_card_strainer) -> list:
+    soup = parse_html(html, parse_only=parse_only)
+    jobs = []
+    for job_card in soup.find_all("div", class_="base-search-card"):
+        href = job_card.find("a", class_="base-card__full-link")["href"].split("?")[0]
+        job_post = linkedin._process_job(job_card, href.split("-")[-1], False)
+        jobs.append(job_post.model_dump())
+    return jobs
+
+
+def linkedin_job(html: str, parse_only=None) -> dict:
+    return linkedin._parse_job_details(html)
+
+
+def ziprecruiter_job(html: str, parse_only=None) -> tuple:
+    return ziprecruiter._parse_descr(html)
+
+
+def bayt_search(html: str, parse_only=BaytScraper.job_listing_strainer) -> list:
+    soup = parse_html(html, parse_only=parse_only)
+    return [
+        bayt._extract_job_info(job).model_dump()
+        for job in soup.find_all("li", attrs={"data-js-job": ""})
+    ]
+
+
+def bdjobs_search(html: str, parse_only=None) -> list:
+    soup = parse_html(html, parse_only=parse_only)
+    return [bdjobs._process_job(card).model_dump() for card in find_job_listings(soup)]
+
+
+def bdjobs_job(html: str, parse_only=None) -> dict:
+    return bdjobs._parse_job_details(html)
+
+
+# fixture -> (extraction, strainer the scraper parses the page with)
+CASES = {
+    "linkedin_search.html": (linkedin_search, LinkedIn.job_card_strainer),
+    "linkedin_job.html": (linkedin_job, None),
+    "ziprecruiter_job.html": (ziprecruiter_job, None),
+    "bayt_search.html": (bayt_search, BaytScraper.job_listing_strainer),
+    "bdjobs_search.html": (bdjobs_search, None),
+    "bdjobs_job.html": (bdjobs_job, None),
+}
+
+
+def installed_backends() -> list[str]:
+    backends = []
+    for backend in BACKENDS:
+        try:
+            BeautifulSoup("", backend)
+            backends.append(backend)
+        except FeatureNotFound:
+            pass
+    return backends
+
+
+def per_page_ms(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    backends = installed_backends()
+    print("ms per page, parse only / parse + extraction\n")
+    print(f"{'fixture':<24}" + "".join(f"{b:>20}" for b in backends))
+    for fixture, (extract, parse_only) in CASES.items():
+        html = (FIXTURES / fixture).read_text()
+        # what the scrapers returned before the parser was pluggable
+        set_html_parser("html.parser")
+        expected = extract(html, parse_only=None)
+
+        row = f"{fixture:<24}"
+        for backend in backends:
+            set_html_parser(backend)
+            assert extract(html) == expected, f"{fixture}: {backend} output differs"
+            parse = per_page_ms(lambda: parse_html(html, parse_only), args.repeat)
+            total = per_page_ms(lambda: extract(html), args.repeat)
+            row += f"{parse:>11.2f} / {total:6.2f}"
+        print(row)
+    set_html_parser()
+    print("\noutputs identical")
+
+
+if __name__ == "__main__":
+    main()
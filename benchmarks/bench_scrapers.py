@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: every scraper end to end on recorded responses
+
+Replays the cassettes in benchmarks/cassettes through scrape_jobs for each
+site with jobspy.cassette, so nothing touches the network, and reports
+jobs/sec, parse time (wall time minus time spent in the transport) and peak
+traced memory per site. Timings are the best of --repeat runs; memory comes
+from one extra run under tracemalloc, which would skew the timings. A replay
+that comes back without descriptions fails, since a cassette that no longer
+matches the requests a scraper sends would otherwise only show as a speedup.
+
+    python benchmarks/bench_scrapers.py --repeat 5
+    python benchmarks/bench_scrapers.py --record          # from the mock job board
+    python benchmarks/bench_scrapers.py --record --live   # from the real sites
+"""
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+from mock_job_board import MockJobBoard
+
+from jobspy import scrape_jobs, use_cassette
+
+CASSETTES = Path(__file__).parent / "cassettes"
+SEARCH = {"search_term": "software engineer", "results_wanted": 50}
+SITES = {
+    "linkedin": {"linkedin_fetch_description": True},
+    "indeed": {},
+    "glassdoor": {"location": "Austin"},
+    "zip_recruiter": {},
+    "google": {"google_search_term": "software engineer jobs near Austin"},
+    "naukri": {},
+    "bdjobs": {},
+    "bayt": {},
+}
+# their search results carry no description
+NO_DESCRIPTIONS = {"naukri", "bayt"}
+
+
+def cassette_path(site: str) -> str:
+    return str(CASSETTES / f"{site}.json.gz")
+
+
+def scrape(site: str):
+    return scrape_jobs(site_name=[site], **SEARCH, **SITES[site])
+
+
+def record(sites: list[str], live: bool):
+    CASSETTES.mkdir(exist_ok=True)
+    board = None
+    if not live:
+        board = MockJobBoard().start()
+        board.point_scrapers_here()
+    for site in sites:
+        # hosts aren't matched, so mock board recordings replay for the real urls
+        with use_cassette(cassette_path(site), "record", match_host=False) as cassette:
+            jobs = len(scrape(site))
+        print(f"{site:<14} {jobs:>4} jobs {cassette.requests:>5} requests")
+    if board is not None:
+        board.stop()
+
+
+def replay(site: str) -> tuple[int, int, float, float]:
+    with use_cassette(cassette_path(site), "replay", match_host=False) as cassette:
+        start = time.perf_counter()
+        jobs_df = scrape(site)
+        wall = time.perf_counter() - start
+    if site not in NO_DESCRIPTIONS and len(jobs_df):
+        described = jobs_df["description"].notna().sum()
+        assert described, f"{site}: no descriptions in the replay, re-record it"
+    return len(jobs_df), cassette.requests, wall, wall - cassette.transport_seconds
+
+
+def peak_memory(site: str) -> int:
+    tracemalloc.start()
+    try:
+        replay(site)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sites", nargs="+", choices=list(SITES), default=list(SITES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--live", action="store_true")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.sites, args.live)
+        return
+
+    print(
+        f"{'site':<14} {'jobs':>5} {'requests':>9} {'wall s':>8} {'jobs/s':>8} "
+        f"{'parse s':>8} {'peak MB':>8}"
+    )
+    for site in args.sites:
+        runs = [replay(site) for _ in range(args.repeat)]
+        jobs, requests, wall, parse = min(runs, key=lambda run: run[2])
+        peak = peak_memory(site) / 2**20
+        print(
+            f"{site:<14} {jobs:>5} {requests:>9} {wall:>8.3f} {jobs / wall:>8.0f} "
+            f"{parse:>8.3f} {peak:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
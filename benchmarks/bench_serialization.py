@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: /scrape-jobs response serialization
+
+Compares the previous per-cell record conversion + json encoding against
+jobspy.serialize (columnar records, orjson when installed) on synthetic jobs,
+and reports the gzip level the API compresses responses with.
+
+    python benchmarks/bench_serialization.py --jobs 5000
+"""
+
+import argparse
+import gzip
+import json
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from bench_dataframe_assembly import make_jobs, timed
+from jobspy import _build_jobs_df, _normalize_job, serialize
+from jobspy.model import Country
+
+
+def legacy_records(jobs_df: pd.DataFrame) -> list[dict]:
+    """The per-cell conversion the API used before jobspy.serialize"""
+    jobs_list = jobs_df.to_dict("records")
+    for job in jobs_list:
+        for key, value in job.items():
+            if pd.isna(value):
+                job[key] = None
+            elif isinstance(value, (pd.Timestamp, datetime)):
+                job[key] = value.isoformat()
+            elif hasattr(value, "isoformat"):
+                job[key] = value.isoformat()
+    return jobs_list
+
+
+def legacy_encode(jobs_df: pd.DataFrame) -> bytes:
+    return json.dumps({"jobs": legacy_records(jobs_df)}).encode()
+
+
+def fast_encode(jobs_df: pd.DataFrame) -> bytes:
+    return serialize.dumps({"jobs": serialize.jobs_to_records(jobs_df)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = [
+        _normalize_job(job, site, Country.USA) for site, job in make_jobs(args.jobs)
+    ]
+    jobs_df = _build_jobs_df(rows)
+
+    legacy = legacy_encode(jobs_df)
+    fast = fast_encode(jobs_df)
+    assert json.loads(legacy) == json.loads(fast), "outputs differ"
+
+    legacy_s = timed(legacy_encode, jobs_df, repeat=args.repeat)
+    fast_s = timed(fast_encode, jobs_df, repeat=args.repeat)
+    start = time.perf_counter()
+    compressed = gzip.compress(fast, compresslevel=5)
+    gzip_s = time.perf_counter() - start
+
+    print(f"jobs:                 {args.jobs}")
+    print(f"encoder:              {'orjson' if serialize.orjson else 'json'}")
+    print(f"per-cell + json:      {legacy_s:8.3f} s")
+    print(f"jobspy.serialize:     {fast_s:8.3f} s")
+    print(f"speedup:              {legacy_s / fast_s:8.1f}x")
+    print(f"body:                 {len(fast) / 1024:8.0f} KiB")
+    print(f"gzip level 5:         {len(compressed) / 1024:8.0f} KiB in {gzip_s:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
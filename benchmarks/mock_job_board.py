@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Local mock job board for offline benchmarks
+
+Serves synthetic Indeed, LinkedIn, Glassdoor, ZipRecruiter, Google Jobs,
+Naukri, BDJobs and Bayt responses in the shapes the scrapers parse, with an optional per-response latency to stand in
+for the network. Run it standalone or start it in-process:
+
+    board = MockJobBoard(latency=0.2).start()
+    board.point_scrapers_here()
+    ...
+    board.stop()
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DESCRIPTION_HTML = (
+    "<div><p><b>About the role</b></p><p>We are hiring a {title} to join the "
+    "platform team in {city}. You will design, build and operate services that "
+    "process millions of events per day.</p><ul>"
+    + "".join(
+        f"<li>Responsibility {i}: own a slice of the stack end to end</li>"
+        for i in range(12)
+    )
+    + "</ul><p>Compensation: $120,000 - $160,000 a year. Remote friendly. "
+    "Contact jobs{n}@example.com.</p></div>"
+)
+CITIES = [("Austin", "TX"), ("Seattle", "WA"), ("New York", "NY"), ("Denver", "CO")]
+
+
+def _city(n: int) -> tuple[str, str]:
+    return CITIES[n % len(CITIES)]
+
+
+def indeed_page(cursor: str | None, page_size: int = 100, pages: int = 3) -> dict:
+    page = int(cursor[1:]) if cursor else 1
+    results = []
+    for i in range(page_size):
+        n = page * 1000 + i
+        city, state = _city(n)
+        title = f"Software Engineer {n}"
+        results.append(
+            {
+                "trackingKey": str(n),
+                "job": {
+                    "key": f"{n:016x}",
+                    "title": title,
+                    "datePublished": 1735689600000,
+                    "description": {
+                        "html": DESCRIPTION_HTML.format(title=title, city=city, n=n)
+                    },
+                    "location": {
+                        "countryCode": "US",
+                        "admin1Code": state,
+                        "city": city,
+                        "formatted": {"long": f"{city}, {state}"},
+                    },
+                    "compensation": {
+                        "baseSalary": {
+                            "unitOfWork": "YEAR",
+                            "range": {"min": 120000, "max": 160000},
+                        },
+                        "estimated": None,
+                        "currencyCode": "USD",
+                    },
+                    "attributes": [{"label": "Full-time"}],
+                    "employer": {
+                        "name": f"Company {n % 50}",
+                        "relativeCompanyPageUrl": f"/cmp/company-{n % 50}",
+                        "dossier": {
+                            "employerDetails": {
+                                "addresses": ["1 Main St"],
+                                "industry": "TECH_Iv1",
+                                "employeesLocalizedLabel": "1,001 to 5,000",
+                                "revenueLocalizedLabel": "$1B+",
+                                "briefDescription": "We build software.",
+                            },
+                            "images": {"squareLogoUrl": "https://example.com/l.png"},
+                            "links": {"corporateWebsite": "https://example.com"},
+                        },
+                    },
+                    "recruit": {"viewJobUrl": f"https://example.com/apply/{n}"},
+                },
+            }
+        )
+    next_cursor = f"c{page + 1}" if page < pages else None
+    return {
+        "data": {
+            "jobSearch": {"pageInfo": {"nextCursor": next_cursor}, "results": results}
+        }
+    }
+
+
+def linkedin_cards(start: int, page_size: int = 10, total: int = 200) -> str:
+    cards = []
+    for n in range(start, min(start + page_size, total)):
+        city, state = _city(n)
+        job_id = 4000000000 + n
+        cards.append(f"""<li><div class="base-card base-search-card job-search-card">
+  <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/software-engineer-at-company-{job_id}?refId=abc&trackingId=xyz"><span class="sr-only">Software Engineer {n}</span></a>
+  <div class="base-search-card__info">
+    <h3 class="base-search-card__title">Software Engineer {n}</h3>
+    <h4 class="base-search-card__subtitle"><a class="hidden-nested-link" href="https://www.linkedin.com/company/company-{n % 50}?trk=public_jobs">Company {n % 50}</a></h4>
+    <div class="base-search-card__metadata">
+      <span class="job-search-card__location">{city}, {state}</span>
+      <span class="job-search-card__salary-info">$120,000.00 - $160,000.00</span>
+      <time class="job-search-card__listdate" datetime="2025-01-02">1 week ago</time>
+    </div>
+  </div>
+</div></li>""")
+    return "\n".join(cards)
+
+
+def linkedin_job_page(job_id: str) -> str:
+    n = int(job_id) - 4000000000
+    city, _ = _city(n)
+    title = f"Software Engineer {n}"
+    return f"""<html><body>
+<img class="artdeco-entity-image" data-delayed-url="https://example.com/logo.png">
+<div class="description__text description__text--rich"><section class="show-more-less-html"><div class="show-more-less-html__markup relative">{DESCRIPTION_HTML.format(title=title, city=city, n=n)}</div></section></div>
+<ul class="description__job-criteria-list">
+<li><h3 class="description__job-criteria-subheader">Seniority level</h3><span class="description__job-criteria-text description__job-criteria-text--criteria">Mid-Senior level</span></li>
+<li><h3 class="description__job-criteria-subheader">Employment type</h3><span class="description__job-criteria-text description__job-criteria-text--criteria">Full-time</span></li>
+<li><h3 class="description__job-criteria-subheader">Job function</h3><span class="description__job-criteria-text description__job-criteria-text--criteria">Engineering</span></li>
+<li><h3 class="description__job-criteria-subheader">Industries</h3><span class="description__job-criteria-text description__job-criteria-text--criteria">Software Development</span></li>
+</ul>
+<code id="applyUrl"><!--"https://www.linkedin.com/jobs/view/externalApply/{job_id}?url=https%3A%2F%2Fexample%2Ecom%2Fapply%2F{n}&urlHash=x"--></code>
+</body></html>"""
+
+
+def naukri_page(page: int, page_size: int = 20, pages: int = 5) -> dict:
+    if page > pages:
+        return {"jobDetails": []}
+    jobs = []
+    for i in range(page_size):
+        n = page * 1000 + i
+        city, _ = _city(n)
+        title = f"Python Developer {n}"
+        jobs.append(
+            {
+                "jobId": str(100000 + n),
+                "title": title,
+                "companyName": f"Company {n % 50}",
+                "staticUrl": f"company-{n % 50}-jobs",
+                "placeholders": [
+                    {"type": "experience", "label": "3-6 Yrs"},
+                    {"type": "salary", "label": "12-16 Lacs P.A."},
+                    {"type": "location", "label": "Bengaluru, Karnataka"},
+                ],
+                "footerPlaceholderLabel": "3 Days Ago",
+                "createdDate": 1735689600000,
+                "jdURL": f"/job-listings-python-developer-{n}",
+                "jobDescription": DESCRIPTION_HTML.format(title=title, city=city, n=n),
+                "tagsAndSkills": "python,django,sql",
+                "experienceText": "3-6 Yrs",
+                "ambitionBoxData": {"AggregateRating": "4.1", "ReviewsCount": 120},
+                "vacancy": 2,
+                "logoPathV3": "https://example.com/logo.png",
+            }
+        )
+    return {"jobDetails": jobs}
+
+
+def _google_job_info(n: int) -> list:
+    city, state = _city(n)
+    info = [None] * 30
+    info[0] = f"Data Engineer {n}"
+    info[1] = f"Company {n % 50}"
+    info[2] = f"{city}, {state}, United States"
+    info[3] = [[f"https://example.com/google-job/{n}"]]
+    info[12] = f"{n % 9 + 1} days ago"
+    info[19] = (
+        f"Data Engineer {n} building pipelines in {city}. Full time. " * 20
+    ).strip()
+    info[28] = f"g{n:08d}"
+    info[29] = []
+    return info
+
+
+def google_initial_page(page_size: int = 10) -> str:
+    scripts = "".join(
+        '<script>var d = [[[{"520084652":'
+        + json.dumps(_google_job_info(n))
+        + "}]]]]];</script>"
+        for n in range(page_size)
+    )
+    return (
+        '<html><body><div jsname="Yust4d" class="x" data-async-fc="fc1"></div>'
+        f"{scripts}</body></html>"
+    )
+
+
+def google_next_page(cursor: str, page_size: int = 10, pages: int = 5) -> str:
+    page = int(cursor[2:])
+    arrays = [
+        [str(n), json.dumps([[[{"520084652": _google_job_info(page * 100 + n)}]]])]
+        for n in range(page_size)
+    ]
+    next_fc = f'<div data-async-fc="fc{page + 1}"></div>' if page < pages else ""
+    return f")]}}'\n{next_fc}" + json.dumps([arrays])
+
+
+def glassdoor_page(page: int, page_size: int = 30, pages: int = 5) -> list:
+    listings = []
+    if page <= pages:
+        for i in range(page_size):
+            n = page * 1000 + i
+            city, state = _city(n)
+            listings.append(
+                {
+                    "jobview": {
+                        "job": {
+                            "listingId": 1009000000 + n,
+                            "jobTitleText": f"Product Designer {n}",
+                        },
+                        "header": {
+                            "employerNameFromSearch": f"Company {n % 50}",
+                            "employer": {"id": 1000 + n % 50},
+                            "locationName": f"{city}, {state}",
+                            "locationType": "C",
+                            "ageInDays": n % 9,
+                            "payPeriod": "ANNUAL",
+                            "payPeriodAdjustedPay": {"p10": 110000, "p90": 150000},
+                            "payCurrency": "USD",
+                            "adOrderSponsorshipLevel": "STANDARD",
+                        },
+                        "overview": {"squareLogoUrl": "https://example.com/logo.png"},
+                    }
+                }
+            )
+    cursors = [{"cursor": f"gd{p}", "pageNumber": p} for p in range(1, pages + 2)]
+    return [
+        {
+            "data": {
+                "jobListings": {"jobListings": listings, "paginationCursors": cursors}
+            }
+        }
+    ]
+
+
+def glassdoor_description(listing_id: int) -> list:
+    n = listing_id - 1009000000
+    city, _ = _city(n)
+    description = DESCRIPTION_HTML.format(title=f"Product Designer {n}", city=city, n=n)
+    return [{"data": {"jobview": {"job": {"description": description}}}}]
+
+
+def ziprecruiter_page(page: int, page_size: int = 20, pages: int = 5) -> dict:
+    jobs = []
+    for i in range(page_size):
+        n = page * 1000 + i
+        city, state = _city(n)
+        jobs.append(
+            {
+                "name": f"Backend Engineer {n}",
+                "listing_key": f"zr{n:08d}",
+                "job_description": f"Backend Engineer {n} in {city}. " * 10,
+                "buyer_type": "ppc",
+                "hiring_company": {"name": f"Company {n % 50}"},
+                "job_country": "US",
+                "job_city": city,
+                "job_state": state,
+                "employment_type": "full_time",
+                "posted_time": "2025-01-02T10:00:00Z",
+                "compensation_interval": "annual",
+                "compensation_min": 120000.0,
+                "compensation_max": 160000.0,
+                "compensation_currency": "USD",
+            }
+        )
+    return {"jobs": jobs, "continue": f"zr{page + 1}" if page < pages else None}
+
+
+def ziprecruiter_job_page(listing_key: str) -> str:
+    n = int(listing_key[2:])
+    city, state = _city(n)
+    model = {
+        "model": {"saveJobURL": f"/job/save?job_url=https://example.com/apply/{n}"}
+    }
+    return f"""<html><body><div class="job_content">
+<h1 class="job_title">Backend Engineer {n}</h1>
+<div class="job_description">{DESCRIPTION_HTML.format(title=f"Backend Engineer {n}", city=city, n=n)}</div>
+<section class="company_description"><h2>About Company {n % 50}</h2><p>Company {n % 50} builds hiring software in {city}, {state}.</p></section>
+<script type="application/json">{json.dumps(model)}</script>
+</div></body></html>"""
+
+
+def bdjobs_page(page: int, page_size: int = 30, pages: int = 5) -> str:
+    if page > pages:
+        return '<html><body><div id="jobList"></div></body></html>'
+    cards = []
+    for i in range(page_size):
+        n = page * 1000 + i
+        job_id = 1300000 + n
+        cards.append(f"""<div class="norm-jobs-wrapper">
+  <div class="job-title-text"><a href="jobdetails.asp?id={job_id}&amp;ln=1&amp;jobid={job_id}">Software Engineer {n}</a></div>
+  <div class="comp-name-text">Company {n % 50} Ltd.</div>
+  <div class="locon-text-d">{["Dhaka", "Chattogram", "Sylhet"][n % 3]}, Bangladesh</div>
+  <div class="dead-text-d">Deadline: {n % 28 + 1} Jan 2025</div>
+</div>""")
+    return f'<html><body><div id="jobList">{"".join(cards)}</div></body></html>'
+
+
+def bdjobs_job_page(job_id: str) -> str:
+    items = "".join(
+        f"<li>Responsibility {i}: own a slice of the stack end to end</li>"
+        for i in range(12)
+    )
+    return f"""<html><body><div class="jobcontent">
+<h4 id="job_resp">Responsibilities &amp; Context</h4><ul>{items}</ul>
+<p>Job {job_id}: work closely with product and design.</p><hr>
+</div>
+<div class="job-summary"><span>Industry</span><span>IT Enabled Service</span></div>
+</body></html>"""
+
+
+def bayt_page(page: int, page_size: int = 20, pages: int = 5) -> str:
+    items = []
+    if page <= pages:
+        for i in range(page_size):
+            n = page * 1000 + i
+            items.append(
+                f"""<li class="has-pointer-d" data-js-job="" data-job-id="{5000000 + n}">
+  <h2 class="jb-title m0 t-large"><a href="/en/uae/jobs/software-engineer-{5000000 + n}/">Software Engineer {n}</a></h2>
+  <div class="t-nowrap p10l"><span>Company {n % 50}</span></div>
+  <div class="t-mute t-small">Dubai, United Arab Emirates</div>
+</li>"""
+            )
+    return f'<html><body><ul class="list-unstyled">{"".join(items)}</ul></body></html>'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    board: "MockJobBoard" = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body: str, content_type: str = "text/html"):
+        time.sleep(self.board.latency)
+        payload = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _url(self):
+        # Glassdoor joins its base url and paths with a double slash
+        return urlparse("/" + self.path.lstrip("/"))
+
+    def do_GET(self):
+        url = self._url()
+        query = parse_qs(url.query)
+        board = self.board
+        if url.path == "/jobs-guest/jobs/api/seeMoreJobPostings/search":
+            start = int(query.get("start", ["0"])[0])
+            self._send(linkedin_cards(start, total=board.linkedin_total))
+        elif url.path.startswith("/jobs/view/"):
+            self._send(linkedin_job_page(url.path.rsplit("/", 1)[-1]))
+        elif url.path == "/jobapi/v3/search":
+            page = int(query.get("pageNo", ["1"])[0])
+            body = naukri_page(page, pages=board.pages)
+            self._send(json.dumps(body), "application/json")
+        elif url.path == "/search":
+            self._send(google_initial_page())
+        elif url.path == "/async/callback:550":
+            self._send(google_next_page(query["fc"][0], pages=board.pages))
+        elif url.path == "/Job/computer-science-jobs.htm":
+            self._send('<script>{"token": "mock-csrf-token"}</script>')
+        elif url.path == "/findPopularLocationAjax.htm":
+            body = [{"locationType": "C", "locationId": 1147401, "label": "Austin"}]
+            self._send(json.dumps(body), "application/json")
+        elif url.path == "/jobs-app/jobs":
+            page = int(query.get("continue_from", ["zr1"])[0][2:])
+            body = ziprecruiter_page(page, pages=board.pages)
+            self._send(json.dumps(body), "application/json")
+        elif url.path == "/jobs//j":
+            self._send(ziprecruiter_job_page(query["lvk"][0]))
+        elif url.path == "/jobsearch.asp":
+            self._send(bdjobs_page(int(query.get("pg", ["1"])[0]), pages=board.pages))
+        elif url.path == "/jobdetails.asp":
+            self._send(bdjobs_job_page(query["id"][0]))
+        elif url.path.startswith("/en/international/jobs/"):
+            self._send(bayt_page(int(query.get("page", ["1"])[0]), pages=board.pages))
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        url = self._url()
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length).decode() if length else ""
+        if url.path == "/graphql":
+            match = re.search(r'cursor: \\?"([^"\\]+)', body)
+            page = indeed_page(
+                match.group(1) if match else None, pages=self.board.pages
+            )
+            self._send(json.dumps(page), "application/json")
+        elif url.path == "/graph":
+            operations = json.loads(body)
+            operation = operations[0]
+            if operation["operationName"] == "JobDetailQuery":
+                # batched like the real endpoint: one result per operation
+                page = [
+                    glassdoor_description(op["variables"]["jl"])[0] for op in operations
+                ]
+            else:
+                variables = operation["variables"]
+                page = glassdoor_page(variables["pageNumber"], pages=self.board.pages)
+            self._send(json.dumps(page), "application/json")
+        elif url.path == "/jobs-app/event":
+            self._send("{}", "application/json")
+        else:
+            self.send_error(404)
+
+
+class MockJobBoard:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        pages: int = 5,
+        linkedin_total: int = 500,
+    ):
+        self.latency = latency
+        self.pages = pages
+        self.linkedin_total = linkedin_total
+        handler = type("Handler", (_Handler,), {"board": self})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockJobBoard":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def point_scrapers_here(self):
+        """Redirects every scraper to this board"""
+        from jobspy.bayt import BaytScraper
+        from jobspy.bdjobs import BDJobs
+        from jobspy.google import Google
+        from jobspy.indeed import Indeed
+        from jobspy.linkedin import LinkedIn
+        from jobspy.model import Country
+        from jobspy.naukri import Naukri
+        from jobspy.ratelimit import configure_rate_limiter
+        from jobspy.ziprecruiter import ZipRecruiter
+
+        Indeed.api_url = f"{self.url}/graphql"
+        LinkedIn.base_url = self.url
+        Naukri.base_url = f"{self.url}/jobapi/v3/search"
+        Google.url = f"{self.url}/search"
+        Google.jobs_url = f"{self.url}/async/callback:550"
+        Country.get_glassdoor_url = lambda country: f"{self.url}/"
+        ZipRecruiter.base_url = ZipRecruiter.api_url = self.url
+        BDJobs.base_url = self.url
+        BDJobs.search_url = f"{self.url}/jobsearch.asp"
+        BaytScraper.base_url = self.url
+        # the board answers as fast as it can, don't pace requests to it
+        configure_rate_limiter(enabled=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    board = MockJobBoard(port=args.port, latency=args.latency)
+    print(f"mock job board on {board.url} (latency {args.latency}s)")
+    board.server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
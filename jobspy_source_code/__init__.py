@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Tuple
+import asyncio
+import queue
+import time
+from concurrent.futures import Future
+from typing import Iterator
 
 import pandas as pd
 
+from jobspy.aio import ASYNC_SCRAPER_MAPPING
 from jobspy.bayt import BaytScraper
 from jobspy.bdjobs import BDJobs
 from jobspy.glassdoor import Glassdoor
@@ -12,8 +16,23 @@ from jobspy.google import Google
 from jobspy.indeed import Indeed
 from jobspy.linkedin import LinkedIn
 from jobspy.naukri import Naukri
-from jobspy.model import JobType, Location, JobResponse, Country
+from jobspy.model import JobType, JobPost, Location, JobResponse, Country
 from jobspy.model import SalarySource, ScraperInput, Site
+from jobspy.cache import (
+    cache_key,
+    configure_cache,
+    configure_detail_cache,
+    get_cache,
+)
+from jobspy.cassette import use_cassette
+from jobspy.circuit import configure_circuit_breaker, get_circuit_breaker
+from jobspy.converter import configure_converter
+from jobspy.metrics import DATAFRAME_BUILD, timed, track_scrape
+from jobspy.profiling import phase, profile_site
+from jobspy.ratelimit import configure_rate_limiter
+from jobspy.scheduler import configure_scheduler, get_scheduler
+from jobspy.singleflight import get_single_flight, search_key
+from jobspy.store import JobStore
 from jobspy.util import (
     set_logger_level,
     extract_salary,
@@ -22,11 +41,22 @@ from jobspy.util import (
     map_str_to_site,
     convert_to_annual,
     desired_order,
+    extract_emails_from_text,
 )
 from jobspy.ziprecruiter import ZipRecruiter
 
 
-# Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
+SCRAPER_MAPPING = {
+    Site.LINKEDIN: LinkedIn,
+    Site.INDEED: Indeed,
+    Site.ZIP_RECRUITER: ZipRecruiter,
+    Site.GLASSDOOR: Glassdoor,
+    Site.GOOGLE: Google,
+    Site.BAYT: BaytScraper,
+    Site.NAUKRI: Naukri,
+    Site.BDJOBS: BDJobs,
+}
+
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -49,23 +79,573 @@ def scrape_jobs(
     enforce_annual_salary: bool = False,
     verbose: int = 0,
     user_agent: str = None,
+    deadline_seconds: float | None = None,
+    listing_only: bool = False,
+    use_cache: bool = False,
+    job_store: JobStore | str | None = None,
+    only_new: bool = False,
+    metadata: dict | None = None,
+    coalesce: bool = False,
     **kwargs,
 ) -> pd.DataFrame:
     """
     Scrapes job data from job boards concurrently
-    :return: Pandas DataFrame containing job data
+    :param deadline_seconds: time budget; when it runs out every scraper stops and
+        the jobs found so far are returned, with per-site truncated flags in
+        df.attrs["sites"]
+    :param use_cache: serve each site from the process-wide result cache
+        (see jobspy.cache.configure_cache) while its entry is fresh
+    :param listing_only: return card data without the per-job detail requests
+        (descriptions etc.); fetch those for the jobs you keep with fetch_details
+    :param job_store: JobStore or SQLite path every returned job is upserted into
+    :param only_new: return only jobs not already in job_store; scrapers stop
+        paginating once a whole page is known
+    :param metadata: optional dict filled in as the search runs, see iter_jobs,
+        for watching per-site progress from another thread
+    :param coalesce: if an identical search is already running in this process
+        (see jobspy.singleflight), wait for it and share its result instead of
+        scraping again; df.attrs["coalesced"] says whether this call did
+    :return: Pandas DataFrame containing job data. Sites skipped because their
+        circuit is open (see jobspy.circuit) are flagged circuit_open in
+        df.attrs["sites"]
+    """
+    metadata = {} if metadata is None else metadata
+
+    def search() -> pd.DataFrame:
+        job_rows = list(
+            iter_jobs(
+                site_name=site_name,
+                search_term=search_term,
+                google_search_term=google_search_term,
+                location=location,
+                distance=distance,
+                is_remote=is_remote,
+                job_type=job_type,
+                easy_apply=easy_apply,
+                results_wanted=results_wanted,
+                country_indeed=country_indeed,
+                proxies=proxies,
+                ca_cert=ca_cert,
+                description_format=description_format,
+                linkedin_fetch_description=linkedin_fetch_description,
+                linkedin_company_ids=linkedin_company_ids,
+                offset=offset,
+                hours_old=hours_old,
+                enforce_annual_salary=enforce_annual_salary,
+                verbose=verbose,
+                user_agent=user_agent,
+                deadline_seconds=deadline_seconds,
+                listing_only=listing_only,
+                use_cache=use_cache,
+                job_store=job_store,
+                only_new=only_new,
+                metadata=metadata,
+            )
+        )
+        with phase("dataframe"), timed(DATAFRAME_BUILD):
+            jobs_df = _build_jobs_df(job_rows)
+        jobs_df.attrs.update(metadata)
+        return jobs_df
+
+    if not coalesce:
+        return search()
+    key = search_key(
+        _build_scraper_input(
+            site_name=site_name,
+            search_term=search_term,
+            google_search_term=google_search_term,
+            location=location,
+            distance=distance,
+            is_remote=is_remote,
+            job_type=job_type,
+            easy_apply=easy_apply,
+            results_wanted=results_wanted,
+            country_indeed=country_indeed,
+            description_format=description_format,
+            linkedin_fetch_description=linkedin_fetch_description,
+            linkedin_company_ids=linkedin_company_ids,
+            offset=offset,
+            hours_old=hours_old,
+            listing_only=listing_only,
+        ),
+        deadline_seconds=deadline_seconds,
+        enforce_annual_salary=enforce_annual_salary,
+        job_store=getattr(job_store, "path", job_store),
+        only_new=only_new,
+    )
+    shared_df, coalesced, waiters = get_single_flight().do(key, search)
+    # every caller gets its own copy of the shared result
+    jobs_df = shared_df.copy()
+    jobs_df.attrs = {**shared_df.attrs, "coalesced": coalesced, "shared_with": waiters}
+    metadata.update(jobs_df.attrs)
+    return jobs_df
+
+
+def iter_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    deadline_seconds: float | None = None,
+    listing_only: bool = False,
+    use_cache: bool = False,
+    job_store: JobStore | str | None = None,
+    only_new: bool = False,
+    metadata: dict | None = None,
+    **kwargs,
+) -> Iterator[dict]:
     """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.ZIP_RECRUITER: ZipRecruiter,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-        Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
+    Scrapes job boards concurrently, yielding each job as a normalized row
+    (the same columns as the scrape_jobs DataFrame) as soon as the scraper that
+    found it finishes a results page. Rows arrive in completion order, not
+    sorted by site or date.
+    :param deadline_seconds: time budget; when it runs out the iterator stops
+        after the jobs found so far
+    :param use_cache: serve each site from the process-wide result cache
+    :param listing_only: card data only, see scrape_jobs
+    :param job_store: JobStore or SQLite path every yielded job is upserted into
+    :param only_new: yield only jobs not already in job_store
+    :param metadata: optional dict filled in with per-site {"jobs", "truncated",
+        "cached", "circuit_open"} under "sites" as the iterator runs
+    :return: iterator of dicts
+    """
+    set_logger_level(verbose)
+    store = JobStore(job_store) if isinstance(job_store, str) else job_store
+    if only_new and store is None:
+        raise ValueError("only_new requires a job_store")
+    scraper_input = _build_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        deadline_seconds=deadline_seconds,
+        listing_only=listing_only,
+    )
+    country_enum = scraper_input.country
+    site_stats = {
+        site.value: {
+            "jobs": 0,
+            "truncated": False,
+            "cached": False,
+            "circuit_open": False,
+        }
+        for site in scraper_input.site_type
+    }
+    if metadata is not None:
+        metadata["sites"] = site_stats
+    cache = get_cache() if use_cache else None
+    circuit_breaker = get_circuit_breaker()
+    # keyed up front, scrapers may clamp fields of the shared scraper_input
+    cache_keys = {
+        site: cache_key(scraper_input, site) for site in scraper_input.site_type
     }
+
+    pages: queue.Queue = queue.Queue()
+
+    def scrape_site(site: Site) -> None:
+        if cache is not None:
+            cached_jobs = cache.get(cache_keys[site], site)
+            if cached_jobs is not None:
+                site_stats[site.value]["cached"] = True
+                pages.put((site, cached_jobs))
+                return
+        if not circuit_breaker.allow(site):
+            site_stats[site.value]["circuit_open"] = True
+            create_logger("JobSpy").warning(f"{site.value} circuit open, skipping")
+            return
+        scraper_class = SCRAPER_MAPPING[site]
+        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+        published = 0
+
+        def on_page(jobs: list[JobPost]):
+            nonlocal published
+            published += len(jobs)
+            pages.put((site, jobs))
+
+        scraper.page_callback = on_page
+        if only_new:
+            scraper.known_ids = store.known_ids
+        try:
+            with profile_site(site), track_scrape(scraper) as scrape:
+                scraped_data: JobResponse = scraper.scrape(scraper_input)
+                scrape["jobs"] = len(scraped_data.jobs)
+        except Exception:
+            circuit_breaker.record(site, None)
+            raise
+        # anything the scraper returned without handing it to page_callback
+        if len(scraped_data.jobs) > published:
+            pages.put((site, scraped_data.jobs[published:]))
+        site_stats[site.value]["truncated"] = scraper.truncated
+        # an early stop on known jobs isn't the full result for the search
+        if cache is not None and not (scraper.truncated or scraper.stopped_on_known):
+            cache.set(cache_keys[site], site, scraped_data.jobs)
+        cap_name = site.value.capitalize()
+        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
+        site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
+        create_logger(site_name).info(f"finished scraping")
+
+    scheduler = get_scheduler()
+    futures: dict[Site, Future] = {}
+    try:
+        for site in scraper_input.site_type:
+            future = scheduler.submit_scrape(scrape_site, site)
+            future.add_done_callback(lambda f, site=site: pages.put((site, f)))
+            futures[site] = future
+
+        remaining = len(scraper_input.site_type)
+        while remaining:
+            try:
+                site, item = pages.get(timeout=_time_left(scraper_input.deadline))
+            except queue.Empty:
+                # out of time: whatever is still running gets reported as cut short
+                for site, future in futures.items():
+                    if not future.done():
+                        site_stats[site.value]["truncated"] = True
+                create_logger("JobSpy").warning(
+                    "deadline reached, returning partial results"
+                )
+                break
+            if isinstance(item, Future):
+                remaining -= 1
+                item.result()
+                continue
+            with phase("normalize", site):
+                rows = [
+                    _normalize_job(job, site.value, country_enum, enforce_annual_salary)
+                    for job in item
+                ]
+            if store is not None:
+                rows = _store_rows(store, rows, only_new)
+            site_stats[site.value]["jobs"] += len(rows)
+            yield from rows
+    finally:
+        # the pool is shared, so only drop this call's sites that haven't started
+        for future in futures.values():
+            future.cancel()
+
+
+async def scrape_jobs_async(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    deadline_seconds: float | None = None,
+    listing_only: bool = False,
+    use_cache: bool = False,
+    job_store: JobStore | str | None = None,
+    only_new: bool = False,
+    metadata: dict | None = None,
+    coalesce: bool = False,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    asyncio counterpart of scrape_jobs. Sites with an async scraper (Indeed,
+    LinkedIn, Naukri, Google) run on the event loop over one shared aiohttp
+    connection pool; the remaining sites run their threaded scraper through
+    asyncio.to_thread. All sites are gathered concurrently. deadline_seconds,
+    listing_only, use_cache, job_store, only_new, metadata, coalesce and the
+    circuit breaker work as in scrape_jobs, including df.attrs["sites"]; a
+    coalesced call can share the result of a threaded scrape_jobs call and
+    vice versa.
+    :return: Pandas DataFrame containing job data
+    """
+    set_logger_level(verbose)
+    scraper_input = _build_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        deadline_seconds=deadline_seconds,
+        listing_only=listing_only,
+    )
+    store = JobStore(job_store) if isinstance(job_store, str) else job_store
+    if only_new and store is None:
+        raise ValueError("only_new requires a job_store")
+    metadata = {} if metadata is None else metadata
+    # keyed up front, scrapers may clamp fields of the shared scraper_input
+    key = search_key(
+        scraper_input,
+        deadline_seconds=deadline_seconds,
+        enforce_annual_salary=enforce_annual_salary,
+        job_store=getattr(job_store, "path", job_store),
+        only_new=only_new,
+    )
+
+    async def search() -> pd.DataFrame:
+        site_jobs: dict[Site, list[JobPost]] = {
+            site: [] for site in scraper_input.site_type
+        }
+        site_stats = {
+            site.value: {
+                "jobs": 0,
+                "truncated": False,
+                "cached": False,
+                "circuit_open": False,
+            }
+            for site in scraper_input.site_type
+        }
+        metadata["sites"] = site_stats
+        cache = get_cache() if use_cache else None
+        circuit_breaker = get_circuit_breaker()
+        cache_keys = {
+            site: cache_key(scraper_input, site) for site in scraper_input.site_type
+        }
+
+        async def scrape_site(site: Site) -> None:
+            if cache is not None:
+                cached_jobs = cache.get(cache_keys[site], site)
+                if cached_jobs is not None:
+                    site_stats[site.value]["cached"] = True
+                    site_jobs[site] = cached_jobs
+                    return
+            if not circuit_breaker.allow(site):
+                site_stats[site.value]["circuit_open"] = True
+                create_logger("JobSpy").warning(f"{site.value} circuit open, skipping")
+                return
+            if site in ASYNC_SCRAPER_MAPPING:
+                scraper = ASYNC_SCRAPER_MAPPING[site](
+                    proxies=proxies, ca_cert=ca_cert, user_agent=user_agent
+                )
+            else:
+                scraper = SCRAPER_MAPPING[site](
+                    proxies=proxies, ca_cert=ca_cert, user_agent=user_agent
+                )
+            scraper.page_callback = site_jobs[site].extend
+            if only_new:
+                scraper.known_ids = store.known_ids
+            try:
+                with profile_site(site), track_scrape(scraper) as scrape:
+                    if site in ASYNC_SCRAPER_MAPPING:
+                        scraped_data = await scraper.scrape_async(scraper_input)
+                    else:
+                        scraped_data = await asyncio.to_thread(
+                            scraper.scrape, scraper_input
+                        )
+                    scrape["jobs"] = len(scraped_data.jobs)
+            except Exception:
+                circuit_breaker.record(site, None)
+                raise
+            published = len(site_jobs[site])
+            site_jobs[site].extend(scraped_data.jobs[published:])
+            site_stats[site.value]["truncated"] = scraper.truncated
+            if cache is not None and not (
+                scraper.truncated or scraper.stopped_on_known
+            ):
+                cache.set(cache_keys[site], site, scraped_data.jobs)
+
+        tasks = {
+            asyncio.ensure_future(scrape_site(site)): site
+            for site in scraper_input.site_type
+        }
+        done, pending = await asyncio.wait(
+            tasks, timeout=_time_left(scraper_input.deadline)
+        )
+        for task in pending:
+            # keep the pages the site published before the deadline
+            task.cancel()
+            site_stats[tasks[task].value]["truncated"] = True
+        for task in done:
+            task.result()
+
+        job_rows = []
+        for site, jobs in site_jobs.items():
+            with phase("normalize", site):
+                rows = [
+                    _normalize_job(
+                        job, site.value, scraper_input.country, enforce_annual_salary
+                    )
+                    for job in jobs
+                ]
+            if store is not None:
+                rows = await asyncio.to_thread(_store_rows, store, rows, only_new)
+            site_stats[site.value]["jobs"] = len(rows)
+            job_rows += rows
+        with phase("dataframe"), timed(DATAFRAME_BUILD):
+            jobs_df = _build_jobs_df(job_rows)
+        jobs_df.attrs.update(metadata)
+        return jobs_df
+
+    if not coalesce:
+        return await search()
+    shared_df, coalesced, waiters = await get_single_flight().do_async(key, search)
+    jobs_df = shared_df.copy()
+    jobs_df.attrs = {**shared_df.attrs, "coalesced": coalesced, "shared_with": waiters}
+    metadata.update(jobs_df.attrs)
+    return jobs_df
+
+
+# job id prefix -> site whose scraper can fetch the job page details
+DETAIL_ID_PREFIXES = {
+    "li-": Site.LINKEDIN,
+    "zr-": Site.ZIP_RECRUITER,
+    "gd-": Site.GLASSDOOR,
+}
+
+
+def fetch_details(
+    job_ids: list[str],
+    description_format: str = "markdown",
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    user_agent: str = None,
+    verbose: int = 0,
+) -> pd.DataFrame:
+    """
+    Second phase of a listing_only scrape: fetches descriptions and the other
+    job page fields for just the jobs picked, concurrently within each site's
+    scheduler limits. LinkedIn, ZipRecruiter and Glassdoor jobs are passed by
+    id (li-, zr-, gd-), BDJobs jobs by job_url since their ids carry no prefix.
+    :return: DataFrame with one row per requested id, to merge onto the listing
+    """
     set_logger_level(verbose)
+    keys_by_site: dict[Site, list[tuple[str, str]]] = {}
+    rows = {job_id: {"id": job_id, "site": None, "error": None} for job_id in job_ids}
+    for job_id in rows:
+        prefix = job_id[:3]
+        if prefix in DETAIL_ID_PREFIXES:
+            site, key = DETAIL_ID_PREFIXES[prefix], job_id[3:]
+        elif "bdjobs.com" in job_id:
+            site, key = Site.BDJOBS, job_id
+        else:
+            rows[job_id]["error"] = "no job page details for this id"
+            continue
+        rows[job_id]["site"] = site.value
+        keys_by_site.setdefault(site, []).append((job_id, key))
+
+    scheduler = get_scheduler()
+    futures: dict[str, Future] = {}
+    for site, keys in keys_by_site.items():
+        try:
+            scraper = SCRAPER_MAPPING[site](
+                proxies=proxies, ca_cert=ca_cert, user_agent=user_agent
+            )
+            scraper.prepare_details(
+                ScraperInput(
+                    site_type=[site],
+                    country=Country.from_string(country_indeed),
+                    description_format=description_format,
+                )
+            )
+        except Exception as e:
+            for job_id, _ in keys:
+                rows[job_id]["error"] = str(e)
+            continue
+        for job_id, key in keys:
+            futures[job_id] = scheduler.submit(site, scraper.fetch_job_details, key)
+
+    for job_id, future in futures.items():
+        try:
+            details = future.result()
+        except Exception as e:
+            rows[job_id]["error"] = str(e)
+            continue
+        if not details:
+            rows[job_id]["error"] = "job page unavailable"
+            continue
+        job_types = details.get("job_type")
+        if isinstance(job_types, list):
+            details["job_type"] = (
+                ", ".join(job_type.value[0] for job_type in job_types)
+                if job_types
+                else None
+            )
+        emails = extract_emails_from_text(details.get("description"))
+        details["emails"] = ", ".join(emails) if emails else None
+        rows[job_id].update(details)
+    return pd.DataFrame(list(rows.values()))
+
+
+def _store_rows(store: JobStore, rows: list[dict], only_new: bool) -> list[dict]:
+    """Upserts rows into store, returning the ones to hand back"""
+    known = store.known_ids(row["id"] for row in rows) if only_new else ()
+    store.upsert(rows)
+    return [row for row in rows if row["id"] not in known]
+
+
+def _time_left(deadline: float | None) -> float | None:
+    """Seconds until a time.monotonic() deadline, None when there is none"""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def _build_scraper_input(
+    site_name: str | list[str] | Site | list[Site] | None,
+    search_term: str | None,
+    google_search_term: str | None,
+    location: str | None,
+    distance: int | None,
+    is_remote: bool,
+    job_type: str | None,
+    easy_apply: bool | None,
+    results_wanted: int,
+    country_indeed: str,
+    description_format: str,
+    linkedin_fetch_description: bool | None,
+    linkedin_company_ids: list[int] | None,
+    offset: int | None,
+    hours_old: int | None,
+    deadline_seconds: float | None = None,
+    listing_only: bool = False,
+) -> ScraperInput:
+    """
+    Maps the public scrape_jobs parameters onto a ScraperInput
+    """
     job_type = get_enum_from_value(job_type) if job_type else None
 
     def get_site_type():
@@ -99,129 +679,110 @@ def scrape_jobs(
         linkedin_company_ids=linkedin_company_ids,
         offset=offset,
         hours_old=hours_old,
+        deadline=(time.monotonic() + deadline_seconds if deadline_seconds else None),
+        listing_only=listing_only,
     )
+    return scraper_input
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
-        create_logger(site_name).info(f"finished scraping")
-        return site.value, scraped_data
 
-    site_to_jobs_dict = {}
+def _normalize_job(
+    job: JobPost,
+    site: str,
+    country_enum: Country,
+    enforce_annual_salary: bool = False,
+) -> dict:
+    """
+    Flattens a JobPost into the row layout used by the scrape_jobs DataFrame
+    :return: dict of column name -> value
+    """
+    job_data = job.dict()
+    job_data["site"] = site
+    job_data["company"] = job_data["company_name"]
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job_data["job_type"])
+        if job_data["job_type"]
+        else None
+    )
+    job_data["emails"] = ", ".join(job_data["emails"]) if job_data["emails"] else None
+    if job_data["location"]:
+        job_data["location"] = Location(**job_data["location"]).display_location()
 
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
+    # Handle compensation
+    compensation_obj = job_data.get("compensation")
+    if compensation_obj and isinstance(compensation_obj, dict):
+        job_data["interval"] = (
+            compensation_obj.get("interval").value
+            if compensation_obj.get("interval")
+            else None
+        )
+        job_data["min_amount"] = compensation_obj.get("min_amount")
+        job_data["max_amount"] = compensation_obj.get("max_amount")
+        job_data["currency"] = compensation_obj.get("currency", "USD")
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            job_data["interval"]
+            and job_data["interval"] != "yearly"
+            and job_data["min_amount"]
+            and job_data["max_amount"]
+        ):
+            convert_to_annual(job_data)
+    else:
+        if country_enum == Country.USA:
+            (
+                job_data["interval"],
+                job_data["min_amount"],
+                job_data["max_amount"],
+                job_data["currency"],
+            ) = extract_salary(
+                job_data["description"],
+                enforce_annual_salary=enforce_annual_salary,
+            )
+            job_data["salary_source"] = SalarySource.DESCRIPTION.value
 
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
-        }
+    job_data["salary_source"] = (
+        job_data["salary_source"]
+        if "min_amount" in job_data and job_data["min_amount"]
+        else None
+    )
 
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
+    # naukri-specific fields
+    job_data["skills"] = ", ".join(job_data["skills"]) if job_data["skills"] else None
+    return job_data
 
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
 
-            #naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
-            )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
-
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
-
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
-
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
-
-        # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
-            by=["site", "date_posted"], ascending=[True, False]
-        ).reset_index(drop=True)
-    else:
+def _build_jobs_df(job_rows: list[dict]) -> pd.DataFrame:
+    """
+    Builds the result DataFrame column-wise from normalized job rows: every
+    column in desired_order is collected into a list in a single pass over the
+    rows, and the frame is constructed once.
+    :return: DataFrame sorted by site and date_posted
+    """
+    if not job_rows:
         return pd.DataFrame()
 
+    columns: dict[str, list] = {column: [] for column in desired_order}
+    for job_data in job_rows:
+        for column, values in columns.items():
+            values.append(job_data.get(column))
+
+    jobs_df = pd.DataFrame(columns, columns=desired_order)
+    return jobs_df.sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    ).reset_index(drop=True)
+
 
-# Add BDJobs to __all__
 __all__ = [
+    "scrape_jobs",
+    "iter_jobs",
+    "scrape_jobs_async",
+    "fetch_details",
+    "configure_scheduler",
+    "configure_cache",
+    "configure_detail_cache",
+    "configure_converter",
+    "configure_rate_limiter",
+    "configure_circuit_breaker",
+    "use_cassette",
+    "JobStore",
     "BDJobs",
 ]
\ No newline at end of file
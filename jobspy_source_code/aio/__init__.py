@@ -0,0 +1,30 @@
+"""
+jobspy.aio
+~~~~~~~~~~
+
+asyncio implementations of the Scraper interface used by scrape_jobs_async.
+Requires the optional aiohttp dependency.
+"""
+
+from jobspy.aio.scrapers import (
+    AsyncScraper,
+    AsyncIndeed,
+    AsyncLinkedIn,
+    AsyncNaukri,
+    AsyncGoogle,
+)
+from jobspy.aio.session import (
+    AsyncResponse,
+    AsyncSession,
+    ConnectionPool,
+    configure_connection_pool,
+    get_connection_pool,
+)
+from jobspy.model import Site
+
+ASYNC_SCRAPER_MAPPING = {
+    Site.INDEED: AsyncIndeed,
+    Site.LINKEDIN: AsyncLinkedIn,
+    Site.NAUKRI: AsyncNaukri,
+    Site.GOOGLE: AsyncGoogle,
+}
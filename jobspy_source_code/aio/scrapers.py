@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from abc import abstractmethod
+
+from bs4.element import Tag
+
+from jobspy.aio.session import AsyncSession
+from jobspy.cache import cached_details_async
+from jobspy.exception import LinkedInException, NaukriException
+from jobspy.google import Google
+from jobspy.google.constant import headers_initial, headers_jobs
+from jobspy.indeed import Indeed
+from jobspy.linkedin import LinkedIn
+from jobspy.linkedin.constant import headers as linkedin_headers
+from jobspy.model import JobPost, JobResponse, Scraper, ScraperInput
+from jobspy.naukri import Naukri
+from jobspy.naukri.constant import headers as naukri_headers
+from jobspy.util import create_logger, parse_html
+
+
+class AsyncScraper(Scraper):
+    """
+    Scraper whose network I/O runs on the event loop. Subclasses reuse the
+    request building and parsing of their threaded counterpart and only swap
+    the blocking session calls for AsyncSession ones. Parsing (and description
+    conversion, which may wait on the converter pool) runs through
+    asyncio.to_thread, so one slow page doesn't hold up the other sites.
+    """
+
+    @abstractmethod
+    async def scrape_async(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+
+class AsyncIndeed(Indeed, AsyncScraper):
+    async def scrape_async(self, scraper_input: ScraperInput) -> JobResponse:
+        log = create_logger("Indeed")
+        self._setup(scraper_input)
+        self.async_session = AsyncSession(
+            proxies=self.proxies, ca_cert=self.ca_cert, site=self.site
+        )
+        job_list = []
+        page = 1
+        cursor = None
+
+        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
+            if self._deadline_reached():
+                break
+            log.info(
+                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+            )
+            payload, headers = self._build_page_request(cursor)
+            response = await self.async_session.post(
+                self.api_url, headers=headers, json=payload, timeout=10, verify=False
+            )
+            if not response.ok:
+                log.info(f"responded with status code: {response.status_code}")
+                break
+            jobs, cursor = await asyncio.to_thread(self._parse_page, response.json())
+            if not jobs:
+                log.info(f"found no jobs on page: {page}")
+                break
+            job_list += jobs
+            self._publish(job_list, scraper_input.offset)
+            if self._page_all_known(jobs):
+                break
+            page += 1
+        return JobResponse(
+            jobs=job_list[
+                scraper_input.offset : scraper_input.offset
+                + scraper_input.results_wanted
+            ]
+        )
+
+
+class AsyncLinkedIn(LinkedIn, AsyncScraper):
+    async def scrape_async(self, scraper_input: ScraperInput) -> JobResponse:
+        log = create_logger("LinkedIn")
+        self.scraper_input = scraper_input
+        self.async_session = AsyncSession(
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            has_retry=True,
+            delay=5,
+            site=self.site,
+        )
+        self.async_session.headers.update(linkedin_headers)
+        job_list: list[JobPost] = []
+        seen_ids = set()
+        start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
+        request_count = 0
+        seconds_old = (
+            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
+        )
+        continue_search = lambda: (
+            len(job_list) < scraper_input.results_wanted
+            and start < 1000
+            and not self._deadline_reached()
+        )
+        while continue_search():
+            request_count += 1
+            log.info(
+                f"search page: {request_count} / {math.ceil(scraper_input.results_wanted / 10)}"
+            )
+            try:
+                response = await self.async_session.get(
+                    f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
+                    params=self._search_params(start, seconds_old),
+                    timeout=10,
+                )
+                if not response.ok:
+                    log.error(f"LinkedIn response status code {response.status_code}")
+                    break
+            except Exception as e:
+                log.error(f"LinkedIn: {str(e)}")
+                break
+
+            job_cards = await asyncio.to_thread(self._parse_job_cards, response.text)
+            if len(job_cards) == 0:
+                break
+
+            wanted = scraper_input.results_wanted - len(job_list)
+            new_cards = []
+            for job_card in job_cards:
+                if len(new_cards) >= wanted:
+                    break
+                href_tag = job_card.find("a", class_="base-card__full-link")
+                if href_tag and "href" in href_tag.attrs:
+                    job_id = href_tag.attrs["href"].split("?")[0].split("-")[-1]
+                    if job_id in seen_ids:
+                        continue
+                    seen_ids.add(job_id)
+                    new_cards.append((job_card, job_id))
+
+            fetch_desc = (
+                scraper_input.linkedin_fetch_description
+                and self._should_fetch_details()
+            )
+            details = (
+                await asyncio.gather(
+                    *(self._get_job_details_async(job_id) for _, job_id in new_cards)
+                )
+                if fetch_desc
+                else [{}] * len(new_cards)
+            )
+            page_start = len(job_list)
+            job_list += await asyncio.to_thread(
+                self._process_cards, new_cards, fetch_desc, details
+            )
+
+            self._publish(job_list)
+            if self._page_all_known(job_list[page_start:]):
+                break
+            if continue_search():
+                start += len(job_cards)
+
+        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
+
+    def _parse_job_cards(self, html: str) -> list[Tag]:
+        soup = parse_html(html, parse_only=self.job_card_strainer)
+        return soup.find_all("div", class_="base-search-card")
+
+    def _process_cards(
+        self, new_cards: list[tuple[Tag, str]], fetch_desc: bool, details: list[dict]
+    ) -> list[JobPost]:
+        jobs = []
+        for (job_card, job_id), job_details in zip(new_cards, details):
+            try:
+                jobs.append(
+                    self._process_job(job_card, job_id, fetch_desc, job_details)
+                )
+            except Exception as e:
+                raise LinkedInException(str(e))
+        return jobs
+
+    async def _get_job_details_async(self, job_id: str) -> dict:
+        return await cached_details_async(
+            self, job_id, lambda: self._request_job_details_async(job_id)
+        )
+
+    async def _request_job_details_async(self, job_id: str) -> dict:
+        try:
+            response = await self.async_session.get(
+                f"{self.base_url}/jobs/view/{job_id}", timeout=5
+            )
+            response.raise_for_status()
+        except Exception:
+            return {}
+        if "linkedin.com/signup" in response.url:
+            return {}
+        return await asyncio.to_thread(self._parse_job_details, response.text)
+
+
+class AsyncNaukri(Naukri, AsyncScraper):
+    async def scrape_async(self, scraper_input: ScraperInput) -> JobResponse:
+        log = create_logger("Naukri")
+        self.scraper_input = scraper_input
+        self.async_session = AsyncSession(
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            has_retry=True,
+            delay=5,
+            site=self.site,
+        )
+        self.async_session.headers.update(naukri_headers)
+        job_list: list[JobPost] = []
+        seen_ids = set()
+        page = ((scraper_input.offset or 0) // self.jobs_per_page) + 1
+        seconds_old = (
+            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
+        )
+        continue_search = lambda: (
+            len(job_list) < scraper_input.results_wanted
+            and page <= 50
+            and not self._deadline_reached()
+        )
+
+        while continue_search():
+            log.info(f"search page: {page}")
+            try:
+                response = await self.async_session.get(
+                    self.base_url,
+                    params=self._search_params(page, seconds_old),
+                    timeout=10,
+                )
+                if not response.ok:
+                    log.error(f"Naukri API response status code {response.status_code}")
+                    break
+                job_details = response.json().get("jobDetails", [])
+                if not job_details:
+                    break
+            except Exception as e:
+                log.error(f"Naukri API request failed: {str(e)}")
+                break
+
+            def process_page():
+                for job in job_details:
+                    job_id = job.get("jobId")
+                    if not job_id or job_id in seen_ids:
+                        continue
+                    seen_ids.add(job_id)
+                    try:
+                        fetch_desc = scraper_input.linkedin_fetch_description
+                        job_post = self._process_job(job, job_id, fetch_desc)
+                        if job_post:
+                            job_list.append(job_post)
+                        if not continue_search():
+                            break
+                    except Exception as e:
+                        raise NaukriException(str(e))
+
+            page_start = len(job_list)
+            await asyncio.to_thread(process_page)
+
+            self._publish(job_list)
+            if self._page_all_known(job_list[page_start:]):
+                break
+            if continue_search():
+                page += 1
+
+        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
+
+
+class AsyncGoogle(Google, AsyncScraper):
+    async def scrape_async(self, scraper_input: ScraperInput) -> JobResponse:
+        log = create_logger("Google")
+        self.scraper_input = scraper_input
+        self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
+        self.async_session = AsyncSession(
+            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True, site=self.site
+        )
+        response = await self.async_session.get(
+            self.url, headers=headers_initial, params=self._initial_params()
+        )
+        forward_cursor, job_list = await asyncio.to_thread(
+            self._parse_initial_page, response.text
+        )
+        self._publish(job_list, scraper_input.offset)
+        if forward_cursor is None:
+            log.warning(
+                "initial cursor not found, try changing your query or there was at most 10 results"
+            )
+            return JobResponse(jobs=job_list)
+
+        page = 1
+        while (
+            len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
+            and forward_cursor
+            and not self._deadline_reached()
+        ):
+            log.info(
+                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+            )
+            try:
+                response = await self.async_session.get(
+                    self.jobs_url,
+                    headers=headers_jobs,
+                    params=self._next_page_params(forward_cursor),
+                )
+                jobs, forward_cursor = await asyncio.to_thread(
+                    self._parse_jobs, response.text
+                )
+            except Exception as e:
+                log.error(f"failed to get jobs on page: {page}, {e}")
+                break
+            if not jobs:
+                log.info(f"found no jobs on page: {page}")
+                break
+            job_list += jobs
+            self._publish(job_list, scraper_input.offset)
+            if self._page_all_known(jobs):
+                break
+            page += 1
+        return JobResponse(
+            jobs=job_list[
+                scraper_input.offset : scraper_input.offset
+                + scraper_input.results_wanted
+            ]
+        )
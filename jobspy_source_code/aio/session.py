@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+import time
+import weakref
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, only needed by scrape_jobs_async
+    aiohttp = None
+
+from jobspy.circuit import get_circuit_breaker
+from jobspy.metrics import record_request
+from jobspy.model import Site
+from jobspy.profiling import add_phase, add_request, phase
+from jobspy.proxy import DIRECT, ProxyPool
+from jobspy.ratelimit import get_rate_limiter
+from jobspy.scheduler import get_scheduler
+from jobspy.util import RETRY_STATUSES, RotatingProxySession, is_idempotent
+
+
+class AsyncResponse:
+    """The parts of a requests.Response the scrapers rely on"""
+
+    def __init__(self, status_code: int, text: str, url: str, headers: dict):
+        self.status_code = status_code
+        self.text = text
+        self.url = url
+        self.headers = headers
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code in range(200, 400)
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise aiohttp.ClientResponseError(
+                None, (), status=self.status_code, message=self.url
+            )
+
+
+class ConnectionPool:
+    """
+    One aiohttp ClientSession per event loop, shared by every async scraper.
+    aiohttp keeps a pool of keep-alive connections per host inside it, capped
+    at limit_per_host, so concurrent searches reuse sockets instead of each
+    opening their own.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 10):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def session(self) -> "aiohttp.ClientSession":
+        if aiohttp is None:
+            raise ImportError("scrape_jobs_async requires aiohttp: pip install aiohttp")
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host
+            )
+            # cookies stay per request, like the sync sessions with clear_cookies
+            session = aiohttp.ClientSession(
+                connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+            )
+            self._sessions[loop] = session
+        return session
+
+    async def close(self):
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        if session is not None:
+            await session.close()
+
+
+_connection_pool = ConnectionPool()
+
+
+def get_connection_pool() -> ConnectionPool:
+    return _connection_pool
+
+
+def configure_connection_pool(
+    limit: int = 100, limit_per_host: int = 10
+) -> ConnectionPool:
+    """
+    Replaces the shared pool; sessions already open on the old one stay open
+    until their event loop goes away.
+    """
+    global _connection_pool
+    _connection_pool = ConnectionPool(limit=limit, limit_per_host=limit_per_host)
+    return _connection_pool
+
+
+class AsyncSession:
+    """
+    A scraper's view of the shared connection pool with the same proxy
+    rotation, default headers, retry behaviour and rate limiting
+    create_session sets up for the threaded scrapers.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        has_retry: bool = False,
+        delay: int = 1,
+        site: Site | None = None,
+    ):
+        if isinstance(proxies, str):
+            proxies = [proxies]
+        self.proxy_pool = (
+            ProxyPool(
+                [RotatingProxySession.format_proxy(p)["http"] for p in proxies],
+                site=site,
+            )
+            if proxies
+            else None
+        )
+        self.site = site
+        self.ssl = ssl.create_default_context(cafile=ca_cert) if ca_cert else None
+        self.retries = 3 if has_retry else 0
+        self.delay = delay
+        self.headers: dict = {}
+
+    async def get(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: float = 60,
+        verify: bool = True,
+        **kwargs,
+    ) -> AsyncResponse:
+        session = get_connection_pool().session()
+        scheduler = get_scheduler()
+        rate_limiter = get_rate_limiter()
+        circuit_breaker = get_circuit_breaker()
+        request_headers = {**self.headers, **(headers or {})}
+        ssl_context = False if not verify else self.ssl
+        # as in RequestsRotating._execute: a request that may have reached the
+        # site is only sent again when it is idempotent
+        idempotent = is_idempotent(method)
+        attempt = 0
+        proxy = None
+        while True:
+            if self.proxy_pool:
+                proxy = self.proxy_pool.choose(exclude=proxy)
+            with phase("sleep", self.site):
+                await asyncio.sleep(rate_limiter.reserve(url))
+            queued = time.perf_counter()
+            try:
+                # each attempt takes its own slot, the backoff below holds none
+                async with scheduler.async_request_slot(self.site):
+                    start = time.perf_counter()
+                    add_phase("queue", start - queued, self.site)
+                    async with session.request(
+                        method,
+                        url,
+                        params=_encode_params(params),
+                        headers=request_headers,
+                        proxy=None if proxy == DIRECT else proxy,
+                        ssl=ssl_context,
+                        timeout=aiohttp.ClientTimeout(total=timeout),
+                        **kwargs,
+                    ) as res:
+                        body = await res.read()
+                        response = AsyncResponse(
+                            res.status,
+                            await res.text(),
+                            str(res.url),
+                            dict(res.headers),
+                        )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if self.proxy_pool:
+                    self.proxy_pool.record(proxy)
+                circuit_breaker.record(self.site, None)
+                record_request(self.site, None, time.perf_counter() - start)
+                connect_failed = isinstance(e, aiohttp.ClientConnectorError)
+                if attempt >= self.retries or not (idempotent or connect_failed):
+                    raise
+            else:
+                seconds = time.perf_counter() - start
+                add_phase("network", seconds, self.site)
+                add_request(self.site, len(body))
+                if self.proxy_pool:
+                    self.proxy_pool.record(proxy, response.status_code, seconds)
+                record_request(self.site, response.status_code, seconds)
+                circuit_breaker.record(self.site, response.status_code)
+                rate_limiter.record(url, response.status_code, response.headers)
+                if not idempotent or response.status_code not in RETRY_STATUSES:
+                    return response
+                if attempt >= self.retries:
+                    return response
+            await asyncio.sleep(self.delay * (2**attempt))
+            attempt += 1
+
+
+def _encode_params(params: dict | None) -> list[tuple[str, str]] | None:
+    """aiohttp only takes str/int/float values, so flatten lists and drop None"""
+    if not params:
+        return None
+    encoded = []
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if item is None:
+                continue
+            if isinstance(item, bool):
+                item = str(item).lower()
+            encoded.append((key, str(item)))
+    return encoded
@@ -1,9 +1,6 @@
 from __future__ import annotations
 
-import random
-import time
-
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from jobspy.model import (
     Scraper,
@@ -14,15 +11,14 @@ from jobspy.model import (
     Location,
     Country,
 )
-from jobspy.util import create_logger, create_session
+from jobspy.util import create_logger, create_session, parse_html
 
 log = create_logger("Bayt")
 
 
 class BaytScraper(Scraper):
     base_url = "https://www.bayt.com"
-    delay = 2
-    band_delay = 3
+    job_listing_strainer = SoupStrainer("li", attrs={"data-js-job": ""})
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
@@ -35,7 +31,11 @@ class BaytScraper(Scraper):
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            site=self.site,
         )
         job_list: list[JobPost] = []
         page = 1
@@ -43,7 +43,7 @@ class BaytScraper(Scraper):
             scraper_input.results_wanted if scraper_input.results_wanted else 10
         )
 
-        while len(job_list) < results_wanted:
+        while len(job_list) < results_wanted and not self._deadline_reached():
             log.info(f"Fetching Bayt jobs page {page}")
             job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
             if not job_elements:
@@ -71,12 +71,14 @@ class BaytScraper(Scraper):
                     log.error(f"Bayt: Error extracting job info: {str(e)}")
                     continue
 
+            self._publish(job_list)
             if len(job_list) == initial_count:
                 log.info(f"No new jobs found on page {page}. Ending pagination.")
                 break
+            if self._page_all_known(job_list[initial_count:]):
+                break
 
             page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
@@ -89,7 +91,7 @@ class BaytScraper(Scraper):
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
             response = self.session.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = parse_html(response.text, parse_only=self.job_listing_strainer)
             job_listings = soup.find_all("li", attrs={"data-js-job": ""})
             log.debug(f"Found {len(job_listings)} job listing elements")
             return job_listings
@@ -1,15 +1,14 @@
 # __init__.py
 from __future__ import annotations
 
-import random
-import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
 from bs4.element import Tag
 
+from jobspy.cache import cached_details
+from jobspy.converter import convert_description
 from jobspy.exception import BDJobsException
 from jobspy.bdjobs.constant import headers, search_params
 from jobspy.bdjobs.util import (
@@ -33,7 +32,7 @@ from jobspy.util import (
     create_session,
     create_logger,
     remove_attributes,
-    markdown_converter,
+    parse_html,
 )
 
 log = create_logger("BDJobs")
@@ -42,16 +41,19 @@ log = create_logger("BDJobs")
 class BDJobs(Scraper):
     base_url = "https://jobs.bdjobs.com"
     search_url = "https://jobs.bdjobs.com/jobsearch.asp"
-    delay = 2
-    band_delay = 3
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
     ):
         """
         Initializes BDJobsScraper with the BDJobs job search url
         """
-        super().__init__(Site.BDJOBS, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.BDJOBS, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -59,8 +61,11 @@ class BDJobs(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            site=self.site,
         )
         self.session.headers.update(headers)
+        if self.user_agent:
+            self.session.headers["User-Agent"] = self.user_agent
         self.scraper_input = None
         self.country = "bangladesh"
 
@@ -80,7 +85,10 @@ class BDJobs(Scraper):
         params = search_params.copy()
         params["txtsearch"] = scraper_input.search_term
 
-        continue_search = lambda: len(job_list) < scraper_input.results_wanted
+        continue_search = lambda: (
+            len(job_list) < scraper_input.results_wanted
+            and not self._deadline_reached()
+        )
 
         while continue_search():
             request_count += 1
@@ -101,7 +109,7 @@ class BDJobs(Scraper):
                     log.error(f"BDJobs response status code {response.status_code}")
                     break
 
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = parse_html(response.text)
                 job_cards = find_job_listings(soup)
 
                 if not job_cards or len(job_cards) == 0:
@@ -110,6 +118,7 @@ class BDJobs(Scraper):
 
                 log.info(f"Found {len(job_cards)} job cards on page {page}")
 
+                page_start = len(job_list)
                 for job_card in job_cards:
                     try:
                         job_post = self._process_job(job_card)
@@ -122,9 +131,10 @@ class BDJobs(Scraper):
                     except Exception as e:
                         log.error(f"Error processing job card: {str(e)}")
 
+                self._publish(job_list)
+                if self._page_all_known(job_list[page_start:]):
+                    break
                 page += 1
-                # Add delay between requests
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
             except Exception as e:
                 log.error(f"Error during scraping: {str(e)}")
@@ -238,116 +248,137 @@ class BDJobs(Scraper):
                 site=self.site,
             )
 
-            # Always fetch description for BDJobs
-            job_details = self._get_job_details(job_url)
-            job_post.description = job_details.get("description", "")
-            job_post.job_type = job_details.get("job_type", "")
+            # Always fetch description for BDJobs, unless listing only / out of time
+            if self._should_fetch_details():
+                job_details = self._get_job_details(job_url)
+                job_post.description = job_details.get("description", "")
+                job_post.job_type = job_details.get("job_type", "")
 
             return job_post
         except Exception as e:
             log.error(f"Error in _process_job: {str(e)}")
             return None
 
+    def fetch_job_details(self, job_key: str) -> dict:
+        """
+        :param job_key: BDJobs job url (BDJobs ids carry no site prefix)
+        :return: dict
+        """
+        return self._get_job_details(job_key)
+
     def _get_job_details(self, job_url: str) -> Dict[str, Any]:
         """
-        Gets detailed job information from the job page
+        Gets detailed job information from the job page, read through the
+        detail cache
         :param job_url: Job page URL
         :return: Dictionary with job details
         """
+        return cached_details(self, job_url, lambda: self._request_job_details(job_url))
+
+    def _request_job_details(self, job_url: str) -> Dict[str, Any]:
         try:
             response = self.session.get(job_url, timeout=60)
             if response.status_code != 200:
                 return {}
 
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Find job description - IMPROVED based on correct.py
-            description = ""
+            return self._parse_job_details(response.text)
+        except Exception as e:
+            log.error(f"Error getting job details: {str(e)}")
+            return {}
 
-            # Try to find the job content div first (as in correct.py)
-            job_content_div = soup.find("div", class_="jobcontent")
-            if job_content_div:
-                # Look for responsibilities section
-                responsibilities_heading = job_content_div.find(
-                    "h4", id="job_resp"
-                ) or job_content_div.find(
-                    ["h4", "h5"], string=lambda s: s and "responsibilities" in s.lower()
-                )
-                if responsibilities_heading:
-                    responsibilities_elements = []
-                    # Find all following elements until the next heading or hr
-                    for sibling in responsibilities_heading.find_next_siblings():
-                        if sibling.name in ["hr", "h4", "h5"]:
-                            break
-                        if sibling.name == "ul":
-                            responsibilities_elements.extend(
-                                li.get_text(separator=" ", strip=True)
-                                for li in sibling.find_all("li")
-                            )
-                        elif sibling.name == "p":
-                            responsibilities_elements.append(
-                                sibling.get_text(separator=" ", strip=True)
-                            )
-
-                description = (
-                    "\n".join(responsibilities_elements)
-                    if responsibilities_elements
-                    else ""
-                )
+    def _parse_job_details(self, html: str) -> Dict[str, Any]:
+        """
+        Parses the description, job type and industry out of a job page
+        :param html: Job page HTML
+        :return: Dictionary with job details
+        """
+        soup = parse_html(html)
+
+        # Find job description - IMPROVED based on correct.py
+        description = ""
+
+        # Try to find the job content div first (as in correct.py)
+        job_content_div = soup.find("div", class_="jobcontent")
+        if job_content_div:
+            # Look for responsibilities section
+            responsibilities_heading = job_content_div.find(
+                "h4", id="job_resp"
+            ) or job_content_div.find(
+                ["h4", "h5"], string=lambda s: s and "responsibilities" in s.lower()
+            )
+            if responsibilities_heading:
+                responsibilities_elements = []
+                # Find all following elements until the next heading or hr
+                for sibling in responsibilities_heading.find_next_siblings():
+                    if sibling.name in ["hr", "h4", "h5"]:
+                        break
+                    if sibling.name == "ul":
+                        responsibilities_elements.extend(
+                            li.get_text(separator=" ", strip=True)
+                            for li in sibling.find_all("li")
+                        )
+                    elif sibling.name == "p":
+                        responsibilities_elements.append(
+                            sibling.get_text(separator=" ", strip=True)
+                        )
+
+            description = (
+                "\n".join(responsibilities_elements)
+                if responsibilities_elements
+                else ""
+            )
 
-            # If no description found yet, try the original approach
-            if not description:
-                description_elem = soup.find(
-                    ["div", "section"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["job-description", "details", "requirements"]
-                    ),
-                )
-                if description_elem:
-                    description_elem = remove_attributes(description_elem)
-                    description = description_elem.prettify(formatter="html")
-                    if (
-                        hasattr(self.scraper_input, "description_format")
-                        and self.scraper_input.description_format
-                        == DescriptionFormat.MARKDOWN
-                    ):
-                        description = markdown_converter(description)
-
-            # Extract job type
-            job_type_elem = soup.find(
-                ["span", "div"],
-                string=lambda s: s
+        # If no description found yet, try the original approach
+        if not description:
+            description_elem = soup.find(
+                ["div", "section"],
+                class_=lambda c: c
                 and any(
-                    term in (s or "").lower()
-                    for term in ["job type", "employment type"]
+                    term in (c or "").lower()
+                    for term in ["job-description", "details", "requirements"]
                 ),
             )
-            job_type = None
-            if job_type_elem:
-                job_type_text = job_type_elem.find_next(["span", "div"]).get_text(
-                    strip=True
-                )
-                job_type = job_type_text if job_type_text else None
-
-            # Extract company industry
-            industry_elem = soup.find(
-                ["span", "div"], string=lambda s: s and "industry" in (s or "").lower()
+            if description_elem:
+                description_elem = remove_attributes(description_elem)
+                description = description_elem.prettify(formatter="html")
+                if (
+                    hasattr(self.scraper_input, "description_format")
+                    and self.scraper_input.description_format
+                    == DescriptionFormat.MARKDOWN
+                ):
+                    description = convert_description(
+                        description, DescriptionFormat.MARKDOWN
+                    )
+
+        # Extract job type
+        job_type_elem = soup.find(
+            ["span", "div"],
+            string=lambda s: s
+            and any(
+                term in (s or "").lower()
+                for term in ["job type", "employment type"]
+            ),
+        )
+        job_type = None
+        if job_type_elem:
+            job_type_text = job_type_elem.find_next(["span", "div"]).get_text(
+                strip=True
             )
-            company_industry = None
-            if industry_elem:
-                industry_text = industry_elem.find_next(["span", "div"]).get_text(
-                    strip=True
-                )
-                company_industry = industry_text if industry_text else None
+            job_type = job_type_text if job_type_text else None
 
-            return {
-                "description": description,
-                "job_type": job_type,
-                "company_industry": company_industry,
-            }
+        # Extract company industry
+        industry_elem = soup.find(
+            ["span", "div"], string=lambda s: s and "industry" in (s or "").lower()
+        )
+        company_industry = None
+        if industry_elem:
+            industry_text = industry_elem.find_next(["span", "div"]).get_text(
+                strip=True
+            )
+            company_industry = industry_text if industry_text else None
 
-        except Exception as e:
-            log.error(f"Error getting job details: {str(e)}")
-            return {}
+        return {
+            "description": description,
+            "job_type": job_type,
+            "company_industry": company_industry,
+        }
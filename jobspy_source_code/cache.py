@@ -0,0 +1,449 @@
+"""
+jobspy.cache
+~~~~~~~~~~~~
+
+Result cache in front of the scrapers. Each site's jobs for a search are
+cached separately under a hash of the normalized ScraperInput plus the site,
+so a repeated search only re-scrapes the sites whose entry expired. Entries
+are evicted least-recently-used by count and by total size.
+
+The detail cache does the same for job detail pages: the parsed details of a
+job are kept, compressed, under a hash of the site, the job id and the
+description format, so a job that turns up again in a later search isn't
+downloaded and parsed again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from jobspy.model import JobPost, Scraper, ScraperInput, Site
+from jobspy.serialize import dumps_tagged, loads_tagged
+
+# fields that don't change which jobs come back
+KEY_EXCLUDE = {"site_type", "deadline", "request_timeout"}
+
+
+def cache_key(scraper_input: ScraperInput, site: Site) -> str:
+    """
+    Canonical hash of the search: the same parameters always give the same key
+    regardless of field order or how the enums were passed in
+    """
+    fields = scraper_input.model_dump(mode="json", exclude=KEY_EXCLUDE)
+    fields["site"] = site.value
+    canonical = json.dumps(fields, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class MemoryCache:
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.time() + ttl, value)
+            self._bytes += len(value)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+
+class DiskCache:
+    """
+    SQLite-backed cache that survives restarts; same eviction rules as
+    MemoryCache, with last access time standing in for the LRU order
+    """
+
+    def __init__(
+        self,
+        path: str = "jobspy_cache.db",
+        max_entries: int = 5000,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)"
+            )
+
+    def get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return row[0]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now + ttl, now),
+            )
+            self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            self._evict()
+
+    def _evict(self) -> None:
+        count, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM cache ORDER BY accessed_at"
+        ).fetchall()
+        evicted = []
+        for key, entry_size in rows:
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            size -= entry_size
+        self._conn.executemany("DELETE FROM cache WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()[0]
+
+
+class ResultCache:
+    def __init__(
+        self,
+        backend: MemoryCache | DiskCache | None = None,
+        site_ttls: dict[Site, float] | None = None,
+        default_ttl: float = 900,
+    ):
+        """
+        :param backend: MemoryCache (default) or DiskCache
+        :param site_ttls: seconds a site's results stay fresh, per site
+        :param default_ttl: seconds for sites missing from site_ttls
+        """
+        self.backend = backend if backend is not None else MemoryCache()
+        self.site_ttls = site_ttls or {}
+        self.default_ttl = default_ttl
+        self._stats = {site.value: {"hits": 0, "misses": 0} for site in Site}
+        self._lock = threading.Lock()
+
+    def ttl(self, site: Site) -> float:
+        return self.site_ttls.get(site, self.default_ttl)
+
+    def get(self, key: str, site: Site) -> list[JobPost] | None:
+        """
+        :param key: cache_key() of the search, taken before any scraper ran
+            (some scrapers clamp results_wanted on the shared ScraperInput)
+        """
+        jobs = None
+        value = self.backend.get(key)
+        if value is not None:
+            try:
+                jobs = [JobPost.model_validate(job) for job in loads_tagged(value)]
+            except ValueError:  # written by an older version, counts as a miss
+                jobs = None
+        with self._lock:
+            self._stats[site.value]["hits" if jobs is not None else "misses"] += 1
+        return jobs
+
+    def set(self, key: str, site: Site, jobs: list[JobPost]) -> None:
+        value = dumps_tagged([job.model_dump() for job in jobs])
+        self.backend.set(key, value, self.ttl(site))
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            sites = {site: dict(counts) for site, counts in self._stats.items()}
+        hits = sum(counts["hits"] for counts in sites.values())
+        misses = sum(counts["misses"] for counts in sites.values())
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": len(self.backend),
+            "bytes": self.backend.size_bytes,
+            "sites": sites,
+        }
+
+
+_cache: ResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResultCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache()
+        return _cache
+
+
+def configure_cache(
+    path: str | None = None,
+    max_entries: int | None = None,
+    max_bytes: int | None = None,
+    site_ttls: dict[Site, float] | None = None,
+    default_ttl: float = 900,
+) -> ResultCache:
+    """
+    Replaces the process-wide result cache used by scrape_jobs(use_cache=True)
+    :param path: SQLite file for a cache that survives restarts; in-memory if None
+    """
+    global _cache
+    limits = {
+        name: value
+        for name, value in (("max_entries", max_entries), ("max_bytes", max_bytes))
+        if value is not None
+    }
+    backend = DiskCache(path, **limits) if path else MemoryCache(**limits)
+    with _cache_lock:
+        _cache = ResultCache(backend, site_ttls=site_ttls, default_ttl=default_ttl)
+        return _cache
+
+
+def _is_empty(details: Any) -> bool:
+    """A failed fetch: None, an empty dict or a tuple of Nones"""
+    if isinstance(details, dict):
+        details = details.values()
+    elif not isinstance(details, (tuple, list)):
+        details = (details,)
+    return not any(details)
+
+
+class DetailCache:
+    def __init__(
+        self,
+        backend: MemoryCache | DiskCache | None = None,
+        ttl: float = 24 * 60 * 60,
+    ):
+        """
+        :param backend: MemoryCache (default) or DiskCache
+        :param ttl: seconds a job's details are reused
+        """
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttl = ttl
+        self._stats = {site.value: {"hits": 0, "misses": 0} for site in Site}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(site: Site, job_id: str, description_format: str | None) -> str:
+        canonical = f"{site.value}\0{job_id}\0{description_format or ''}"
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, site: Site, job_id: str, description_format: str | None) -> Any:
+        """
+        :return: the cached details, None on a miss
+        """
+        details = None
+        value = self.backend.get(self.key(site, job_id, description_format))
+        if value is not None:
+            try:
+                details = loads_tagged(zlib.decompress(value))
+            except (ValueError, zlib.error):  # written by an older version
+                details = None
+        with self._lock:
+            self._stats[site.value]["hits" if details is not None else "misses"] += 1
+        return details
+
+    def set(
+        self, site: Site, job_id: str, description_format: str | None, details: Any
+    ) -> None:
+        """Stores details, unless they are what a failed fetch returns"""
+        if _is_empty(details):
+            return
+        value = zlib.compress(dumps_tagged(details))
+        self.backend.set(self.key(site, job_id, description_format), value, self.ttl)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            sites = {site: dict(counts) for site, counts in self._stats.items()}
+        hits = sum(counts["hits"] for counts in sites.values())
+        misses = sum(counts["misses"] for counts in sites.values())
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": len(self.backend),
+            "bytes": self.backend.size_bytes,
+            "sites": sites,
+        }
+
+
+_detail_cache: DetailCache | None = None
+
+
+def get_detail_cache() -> DetailCache | None:
+    """
+    :return: the process-wide detail cache, None until configure_detail_cache
+    """
+    return _detail_cache
+
+
+def configure_detail_cache(
+    path: str | None = None,
+    max_entries: int | None = None,
+    max_bytes: int | None = None,
+    ttl: float = 24 * 60 * 60,
+) -> DetailCache:
+    """
+    Replaces the process-wide detail cache the scrapers' detail fetchers read
+    through; there is none until this is called
+    :param path: SQLite file for a cache that survives restarts; in-memory if None
+    """
+    global _detail_cache
+    limits = {
+        name: value
+        for name, value in (("max_entries", max_entries), ("max_bytes", max_bytes))
+        if value is not None
+    }
+    backend = DiskCache(path, **limits) if path else MemoryCache(**limits)
+    with _cache_lock:
+        _detail_cache = DetailCache(backend, ttl=ttl)
+        return _detail_cache
+
+
+def _description_format(scraper: Scraper) -> str | None:
+    scraper_input = scraper.scraper_input
+    if scraper_input is None or scraper_input.description_format is None:
+        return None
+    return scraper_input.description_format.value
+
+
+def cached_details(scraper: Scraper, job_id: str, fetch: Callable[[], Any]) -> Any:
+    """
+    Reads a detail fetch through the detail cache, if one is configured
+    :param job_id: anything that identifies the job on scraper.site
+    :param fetch: downloads and parses the details on a miss
+    """
+    cache = get_detail_cache()
+    if cache is None:
+        return fetch()
+    description_format = _description_format(scraper)
+    details = cache.get(scraper.site, job_id, description_format)
+    if details is None:
+        details = fetch()
+        cache.set(scraper.site, job_id, description_format, details)
+    return details
+
+
+def cached_details_many(
+    scraper: Scraper,
+    job_ids: list[str],
+    fetch_many: Callable[[list[str]], dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    cached_details for a batch: fetch_many gets only the ids that missed and
+    returns their details by id
+    """
+    cache = get_detail_cache()
+    if cache is None:
+        return fetch_many(job_ids)
+    description_format = _description_format(scraper)
+    details = {}
+    for job_id in job_ids:
+        cached = cache.get(scraper.site, job_id, description_format)
+        if cached is not None:
+            details[job_id] = cached
+    missed = [job_id for job_id in job_ids if job_id not in details]
+    if missed:
+        fetched = fetch_many(missed)
+        for job_id, job_details in fetched.items():
+            cache.set(scraper.site, job_id, description_format, job_details)
+        details.update(fetched)
+    return details
+
+
+async def cached_details_async(
+    scraper: Scraper, job_id: str, fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """cached_details for a coroutine fetch"""
+    cache = get_detail_cache()
+    if cache is None:
+        return await fetch()
+    description_format = _description_format(scraper)
+    details = cache.get(scraper.site, job_id, description_format)
+    if details is None:
+        details = await fetch()
+        cache.set(scraper.site, job_id, description_format, details)
+    return details
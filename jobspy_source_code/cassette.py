@@ -0,0 +1,222 @@
+"""
+jobspy.cassette
+~~~~~~~~~~~~~~~
+
+Record / replay transport for the sessions create_session builds. Inside
+``use_cassette(path, mode="record")`` every request goes to the network and
+its response is saved to the cassette file; ``mode="replay"`` answers the same
+requests from the file without touching the network, so scrapers can be run
+and benchmarked offline and deterministically.
+
+Requests are matched on method, URL (query parameters sorted) and a hash of
+the body. Repeats of a request replay its recorded responses in order, the
+last one again once they run out.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# the body is stored decoded, so these no longer describe it
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CassetteMiss(Exception):
+    def __init__(self, key: str):
+        super().__init__(f"no recorded response for {key}")
+
+
+def _query_items(params) -> list[tuple[str, str]]:
+    if not params:
+        return []
+    items = params.items() if isinstance(params, dict) else params
+    query = []
+    for name, value in items:
+        values = value if isinstance(value, (list, tuple)) else [value]
+        # requests drops None-valued params
+        query += [(str(name), str(v)) for v in values if v is not None]
+    return query
+
+
+def _body_bytes(data=None, json_body=None) -> bytes:
+    if json_body is not None:
+        return json.dumps(json_body, sort_keys=True).encode()
+    if data is None:
+        return b""
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode()
+    return urlencode(_query_items(data)).encode()
+
+
+def request_key(
+    method: str,
+    url: str,
+    params=None,
+    data=None,
+    json_body=None,
+    match_host: bool = True,
+) -> str:
+    """
+    :return: the key a request is recorded and replayed under,
+        e.g. "GET https://www.bayt.com/en/jobs/?page=2"
+    """
+    parts = urlsplit(url)
+    query = sorted(
+        parse_qsl(parts.query, keep_blank_values=True) + _query_items(params)
+    )
+    target = parts.path + (f"?{urlencode(query)}" if query else "")
+    if match_host:
+        target = f"{parts.scheme}://{parts.netloc}{target}"
+    key = f"{method.upper()} {target}"
+    body = _body_bytes(data, json_body)
+    if body:
+        key += f" {hashlib.sha1(body).hexdigest()[:16]}"
+    return key
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    def __init__(self, path: str, mode: str = "replay", match_host: bool = True):
+        """
+        :param mode: "record" to send requests and save the responses,
+            "replay" to answer requests from the file
+        :param match_host: False matches requests on path, query and body only,
+            so responses recorded from a local mock board replay for the real site
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.match_host = match_host
+        self.requests = 0
+        # time spent sending requests (record) or looking them up (replay)
+        self.transport_seconds = 0.0
+        self._lock = threading.Lock()
+        self._interactions: dict[str, list[dict]] = {}
+        self._played: dict[str, int] = {}
+        if mode == "replay":
+            with _open(path, "r") as f:
+                for interaction in json.load(f)["interactions"]:
+                    self._interactions.setdefault(interaction["key"], []).append(
+                        interaction
+                    )
+
+    def play(self, method: str, url: str, kwargs: dict, send: Callable):
+        """
+        Answers a request from the cassette, or sends it with send() and
+        records the response
+        """
+        key = request_key(
+            method,
+            url,
+            kwargs.get("params"),
+            kwargs.get("data"),
+            kwargs.get("json"),
+            self.match_host,
+        )
+        start = time.perf_counter()
+        if self.mode == "replay":
+            response = self._replay(key)
+        else:
+            response = send()
+            self._record(key, method, url, response)
+        with self._lock:
+            self.transport_seconds += time.perf_counter() - start
+            self.requests += 1
+        return response
+
+    def _record(self, key: str, method: str, url: str, response) -> None:
+        interaction = {
+            "key": key,
+            "request": {"method": method.upper(), "url": url},
+            "response": {
+                "status": response.status_code,
+                "url": str(response.url),
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in _DROPPED_HEADERS
+                },
+                "body": response.text,
+            },
+        }
+        with self._lock:
+            self._interactions.setdefault(key, []).append(interaction)
+
+    def _replay(self, key: str) -> requests.Response:
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if not interactions:
+                raise CassetteMiss(key)
+            played = self._played.get(key, 0)
+            self._played[key] = played + 1
+        recorded = interactions[min(played, len(interactions) - 1)]["response"]
+
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.url = recorded["url"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response.encoding = "utf-8"
+        response._content = recorded["body"].encode("utf-8")
+        return response
+
+    def save(self) -> None:
+        with self._lock:
+            interactions = [
+                interaction
+                for recorded in self._interactions.values()
+                for interaction in recorded
+            ]
+        with _open(self.path, "w") as f:
+            json.dump({"interactions": interactions}, f, indent=1)
+
+
+_cassette: Cassette | None = None
+
+
+def get_cassette() -> Cassette | None:
+    return _cassette
+
+
+@contextmanager
+def use_cassette(path: str, mode: str = "replay", match_host: bool = True):
+    """
+    Routes every create_session session in the process through a cassette,
+    saving it on exit when recording
+    """
+    global _cassette
+    cassette = Cassette(path, mode=mode, match_host=match_host)
+    previous, _cassette = _cassette, cassette
+    try:
+        yield cassette
+    finally:
+        _cassette = previous
+        if mode == "record":
+            cassette.save()
+
+
+def play_request(method: str, url: str, kwargs: dict, send: Callable):
+    """
+    Sends the request, through the active cassette if there is one
+    """
+    cassette = _cassette
+    if cassette is None:
+        return send()
+    return cassette.play(method, url, kwargs, send)
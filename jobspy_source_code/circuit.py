@@ -0,0 +1,208 @@
+"""
+jobspy.circuit
+~~~~~~~~~~~~~~
+
+Process-wide circuit breaker per job board. Every request a scraper session
+sends is recorded against its site; once too many of a site's recent requests
+are blocked, throttled or fail outright the circuit opens and scrape_jobs skips
+that site straight away instead of bootstrapping a scraper to fail again. After
+a cool-down one search is let through (half-open): if its first request gets
+through the circuit closes, otherwise it opens again for twice as long.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+from jobspy.model import Site
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# blocked, throttled or the board is down
+FAILURE_STATUSES = (403, 429, 500, 502, 503, 504)
+
+
+class SiteCircuit:
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window: float = 60.0,
+        cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+    ):
+        """
+        :param failure_rate: share of the requests in the window that have to
+            fail for the circuit to open
+        :param min_requests: requests in the window before it can open at all
+        :param window: seconds of request outcomes considered
+        :param cooldown: seconds the circuit stays open before a trial search,
+            doubled every time the trial fails, up to max_cooldown
+        """
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.state = CLOSED
+        self.opened = 0
+        self.skipped = 0
+        self._cooldown = cooldown
+        self._open_until = 0.0
+        self._trial_started: float | None = None
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        :return: False if the site should be skipped
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and now >= self._open_until:
+                self.state = HALF_OPEN
+            # one trial search at a time, another if it never sent a request
+            if self.state == HALF_OPEN and (
+                self._trial_started is None
+                or now - self._trial_started >= self.base_cooldown
+            ):
+                self._trial_started = now
+                return True
+            self.skipped += 1
+            return False
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self.state == HALF_OPEN:
+                if ok:
+                    self._close()
+                else:
+                    self._open(now, self._cooldown * 2)
+                return
+            if self.state == OPEN:
+                # stragglers from searches that started before it opened
+                return
+            self._outcomes.append((now, ok))
+            while self._outcomes and self._outcomes[0][0] < now - self.window:
+                self._outcomes.popleft()
+            requests = len(self._outcomes)
+            failures = sum(not outcome for _, outcome in self._outcomes)
+            if (
+                requests >= self.min_requests
+                and failures >= self.failure_rate * requests
+            ):
+                self._open(now, self.base_cooldown)
+
+    def _open(self, now: float, cooldown: float) -> None:
+        self._cooldown = min(self.max_cooldown, cooldown)
+        self._open_until = now + self._cooldown
+        self._trial_started = None
+        self._outcomes.clear()
+        self.state = OPEN
+        self.opened += 1
+
+    def _close(self) -> None:
+        self._cooldown = self.base_cooldown
+        self._trial_started = None
+        self.state = CLOSED
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "recent_requests": len(self._outcomes),
+                "recent_failures": sum(not ok for _, ok in self._outcomes),
+                "opened": self.opened,
+                "skipped": self.skipped,
+                "open_seconds": round(max(0.0, self._open_until - time.monotonic()), 1),
+            }
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window: float = 60.0,
+        cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+        enabled: bool = True,
+    ):
+        """
+        :param enabled: False never skips a site
+        """
+        self.enabled = enabled
+        self._options = dict(
+            failure_rate=failure_rate,
+            min_requests=min_requests,
+            window=window,
+            cooldown=cooldown,
+            max_cooldown=max_cooldown,
+        )
+        self._circuits: dict[Site, SiteCircuit] = {}
+        self._lock = threading.Lock()
+
+    def circuit(self, site: Site) -> SiteCircuit:
+        with self._lock:
+            if site not in self._circuits:
+                self._circuits[site] = SiteCircuit(**self._options)
+            return self._circuits[site]
+
+    def allow(self, site: Site) -> bool:
+        if not self.enabled:
+            return True
+        return self.circuit(site).allow()
+
+    def record(self, site: Site | None, status_code: int | None) -> None:
+        """
+        Feeds a request outcome into the site's circuit
+        :param status_code: None for a request that failed to get a response
+        """
+        if not self.enabled or site is None:
+            return
+        ok = status_code is not None and status_code not in FAILURE_STATUSES
+        self.circuit(site).record(ok)
+
+    def stats(self) -> dict[str, dict]:
+        with self._lock:
+            circuits = dict(self._circuits)
+        return {site.value: circuit.stats() for site, circuit in circuits.items()}
+
+
+_circuit_breaker = CircuitBreaker()
+_circuit_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    return _circuit_breaker
+
+
+def configure_circuit_breaker(
+    failure_rate: float = 0.5,
+    min_requests: int = 10,
+    window: float = 60.0,
+    cooldown: float = 30.0,
+    max_cooldown: float = 600.0,
+    enabled: bool = True,
+) -> CircuitBreaker:
+    """
+    Replaces the process-wide circuit breaker, closing every circuit
+    """
+    global _circuit_breaker
+    with _circuit_breaker_lock:
+        _circuit_breaker = CircuitBreaker(
+            failure_rate=failure_rate,
+            min_requests=min_requests,
+            window=window,
+            cooldown=cooldown,
+            max_cooldown=max_cooldown,
+            enabled=enabled,
+        )
+    return _circuit_breaker
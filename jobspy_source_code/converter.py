@@ -0,0 +1,152 @@
+"""
+jobspy.converter
+~~~~~~~~~~~~~~~~
+
+Description HTML -> markdown / plain text conversion. markdownify and
+BeautifulSoup are pure Python, so conversions running on the scraper threads
+serialize on the GIL. configure_converter(workers=n) moves them onto a process
+pool, batched per results page where the scraper has a page of descriptions at
+once (Indeed's 100 per GraphQL page).
+
+The pool is off by default: it starts worker processes with the spawn method,
+which re-imports the caller's __main__ and so needs an
+``if __name__ == "__main__":`` guard in scripts.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+
+from jobspy.metrics import DESCRIPTION_CONVERSION, timed
+from jobspy.model import DescriptionFormat
+from jobspy.profiling import phase
+from jobspy.util import create_logger, markdown_converter, plain_converter
+
+log = create_logger("Converter")
+
+CONVERTERS = {
+    DescriptionFormat.MARKDOWN: markdown_converter,
+    DescriptionFormat.PLAIN: plain_converter,
+}
+
+
+def _convert(description_html: str | None, description_format: DescriptionFormat):
+    converter = CONVERTERS.get(description_format)
+    if converter is None or description_html is None:
+        return description_html
+    return converter(description_html)
+
+
+def _convert_batch(
+    descriptions: list[str | None], description_format: DescriptionFormat
+) -> list[str | None]:
+    return [_convert(html, description_format) for html in descriptions]
+
+
+class DescriptionConverter:
+    def __init__(self, workers: int = 0, chunk_size: int = 16):
+        """
+        :param workers: worker processes; 0 converts inline on the calling thread
+        :param chunk_size: descriptions sent to a worker per task
+        """
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor = (
+            ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            if workers
+            else None
+        )
+
+    def convert(
+        self, description_html: str | None, description_format: DescriptionFormat
+    ) -> str | None:
+        if (
+            self._executor is None
+            or description_html is None
+            or description_format not in CONVERTERS
+        ):
+            return _convert(description_html, description_format)
+        try:
+            return self._executor.submit(
+                _convert, description_html, description_format
+            ).result()
+        except BrokenProcessPool:
+            log.warning("converter pool is broken, converting inline")
+            return _convert(description_html, description_format)
+
+    def convert_many(
+        self, descriptions: list[str | None], description_format: DescriptionFormat
+    ) -> list[str | None]:
+        if self._executor is None or description_format not in CONVERTERS:
+            return _convert_batch(descriptions, description_format)
+        chunks = [
+            descriptions[i : i + self.chunk_size]
+            for i in range(0, len(descriptions), self.chunk_size)
+        ]
+        try:
+            converted = self._executor.map(
+                _convert_batch, chunks, repeat(description_format)
+            )
+            return [description for chunk in converted for description in chunk]
+        except BrokenProcessPool:
+            log.warning("converter pool is broken, converting inline")
+            return _convert_batch(descriptions, description_format)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_converter = DescriptionConverter()
+_converter_lock = threading.Lock()
+
+
+def get_converter() -> DescriptionConverter:
+    return _converter
+
+
+def configure_converter(workers: int = 0, chunk_size: int = 16) -> DescriptionConverter:
+    """
+    Replaces the process-wide description converter
+    :param workers: worker processes for conversion, 0 to convert inline
+    """
+    global _converter
+    with _converter_lock:
+        previous = _converter
+        _converter = DescriptionConverter(workers=workers, chunk_size=chunk_size)
+    previous.shutdown()
+    return _converter
+
+
+def convert_description(
+    description_html: str | None, description_format: DescriptionFormat
+) -> str | None:
+    """
+    Converts one description to description_format (HTML passes through)
+    """
+    with phase("convert"), timed(
+        DESCRIPTION_CONVERSION, format=_format_label(description_format)
+    ):
+        return _converter.convert(description_html, description_format)
+
+
+def convert_descriptions(
+    descriptions: list[str | None], description_format: DescriptionFormat
+) -> list[str | None]:
+    """
+    Converts a page of descriptions, in order, in chunks across the pool
+    """
+    with phase("convert"), timed(
+        DESCRIPTION_CONVERSION, format=_format_label(description_format)
+    ):
+        return _converter.convert_many(descriptions, description_format)
+
+
+def _format_label(description_format: DescriptionFormat | None) -> str:
+    return description_format.value if description_format else "none"
@@ -3,21 +3,25 @@ from __future__ import annotations
 import re
 import json
 import requests
-from typing import Tuple
+from contextlib import closing
+from typing import Any, Callable, Tuple
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from jobspy.cache import cached_details, cached_details_many
+from jobspy.converter import convert_description, convert_descriptions
+from jobspy.glassdoor.bootstrap import get_bootstrap_cache
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
     get_cursor_for_page,
     parse_compensation,
     parse_location,
 )
+from jobspy.pipeline import paginate
+from jobspy.scheduler import get_scheduler
 from jobspy.util import (
     extract_emails_from_text,
     create_logger,
     create_session,
-    markdown_converter,
 )
 from jobspy.exception import GlassdoorException
 from jobspy.model import (
@@ -33,6 +37,9 @@ log = create_logger("Glassdoor")
 
 
 class Glassdoor(Scraper):
+    # JobDetailQuery operations sent together in one /graph request
+    description_batch_size = 10
+
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
     ):
@@ -45,6 +52,7 @@ class Glassdoor(Scraper):
         self.base_url = None
         self.country = None
         self.session = None
+        self.token_key = None
         self.scraper_input = None
         self.jobs_per_page = 30
         self.max_pages = 30
@@ -58,16 +66,7 @@ class Glassdoor(Scraper):
         """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
-        self.base_url = self.scraper_input.country.get_glassdoor_url()
-
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
-        )
-        token = self._get_csrf_token()
-        headers["gd-csrf-token"] = token if token else fallback_token
-        if self.user_agent:
-            headers["user-agent"] = self.user_agent
-        self.session.headers.update(headers)
+        self._setup_session()
 
         location_id, location_type = self._get_location(
             scraper_input.location, scraper_input.is_remote
@@ -76,46 +75,58 @@ class Glassdoor(Scraper):
             log.error("Glassdoor: location not parsed")
             return JobResponse(jobs=[])
         job_list: list[JobPost] = []
-        cursor = None
 
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
         tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
         range_end = min(tot_pages, self.max_pages + 1)
-        for page in range(range_start, range_end):
-            log.info(f"search page: {page} / {range_end - 1}")
-            try:
-                jobs, cursor = self._fetch_jobs_page(
-                    scraper_input, location_id, location_type, page, cursor
-                )
-                job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
-                    job_list = job_list[: scraper_input.results_wanted]
+        # the next page is requested while this one's descriptions are fetched
+        pages = paginate(
+            lambda page: self._fetch_jobs_page(location_id, location_type, *page),
+            cursor=(range_start, None),
+            max_pages=range_end - range_start,
+            wanted=scraper_input.results_wanted,
+            deadline=scraper_input.deadline,
+        )
+        with closing(pages):
+            for page, jobs_data in enumerate(pages, range_start):
+                log.info(f"search page: {page} / {range_end - 1}")
+                try:
+                    jobs = self._process_jobs_page(jobs_data)
+                    job_list.extend(jobs)
+                    self._publish(job_list)
+                    if (
+                        not jobs
+                        or len(job_list) >= scraper_input.results_wanted
+                        or self._page_all_known(jobs)
+                    ):
+                        job_list = job_list[: scraper_input.results_wanted]
+                        break
+                except Exception as e:
+                    log.error(f"Glassdoor: {str(e)}")
+                    break
+                if self._deadline_reached():
                     break
-            except Exception as e:
-                log.error(f"Glassdoor: {str(e)}")
-                break
         return JobResponse(jobs=job_list)
 
     def _fetch_jobs_page(
         self,
-        scraper_input: ScraperInput,
         location_id: int,
         location_type: str,
         page_num: int,
         cursor: str | None,
-    ) -> Tuple[list[JobPost], str | None]:
+    ) -> Tuple[list[dict], Tuple[int, str | None] | None]:
         """
-        Scrapes a page of Glassdoor for jobs with scraper_input criteria
+        Requests a page of Glassdoor search results
+        :return: the page's job listings and the next page's (number, cursor),
+            None if the request failed
         """
-        jobs = []
-        self.scraper_input = scraper_input
         try:
             payload = self._add_payload(location_id, location_type, page_num, cursor)
-            response = self.session.post(
-                f"{self.base_url}/graph",
-                timeout_seconds=15,
-                data=payload,
-            )
+            response = self._post_search(payload)
+            if response.status_code in (401, 403):
+                # the cached token may have been revoked before its TTL ran out
+                self._refresh_csrf_token()
+                response = self._post_search(payload)
             if response.status_code != 200:
                 exc_msg = f"bad response status code: {response.status_code}"
                 raise GlassdoorException(exc_msg)
@@ -129,31 +140,118 @@ class Glassdoor(Scraper):
             Exception,
         ) as e:
             log.error(f"Glassdoor: {str(e)}")
-            return jobs, None
+            return [], None
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
+        next_cursor = get_cursor_for_page(
+            res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
+        )
+        return jobs_data, (page_num + 1, next_cursor)
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
-            }
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+    def _process_jobs_page(self, jobs_data: list[dict]) -> list[JobPost]:
+        """
+        Converts a page of job listings, with their descriptions fetched in batches
+        """
+        jobs = []
+        descriptions = {}
+        if self._should_fetch_details():
+            job_ids = [job["jobview"]["job"]["listingId"] for job in jobs_data]
+            new_ids = [i for i in job_ids if self._job_url(i) not in self.seen_urls]
+            descriptions = self._fetch_job_descriptions(new_ids)
+        for job in jobs_data:
+            try:
+                job_post = self._process_job(job, descriptions)
+                if job_post:
+                    jobs.append(job_post)
+            except Exception as exc:
+                raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+        return jobs
 
-        return jobs, get_cursor_for_page(
-            res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
+    def _post_search(self, payload: str):
+        return self.session.post(
+            f"{self.base_url}/graph",
+            timeout_seconds=15,
+            data=payload,
         )
 
-    def _get_csrf_token(self):
+    def _setup_session(self):
+        """
+        Creates the session for the country's Glassdoor domain with a csrf token,
+        reused from the bootstrap cache while it's fresh
+        """
+        self.base_url = self.scraper_input.country.get_glassdoor_url()
+        # the csrf token is tied to the address it was fetched from, so it's
+        # cached per proxy and the session sticks to that proxy
+        self.session = create_session(
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            has_retry=True,
+            site=self.site,
+            pin_proxy=True,
+        )
+        proxy_pool = self.session.proxy_pool
+        self.token_key = (self.base_url, proxy_pool.choose() if proxy_pool else None)
+        token = get_bootstrap_cache().token(
+            self.token_key,
+            self._get_csrf_token,
+            self._refresher(self._get_csrf_token),
+        )
+        self._set_csrf_token(token)
+
+    def _refresh_csrf_token(self):
+        """Replaces a token the site rejected, in the cache and on the session"""
+        bootstrap_cache = get_bootstrap_cache()
+        bootstrap_cache.invalidate_token(self.token_key)
+        token = bootstrap_cache.token(self.token_key, self._get_csrf_token)
+        self._set_csrf_token(token)
+
+    def _set_csrf_token(self, token: str | None):
+        # the module's headers are shared by every scraper, the token isn't
+        session_headers = {**headers, "gd-csrf-token": token or fallback_token}
+        if self.user_agent:
+            session_headers["user-agent"] = self.user_agent
+        self.session.headers.update(session_headers)
+
+    def _refresher(self, fetch: Callable[[Any], Any]) -> Callable[[], Any]:
+        """
+        fetch(session) for the bootstrap cache's background refresh, which gets
+        a session of its own on this scraper's proxy, since the scrape keeps
+        using self.session while the refresh runs
+        """
+        proxy = self.token_key[1]
+        session_headers = dict(self.session.headers)
+
+        def refresh():
+            session = create_session(
+                proxies=proxy,
+                ca_cert=self.ca_cert,
+                has_retry=True,
+                site=self.site,
+                pin_proxy=True,
+            )
+            session.headers.update(session_headers)
+            return fetch(session)
+
+        return refresh
+
+    def prepare_details(self, scraper_input: ScraperInput) -> None:
+        self.scraper_input = scraper_input
+        self._setup_session()
+
+    def fetch_job_details(self, job_key: str) -> dict:
+        """
+        :param job_key: Glassdoor listing id without the gd- prefix
+        :return: dict
+        """
+        return {"description": self._fetch_job_description(int(job_key))}
+
+    def _get_csrf_token(self, session=None):
         """
         Fetches csrf token needed for API by visiting a generic page
+        :param session: self.session if None
         """
-        res = self.session.get(f"{self.base_url}/Job/computer-science-jobs.htm")
+        session = session or self.session
+        res = session.get(f"{self.base_url}/Job/computer-science-jobs.htm")
         pattern = r'"token":\s*"([^"]+)"'
         matches = re.findall(pattern, res.text)
         token = None
@@ -161,12 +259,16 @@ class Glassdoor(Scraper):
             token = matches[0]
         return token
 
-    def _process_job(self, job_data):
+    def _job_url(self, job_id) -> str:
+        return f"{self.base_url}job-listing/j?jl={job_id}"
+
+    def _process_job(self, job_data, descriptions: dict):
         """
-        Processes a single job and fetches its description.
+        Processes a single job
+        :param descriptions: the page's descriptions by listing id
         """
         job_id = job_data["jobview"]["job"]["listingId"]
-        job_url = f"{self.base_url}job-listing/j?jl={job_id}"
+        job_url = self._job_url(job_id)
         if job_url in self.seen_urls:
             return None
         self.seen_urls.add(job_url)
@@ -187,10 +289,7 @@ class Glassdoor(Scraper):
             location = parse_location(location_name)
 
         compensation = parse_compensation(job["header"])
-        try:
-            description = self._fetch_job_description(job_id)
-        except:
-            description = None
+        description = descriptions.get(job_id)
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
         company_logo = (
             job_data["jobview"].get("overview", {}).get("squareLogoUrl", None)
@@ -219,47 +318,135 @@ class Glassdoor(Scraper):
 
     def _fetch_job_description(self, job_id):
         """
-        Fetches the job description for a single job ID.
+        Fetches the job description for a single job ID, read through the
+        detail cache
         """
+        return cached_details(
+            self, str(job_id), lambda: self._request_job_description(job_id)
+        )
+
+    def _request_job_description(self, job_id):
         url = f"{self.base_url}/graph"
-        body = [
-            {
-                "operationName": "JobDetailQuery",
-                "variables": {
-                    "jl": job_id,
-                    "queryString": "q",
-                    "pageTypeEnum": "SERP",
-                },
-                "query": """
-                query JobDetailQuery($jl: Long!, $queryString: String, $pageTypeEnum: PageTypeEnum) {
-                    jobview: jobView(
-                        listingId: $jl
-                        contextHolder: {queryString: $queryString, pageTypeEnum: $pageTypeEnum}
-                    ) {
-                        job {
-                            description
-                            __typename
-                        }
-                        __typename
-                    }
-                }
-                """,
-            }
-        ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.session.post(url, json=[self._job_detail_operation(job_id)])
         if res.status_code != 200:
             return None
         data = res.json()[0]
         desc = data["data"]["jobview"]["job"]["description"]
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            desc = markdown_converter(desc)
+            desc = convert_description(desc, DescriptionFormat.MARKDOWN)
         return desc
 
+    def _fetch_job_descriptions(self, job_ids: list[int]) -> dict:
+        """
+        Fetches the descriptions of a page of listings, read through the detail
+        cache, description_batch_size JobDetailQuery operations per request
+        :return: description by listing id, missing where the fetch failed
+        """
+        descriptions = cached_details_many(
+            self, [str(job_id) for job_id in job_ids], self._request_job_descriptions
+        )
+        return {int(job_id): desc for job_id, desc in descriptions.items()}
+
+    def _request_job_descriptions(self, job_ids: list[str]) -> dict[str, str]:
+        """
+        Sends the batches concurrently on the shared worker pool; a batch that
+        fails is retried one listing per request
+        """
+        scheduler = get_scheduler()
+        size = self.description_batch_size
+        batches = [job_ids[i : i + size] for i in range(0, len(job_ids), size)]
+        futures = [
+            scheduler.submit(self.site, self._request_description_batch, batch)
+            for batch in batches
+        ]
+        descriptions = {}
+        for batch, future in zip(batches, futures):
+            try:
+                descriptions.update(future.result())
+                continue
+            except Exception as e:
+                log.warning(f"Glassdoor: description batch failed ({e}), retrying")
+            singles = {
+                job_id: scheduler.submit(
+                    self.site, self._request_job_description, int(job_id)
+                )
+                for job_id in batch
+            }
+            for job_id, single in singles.items():
+                try:
+                    descriptions[job_id] = single.result()
+                except Exception as e:
+                    log.warning(f"Glassdoor: description of {job_id} failed: {e}")
+        return {
+            job_id: description
+            for job_id, description in descriptions.items()
+            if description
+        }
+
+    def _request_description_batch(self, job_ids: list[str]) -> dict[str, str]:
+        """
+        One /graph request with a JobDetailQuery operation per listing
+        :return: description by listing id, without the listings that errored
+        """
+        res = self.session.post(
+            f"{self.base_url}/graph",
+            json=[self._job_detail_operation(int(job_id)) for job_id in job_ids],
+        )
+        if res.status_code != 200:
+            raise GlassdoorException(f"bad response status code: {res.status_code}")
+        results = res.json()
+        if not isinstance(results, list) or len(results) != len(job_ids):
+            raise GlassdoorException("batched operations not supported")
+        found = {}
+        for job_id, result in zip(job_ids, results):
+            try:
+                found[job_id] = result["data"]["jobview"]["job"]["description"]
+            except (KeyError, TypeError):
+                continue
+        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            converted = convert_descriptions(
+                list(found.values()), DescriptionFormat.MARKDOWN
+            )
+            found = dict(zip(found, converted))
+        return found
+
+    @staticmethod
+    def _job_detail_operation(job_id: int) -> dict:
+        return {
+            "operationName": "JobDetailQuery",
+            "variables": {
+                "jl": job_id,
+                "queryString": "q",
+                "pageTypeEnum": "SERP",
+            },
+            "query": """
+            query JobDetailQuery($jl: Long!, $queryString: String, $pageTypeEnum: PageTypeEnum) {
+                jobview: jobView(
+                    listingId: $jl
+                    contextHolder: {queryString: $queryString, pageTypeEnum: $pageTypeEnum}
+                ) {
+                    job {
+                        description
+                        __typename
+                    }
+                    __typename
+                }
+            }
+            """,
+        }
+
     def _get_location(self, location: str, is_remote: bool) -> (int, str):
         if not location or is_remote:
             return "11047", "STATE"  # remote options
+        return get_bootstrap_cache().location(
+            (self.base_url, location.strip().lower()),
+            lambda: self._request_location(location),
+            self._refresher(lambda session: self._request_location(location, session)),
+        )
+
+    def _request_location(self, location: str, session=None) -> (int, str):
         url = f"{self.base_url}/findPopularLocationAjax.htm?maxLocationsToReturn=10&term={location}"
-        res = self.session.get(url)
+        res = (session or self.session).get(url)
         if res.status_code != 200:
             if res.status_code == 429:
                 err = f"429 Response - Blocked by Glassdoor for too many requests"
@@ -0,0 +1,151 @@
+"""
+jobspy.glassdoor.bootstrap
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Process-wide cache of what every Glassdoor scrape fetches before its first
+results page: the csrf token, per country domain and proxy (the token is tied
+to the address it was fetched from), and the location lookup, per domain and
+location string. An entry past refresh_after of its TTL is still served while
+a background thread fetches its replacement, so a scrape only waits on these
+round trips the first time. The replacement is fetched with the refresh
+callable the caller passes, which must not use a session the caller's scrape
+is still using. Scrapes that miss the same entry at once share one fetch.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+from jobspy.singleflight import SingleFlight
+from jobspy.util import create_logger
+
+log = create_logger("Glassdoor")
+
+
+class BootstrapCache:
+    def __init__(
+        self,
+        token_ttl: float = 30 * 60,
+        location_ttl: float = 24 * 60 * 60,
+        refresh_after: float = 0.75,
+    ):
+        """
+        :param token_ttl: seconds a csrf token is reused
+        :param location_ttl: seconds a location lookup is reused
+        :param refresh_after: share of the TTL after which an entry is
+            refreshed in the background
+        """
+        self.ttls = {"token": token_ttl, "location": location_ttl}
+        self.refresh_after = refresh_after
+        self._entries: dict[tuple[str, Hashable], tuple[float, Any]] = {}
+        self._refreshing: set[tuple[str, Hashable]] = set()
+        self._stats = {kind: {"hits": 0, "misses": 0} for kind in self.ttls}
+        self._lock = threading.Lock()
+        self._flight = SingleFlight(counter=None)
+
+    def token(
+        self,
+        key: Hashable,
+        fetch: Callable[[], str | None],
+        refresh: Callable[[], str | None] | None = None,
+    ) -> str | None:
+        """
+        :param key: (base url, proxy) the token is for
+        :param fetch: gets a fresh token, None if it couldn't
+        :param refresh: fetch for the background refresh, on its own session;
+            without one the entry is only fetched again once it expires
+        """
+        return self._get("token", key, fetch, refresh)
+
+    def location(
+        self,
+        key: Hashable,
+        fetch: Callable[[], tuple[int | None, str | None]],
+        refresh: Callable[[], tuple[int | None, str | None]] | None = None,
+    ) -> tuple[int | None, str | None]:
+        """
+        :param key: (base url, location string)
+        :param fetch: looks the location up, (None, None) if it couldn't
+        :param refresh: as for token()
+        """
+        return self._get("location", key, fetch, refresh)
+
+    def invalidate_token(self, key: Hashable) -> None:
+        """Drops a token the site has rejected"""
+        with self._lock:
+            self._entries.pop(("token", key), None)
+
+    def _get(
+        self,
+        kind: str,
+        key: Hashable,
+        fetch: Callable[[], Any],
+        refresh_fetch: Callable[[], Any] | None,
+    ) -> Any:
+        entry_key = (kind, key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and now - entry[0] >= self.ttls[kind]:
+                entry = None
+            self._stats[kind]["hits" if entry is not None else "misses"] += 1
+            refresh = (
+                entry is not None
+                and refresh_fetch is not None
+                and now - entry[0] >= self.refresh_after * self.ttls[kind]
+                and entry_key not in self._refreshing
+            )
+            if refresh:
+                self._refreshing.add(entry_key)
+        if entry is None:
+            value, _, _ = self._flight.do(
+                entry_key, lambda: self._fetch(entry_key, fetch)
+            )
+            return value
+        if refresh:
+            threading.Thread(
+                target=self._refresh,
+                args=(entry_key, refresh_fetch),
+                name="jobspy-glassdoor-refresh",
+                daemon=True,
+            ).start()
+        return entry[1]
+
+    def _fetch(self, entry_key: tuple[str, Hashable], fetch: Callable[[], Any]) -> Any:
+        value = fetch()
+        # failed lookups are retried on the next scrape instead of cached
+        if value and (not isinstance(value, tuple) or any(value)):
+            with self._lock:
+                self._entries[entry_key] = (time.monotonic(), value)
+        return value
+
+    def _refresh(self, entry_key: tuple[str, Hashable], fetch: Callable[[], Any]):
+        try:
+            self._fetch(entry_key, fetch)
+        except Exception as e:
+            log.warning(f"Glassdoor: refreshing {entry_key[0]} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(entry_key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                kind: {**counts, "entries": 0} for kind, counts in self._stats.items()
+            }
+            for kind, _ in self._entries:
+                stats[kind]["entries"] += 1
+        return stats
+
+
+_bootstrap_cache = BootstrapCache()
+
+
+def get_bootstrap_cache() -> BootstrapCache:
+    return _bootstrap_cache
@@ -3,10 +3,12 @@ from __future__ import annotations
 import math
 import re
 import json
+from contextlib import closing
 from typing import Tuple
 from datetime import datetime, timedelta
 
 from jobspy.google.constant import headers_jobs, headers_initial, async_param
+from jobspy.pipeline import paginate
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -21,6 +23,9 @@ from jobspy.google.util import log, find_job_info_initial_page, find_job_info
 
 
 class Google(Scraper):
+    url = "https://www.google.com/search"
+    jobs_url = "https://www.google.com/async/callback:550"
+
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
     ):
@@ -35,8 +40,6 @@ class Google(Scraper):
         self.scraper_input = None
         self.jobs_per_page = 10
         self.seen_urls = set()
-        self.url = "https://www.google.com/search"
-        self.jobs_url = "https://www.google.com/async/callback:550"
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -48,9 +51,14 @@ class Google(Scraper):
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            site=self.site,
         )
         forward_cursor, job_list = self._get_initial_cursor_and_jobs()
+        self._publish(job_list, scraper_input.offset)
         if forward_cursor is None:
             log.warning(
                 "initial cursor not found, try changing your query or there was at most 10 results"
@@ -58,24 +66,37 @@ class Google(Scraper):
             return JobResponse(jobs=job_list)
 
         page = 1
-
-        while (
-            len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
-            and forward_cursor
-        ):
-            log.info(
-                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
-            )
-            try:
-                jobs, forward_cursor = self._get_jobs_next_page(forward_cursor)
-            except Exception as e:
-                log.error(f"failed to get jobs on page: {page}, {e}")
-                break
-            if not jobs:
-                log.info(f"found no jobs on page: {page}")
-                break
-            job_list += jobs
-            page += 1
+        wanted = scraper_input.results_wanted + scraper_input.offset
+
+        # the next page is requested while this one is parsed; its jobs can
+        # only be counted once parsed, so pages are assumed full
+        pages = paginate(
+            self._fetch_next_page,
+            cursor=forward_cursor,
+            wanted=wanted - len(self.seen_urls),
+            count=lambda _: self.jobs_per_page,
+            deadline=scraper_input.deadline,
+        )
+        with closing(pages):
+            while len(self.seen_urls) < wanted and not self._deadline_reached():
+                log.info(
+                    f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+                )
+                try:
+                    jobs, _ = self._parse_jobs(next(pages))
+                except StopIteration:
+                    break
+                except Exception as e:
+                    log.error(f"failed to get jobs on page: {page}, {e}")
+                    break
+                if not jobs:
+                    log.info(f"found no jobs on page: {page}")
+                    break
+                job_list += jobs
+                self._publish(job_list, scraper_input.offset)
+                if self._page_all_known(jobs):
+                    break
+                page += 1
         return JobResponse(
             jobs=job_list[
                 scraper_input.offset : scraper_input.offset
@@ -85,6 +106,12 @@ class Google(Scraper):
 
     def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobPost]]:
         """Gets initial cursor and jobs to paginate through job listings"""
+        params = self._initial_params()
+        response = self.session.get(self.url, headers=headers_initial, params=params)
+        return self._parse_initial_page(response.text)
+
+    def _initial_params(self) -> dict:
+        """Builds the search query params for the first results page"""
         query = f"{self.scraper_input.search_term} jobs"
 
         def get_time_range(hours_old):
@@ -120,13 +147,14 @@ class Google(Scraper):
         if self.scraper_input.google_search_term:
             query = self.scraper_input.google_search_term
 
-        params = {"q": query, "udm": "8"}
-        response = self.session.get(self.url, headers=headers_initial, params=params)
+        return {"q": query, "udm": "8"}
 
+    def _parse_initial_page(self, html: str) -> Tuple[str, list[JobPost]]:
+        """Parses the first results page for jobs and the next page cursor"""
         pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
-        match_fc = re.search(pattern_fc, response.text)
+        match_fc = re.search(pattern_fc, html)
         data_async_fc = match_fc.group(1) if match_fc else None
-        jobs_raw = find_job_info_initial_page(response.text)
+        jobs_raw = find_job_info_initial_page(html)
         jobs = []
         for job_raw in jobs_raw:
             job_post = self._parse_job(job_raw)
@@ -134,10 +162,20 @@ class Google(Scraper):
                 jobs.append(job_post)
         return data_async_fc, jobs
 
-    def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[list[JobPost], str]:
-        params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
+    def _fetch_next_page(self, forward_cursor: str) -> Tuple[str, str | None]:
+        """Requests a results page, returns its body and the next page cursor"""
+        params = self._next_page_params(forward_cursor)
         response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
-        return self._parse_jobs(response.text)
+        return response.text, self._next_cursor(response.text)
+
+    @staticmethod
+    def _next_cursor(job_data: str) -> str | None:
+        match_fc = re.search(r'data-async-fc="([^"]+)"', job_data)
+        return match_fc.group(1) if match_fc else None
+
+    @staticmethod
+    def _next_page_params(forward_cursor: str) -> dict:
+        return {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
 
     def _parse_jobs(self, job_data: str) -> Tuple[list[JobPost], str]:
         """
@@ -148,9 +186,7 @@ class Google(Scraper):
         s = job_data[start_idx:end_idx]
         parsed = json.loads(s)[0]
 
-        pattern_fc = r'data-async-fc="([^"]+)"'
-        match_fc = re.search(pattern_fc, job_data)
-        data_async_fc = match_fc.group(1) if match_fc else None
+        data_async_fc = self._next_cursor(job_data)
         jobs_on_page = []
         for array in parsed:
             _, job_data = array
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import math
+from contextlib import closing
 from datetime import datetime
 from typing import Tuple
 
+from jobspy.converter import convert_descriptions
 from jobspy.indeed.constant import job_search_query, api_headers
 from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
+from jobspy.pipeline import paginate
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -18,7 +21,6 @@ from jobspy.model import (
 )
 from jobspy.util import (
     extract_emails_from_text,
-    markdown_converter,
     create_session,
     create_logger,
 )
@@ -27,6 +29,8 @@ log = create_logger("Indeed")
 
 
 class Indeed(Scraper):
+    api_url = "https://apis.indeed.com/graphql"
+
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
     ):
@@ -36,7 +40,7 @@ class Indeed(Scraper):
         super().__init__(Site.INDEED, proxies=proxies)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=ca_cert, is_tls=False
+            proxies=self.proxies, ca_cert=ca_cert, is_tls=False, site=self.site
         )
         self.scraper_input = None
         self.jobs_per_page = 100
@@ -45,7 +49,6 @@ class Indeed(Scraper):
         self.headers = None
         self.api_country_code = None
         self.base_url = None
-        self.api_url = "https://apis.indeed.com/graphql"
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -53,26 +56,32 @@ class Indeed(Scraper):
         :param scraper_input:
         :return: job_response
         """
-        self.scraper_input = scraper_input
-        domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
-        self.base_url = f"https://{domain}.indeed.com"
-        self.headers = api_headers.copy()
-        self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
+        self._setup(scraper_input)
         job_list = []
-        page = 1
-
-        cursor = None
+        wanted = scraper_input.results_wanted + scraper_input.offset
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
-            log.info(
-                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
-            )
-            jobs, cursor = self._scrape_page(cursor)
-            if not jobs:
-                log.info(f"found no jobs on page: {page}")
-                break
-            job_list += jobs
-            page += 1
+        # the next page is requested while this one's descriptions are converted
+        pages = paginate(
+            self._fetch_page,
+            wanted=wanted,
+            count=lambda data: len(data["data"]["jobSearch"]["results"]) if data else 0,
+            deadline=scraper_input.deadline,
+        )
+        with closing(pages):
+            for page, data in enumerate(pages, 1):
+                log.info(
+                    f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+                )
+                jobs = self._parse_page(data)[0] if data else []
+                if not jobs:
+                    log.info(f"found no jobs on page: {page}")
+                    break
+                job_list += jobs
+                self._publish(job_list, scraper_input.offset)
+                if self._page_all_known(jobs):
+                    break
+                if len(self.seen_urls) >= wanted or self._deadline_reached():
+                    break
         return JobResponse(
             jobs=job_list[
                 scraper_input.offset : scraper_input.offset
@@ -80,14 +89,41 @@ class Indeed(Scraper):
             ]
         )
 
-    def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
+    def _setup(self, scraper_input: ScraperInput):
+        self.scraper_input = scraper_input
+        domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
+        self.base_url = f"https://{domain}.indeed.com"
+        self.headers = api_headers.copy()
+        self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
+
+    def _fetch_page(self, cursor: str | None) -> Tuple[dict | None, str | None]:
         """
-        Scrapes a page of Indeed for jobs with scraper_input criteria
+        Requests a page of Indeed search results
         :param cursor:
-        :return: jobs found on page, next page cursor
+        :return: the GraphQL response (None if the request failed), next page cursor
+        """
+        payload, headers = self._build_page_request(cursor)
+        response = self.session.post(
+            self.api_url,
+            headers=headers,
+            json=payload,
+            timeout=10,
+            verify=False,
+        )
+        if not response.ok:
+            log.info(
+                f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
+            )
+            return None, None
+        data = response.json()
+        return data, data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
+
+    def _build_page_request(self, cursor: str | None) -> Tuple[dict, dict]:
+        """
+        Builds the GraphQL search payload and headers for a page
+        :param cursor:
+        :return: payload, headers
         """
-        jobs = []
-        new_cursor = None
         filters = self._build_filters()
         search_term = (
             self.scraper_input.search_term.replace('"', '\\"')
@@ -110,25 +146,36 @@ class Indeed(Scraper):
         }
         api_headers_temp = api_headers.copy()
         api_headers_temp["indeed-co"] = self.api_country_code
-        response = self.session.post(
-            self.api_url,
-            headers=api_headers_temp,
-            json=payload,
-            timeout=10,
-            verify=False,
-        )
-        if not response.ok:
-            log.info(
-                f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
-            )
-            return jobs, new_cursor
-        data = response.json()
-        jobs = data["data"]["jobSearch"]["results"]
+        return payload, api_headers_temp
+
+    def _parse_page(self, data: dict) -> Tuple[list[JobPost], str | None]:
+        """
+        Parses a GraphQL search response
+        :param data:
+        :return: jobs found on page, next page cursor
+        """
+        jobs = []
+        page_urls = set()
+        # jobs seen on an earlier page (or twice on this one) aren't converted
+        for result in data["data"]["jobSearch"]["results"]:
+            job_url = self._job_url(result["job"])
+            if job_url not in self.seen_urls and job_url not in page_urls:
+                page_urls.add(job_url)
+                jobs.append(result["job"])
         new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
 
+        # the whole page is converted in one batch, see jobspy.converter
+        description_format = (
+            DescriptionFormat.MARKDOWN
+            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN
+            else DescriptionFormat.HTML
+        )
+        descriptions = convert_descriptions(
+            [job["description"]["html"] for job in jobs], description_format
+        )
         job_list = []
-        for job in jobs:
-            processed_job = self._process_job(job["job"])
+        for job, description in zip(jobs, descriptions):
+            processed_job = self._process_job(job, description)
             if processed_job:
                 job_list.append(processed_job)
 
@@ -192,19 +239,20 @@ class Indeed(Scraper):
                 """
         return filters_str
 
-    def _process_job(self, job: dict) -> JobPost | None:
+    def _job_url(self, job: dict) -> str:
+        return f'{self.base_url}/viewjob?jk={job["key"]}'
+
+    def _process_job(self, job: dict, description: str | None) -> JobPost | None:
         """
         Parses the job dict into JobPost model
         :param job: dict to parse
+        :param description: the job's description, already converted
         :return: JobPost if it's a new job
         """
-        job_url = f'{self.base_url}/viewjob?jk={job["key"]}'
+        job_url = self._job_url(job)
         if job_url in self.seen_urls:
             return
         self.seen_urls.add(job_url)
-        description = job["description"]["html"]
-        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
 
         job_type = get_job_type(job["attributes"])
         timestamp_seconds = job["datePublished"] / 1000
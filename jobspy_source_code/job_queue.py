@@ -0,0 +1,323 @@
+"""
+jobspy.job_queue
+~~~~~~~~~~~~~~~~
+
+Background queue for long searches, so a caller can submit one, get an id back
+straight away and poll for the result instead of holding a request open for
+the whole scrape. Tasks are kept in SQLite, so queued work survives a restart,
+and a fixed pool of worker threads runs them in submission order. No broker
+needed. Several processes may share the file: each claims tasks under its own
+owner id and keeps a heartbeat on them, and a running task is only queued
+again once its heartbeat has gone stale (its process died), up to max_attempts
+runs, so a search that keeps killing its process fails instead of coming back
+on every restart.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable
+
+from jobspy.serialize import dumps
+from jobspy.util import create_logger
+
+log = create_logger("JobQueue")
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueFull(Exception):
+    def __init__(self, max_pending: int):
+        super().__init__(f"{max_pending} searches are already queued, try again later")
+
+
+class SearchQueue:
+    def __init__(
+        self,
+        handler: Callable[[dict, dict], dict],
+        path: str = "jobspy_queue.db",
+        workers: int = 2,
+        max_pending: int = 100,
+        keep_seconds: float = 24 * 60 * 60,
+        heartbeat_interval: float = 10.0,
+        stale_after: float = 60.0,
+        max_attempts: int = 3,
+    ):
+        """
+        :param handler: runs one task, handler(params, progress) -> result; it
+            may update the progress dict while it runs, get() reports it live
+        :param workers: searches run at once
+        :param max_pending: queued searches before submit raises QueueFull
+        :param keep_seconds: how long finished tasks and their results are kept
+        :param heartbeat_interval: seconds between heartbeats on running tasks
+        :param stale_after: seconds without a heartbeat after which a running
+            task's process is taken to be gone and the task is queued again
+        :param max_attempts: runs a task gets; one whose process died on its
+            last run is marked failed instead of queued again
+        """
+        self.handler = handler
+        self.path = path
+        self.max_pending = max_pending
+        self.keep_seconds = keep_seconds
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._stopped = threading.Event()
+        self._progress: dict[str, dict] = {}
+        self._closed = False
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    progress TEXT,
+                    result TEXT,
+                    error TEXT,
+                    submitted_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    owner TEXT,
+                    heartbeat_at REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            # files from before claims had owners and tasks counted their runs
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")
+            }
+            for column, kind in (
+                ("owner", "TEXT"),
+                ("heartbeat_at", "REAL"),
+                ("attempts", "INTEGER NOT NULL DEFAULT 0"),
+            ):
+                if column not in columns:
+                    self._conn.execute(
+                        f"ALTER TABLE tasks ADD COLUMN {column} {kind}"
+                    )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS tasks_status "
+                "ON tasks (status, submitted_at)"
+            )
+        self._requeue_stale()
+        self._workers = [
+            threading.Thread(target=self._work, name=f"jobspy-queue-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        self._heartbeat = threading.Thread(
+            target=self._beat, name="jobspy-queue-heartbeat", daemon=True
+        )
+        for thread in (*self._workers, self._heartbeat):
+            thread.start()
+
+    def submit(self, params: dict) -> str:
+        """
+        :return: the task id to poll get() with
+        """
+        task_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM tasks WHERE finished_at < ?", (now - self.keep_seconds,)
+            )
+            pending = self._conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE status = ?", (QUEUED,)
+            ).fetchone()[0]
+            if pending >= self.max_pending:
+                raise QueueFull(self.max_pending)
+            self._conn.execute(
+                "INSERT INTO tasks (id, status, params, submitted_at) "
+                "VALUES (?, ?, ?, ?)",
+                (task_id, QUEUED, json.dumps(params), now),
+            )
+        with self._wakeup:
+            self._wakeup.notify()
+        return task_id
+
+    def get(self, task_id: str) -> dict | None:
+        """
+        :return: the task's status, timestamps, progress and, once it is done,
+            its result (or error); None for an unknown or expired id
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT status, progress, result, error, submitted_at, started_at,
+                    finished_at, attempts
+                FROM tasks WHERE id = ?
+                """,
+                (task_id,),
+            ).fetchone()
+            live_progress = self._progress.get(task_id)
+        if row is None:
+            return None
+        status, progress, result, error, submitted, started, finished, attempts = row
+        task = {
+            "id": task_id,
+            "status": status,
+            "submitted_at": submitted,
+            "started_at": started,
+            "finished_at": finished,
+            "attempts": attempts,
+        }
+        if status == QUEUED:
+            task["position"] = self._position(submitted)
+        if live_progress is not None:
+            task["progress"] = json.loads(dumps(live_progress))
+        elif progress is not None:
+            task["progress"] = json.loads(progress)
+        if result is not None:
+            task["result"] = json.loads(result)
+        if error is not None:
+            task["error"] = error
+        return task
+
+    def _position(self, submitted_at: float) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE status = ? AND submitted_at < ?",
+                (QUEUED, submitted_at),
+            ).fetchone()[0]
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = dict(
+                self._conn.execute(
+                    "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+                ).fetchall()
+            )
+        return {
+            "workers": len(self._workers),
+            "max_pending": self.max_pending,
+            **{
+                status: counts.get(status, 0)
+                for status in (QUEUED, RUNNING, DONE, FAILED)
+            },
+        }
+
+    def _requeue_stale(self) -> None:
+        """
+        Queues again the running tasks whose process stopped heartbeating, or
+        fails them once they have had max_attempts runs
+        """
+        now = time.time()
+        stale = "status = ? AND (heartbeat_at IS NULL OR heartbeat_at < ?)"
+        with self._lock, self._conn:
+            failed = self._conn.execute(
+                "UPDATE tasks SET status = ?, error = ?, finished_at = ? "
+                f"WHERE {stale} AND attempts >= ?",
+                (
+                    FAILED,
+                    f"the search's process stopped on each of {self.max_attempts} "
+                    "attempts",
+                    now,
+                    RUNNING,
+                    now - self.stale_after,
+                    self.max_attempts,
+                ),
+            ).rowcount
+            if failed:
+                log.error(
+                    f"{failed} searches failed after {self.max_attempts} attempts"
+                )
+            self._conn.execute(
+                "UPDATE tasks SET status = ?, started_at = NULL, owner = NULL, "
+                f"heartbeat_at = NULL WHERE {stale}",
+                (QUEUED, RUNNING, now - self.stale_after),
+            )
+
+    def _beat(self) -> None:
+        while not self._stopped.wait(self.heartbeat_interval):
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE tasks SET heartbeat_at = ? WHERE owner = ? AND status = ?",
+                    (time.time(), self.owner, RUNNING),
+                )
+
+    def _claim(self) -> tuple[str, dict] | None:
+        """Marks the oldest queued task as running, under this queue's owner id"""
+        with self._lock, self._conn:
+            while True:
+                row = self._conn.execute(
+                    "SELECT id, params FROM tasks WHERE status = ? "
+                    "ORDER BY submitted_at LIMIT 1",
+                    (QUEUED,),
+                ).fetchone()
+                if row is None:
+                    return None
+                task_id, params = row
+                # another process sharing the file may have claimed it first
+                now = time.time()
+                claimed = self._conn.execute(
+                    "UPDATE tasks SET status = ?, started_at = ?, owner = ?, "
+                    "heartbeat_at = ?, attempts = attempts + 1 "
+                    "WHERE id = ? AND status = ?",
+                    (RUNNING, now, self.owner, now, task_id, QUEUED),
+                ).rowcount
+                if claimed:
+                    self._progress[task_id] = {}
+                    return task_id, json.loads(params)
+
+    def _finish(
+        self, task_id: str, status: str, result: dict | None, error: str | None
+    ) -> None:
+        with self._lock, self._conn:
+            progress = self._progress.pop(task_id, None)
+            # a task queued again as stale belongs to whoever claimed it since
+            self._conn.execute(
+                "UPDATE tasks SET status = ?, progress = ?, result = ?, error = ?, "
+                "finished_at = ? WHERE id = ? AND owner = ?",
+                (
+                    status,
+                    dumps(progress).decode(),
+                    dumps(result).decode() if result is not None else None,
+                    error,
+                    time.time(),
+                    task_id,
+                    self.owner,
+                ),
+            )
+
+    def _work(self) -> None:
+        while not self._closed:
+            task = self._claim()
+            if task is None:
+                self._requeue_stale()
+                with self._wakeup:
+                    # the timeout also picks up tasks submitted by other processes
+                    self._wakeup.wait(timeout=1.0)
+                continue
+            task_id, params = task
+            try:
+                result = self.handler(params, self._progress[task_id])
+            except Exception as e:
+                log.error(f"search {task_id} failed: {e}")
+                self._finish(task_id, FAILED, None, str(e))
+            else:
+                self._finish(task_id, DONE, result, None)
+
+    def close(self) -> None:
+        """Stops the workers once their current search is done"""
+        self._closed = True
+        self._stopped.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in (*self._workers, self._heartbeat):
+            thread.join()
+        with self._lock:
+            self._conn.close()
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import math
-import random
-import time
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urlparse, urlunparse, unquote
 
 import regex as re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
+from jobspy.cache import cached_details
+from jobspy.converter import convert_description
 from jobspy.exception import LinkedInException
 from jobspy.linkedin.constant import headers
 from jobspy.linkedin.util import (
@@ -26,19 +27,18 @@ from jobspy.model import (
     JobResponse,
     Country,
     Compensation,
-    DescriptionFormat,
     Scraper,
     ScraperInput,
     Site,
 )
+from jobspy.scheduler import get_scheduler
 from jobspy.util import (
     extract_emails_from_text,
     currency_parser,
-    markdown_converter,
-    plain_converter,
     create_session,
     remove_attributes,
     create_logger,
+    parse_html,
 )
 
 log = create_logger("LinkedIn")
@@ -46,9 +46,12 @@ log = create_logger("LinkedIn")
 
 class LinkedIn(Scraper):
     base_url = "https://www.linkedin.com"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 25
+    # search pages only need the job cards built into the tree. The strainer
+    # sees the raw class attribute ("base-card base-search-card ..."), not a list
+    job_card_strainer = SoupStrainer(
+        "div", class_=re.compile(r"(^|\s)base-search-card(\s|$)")
+    )
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
@@ -64,6 +67,7 @@ class LinkedIn(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            site=self.site,
         )
         self.session.headers.update(headers)
         self.scraper_input = None
@@ -84,37 +88,17 @@ class LinkedIn(Scraper):
         seconds_old = (
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
-        continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+        continue_search = lambda: (
+            len(job_list) < scraper_input.results_wanted
+            and start < 1000
+            and not self._deadline_reached()
         )
         while continue_search():
             request_count += 1
             log.info(
                 f"search page: {request_count} / {math.ceil(scraper_input.results_wanted / 10)}"
             )
-            params = {
-                "keywords": scraper_input.search_term,
-                "location": scraper_input.location,
-                "distance": scraper_input.distance,
-                "f_WT": 2 if scraper_input.is_remote else None,
-                "f_JT": (
-                    job_type_code(scraper_input.job_type)
-                    if scraper_input.job_type
-                    else None
-                ),
-                "pageNum": 0,
-                "start": start,
-                "f_AL": "true" if scraper_input.easy_apply else None,
-                "f_C": (
-                    ",".join(map(str, scraper_input.linkedin_company_ids))
-                    if scraper_input.linkedin_company_ids
-                    else None
-                ),
-            }
-            if seconds_old is not None:
-                params["f_TPR"] = f"r{seconds_old}"
-
-            params = {k: v for k, v in params.items() if v is not None}
+            params = self._search_params(start, seconds_old)
             try:
                 response = self.session.get(
                     f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
@@ -138,12 +122,16 @@ class LinkedIn(Scraper):
                     log.error(f"LinkedIn: {str(e)}")
                 return JobResponse(jobs=job_list)
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = parse_html(response.text, parse_only=self.job_card_strainer)
             job_cards = soup.find_all("div", class_="base-search-card")
             if len(job_cards) == 0:
                 return JobResponse(jobs=job_list)
 
+            wanted = scraper_input.results_wanted - len(job_list)
+            new_cards = []
             for job_card in job_cards:
+                if len(new_cards) >= wanted:
+                    break
                 href_tag = job_card.find("a", class_="base-card__full-link")
                 if href_tag and "href" in href_tag.attrs:
                     href = href_tag.attrs["href"].split("?")[0]
@@ -152,26 +140,78 @@ class LinkedIn(Scraper):
                     if job_id in seen_ids:
                         continue
                     seen_ids.add(job_id)
+                    new_cards.append((job_card, job_id))
 
-                    try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
-                        job_post = self._process_job(job_card, job_id, fetch_desc)
-                        if job_post:
-                            job_list.append(job_post)
-                        if not continue_search():
-                            break
-                    except Exception as e:
-                        raise LinkedInException(str(e))
+            fetch_desc = scraper_input.linkedin_fetch_description
+            details = (
+                self._submit_job_details([job_id for _, job_id in new_cards])
+                if fetch_desc
+                else [None] * len(new_cards)
+            )
+            page_start = len(job_list)
+            for (job_card, job_id), job_details in zip(new_cards, details):
+                # a job whose details failed is still returned, from its card
+                try:
+                    job_details = job_details.result() if job_details else {}
+                except Exception as e:
+                    log.error(f"LinkedIn: details of job {job_id} failed: {e}")
+                    job_details = {}
+                try:
+                    job_post = self._process_job(
+                        job_card, job_id, fetch_desc, job_details
+                    )
+                    if job_post:
+                        job_list.append(job_post)
+                except Exception as e:
+                    raise LinkedInException(str(e))
 
+            self._publish(job_list)
+            if self._page_all_known(job_list[page_start:]):
+                break
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 start += len(job_cards)
 
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
+    def _search_params(self, start: int, seconds_old: int | None) -> dict:
+        """
+        Builds the guest job search query params for a page
+        :param start: result offset of the page
+        :param seconds_old:
+        :return: params
+        """
+        scraper_input = self.scraper_input
+        params = {
+            "keywords": scraper_input.search_term,
+            "location": scraper_input.location,
+            "distance": scraper_input.distance,
+            "f_WT": 2 if scraper_input.is_remote else None,
+            "f_JT": (
+                job_type_code(scraper_input.job_type)
+                if scraper_input.job_type
+                else None
+            ),
+            "pageNum": 0,
+            "start": start,
+            "f_AL": "true" if scraper_input.easy_apply else None,
+            "f_C": (
+                ",".join(map(str, scraper_input.linkedin_company_ids))
+                if scraper_input.linkedin_company_ids
+                else None
+            ),
+        }
+        if seconds_old is not None:
+            params["f_TPR"] = f"r{seconds_old}"
+
+        return {k: v for k, v in params.items() if v is not None}
+
     def _process_job(
-        self, job_card: Tag, job_id: str, full_descr: bool
+        self,
+        job_card: Tag,
+        job_id: str,
+        full_descr: bool,
+        job_details: dict | None = None,
     ) -> Optional[JobPost]:
         salary_tag = job_card.find("span", class_="job-search-card__salary-info")
 
@@ -216,10 +256,10 @@ class LinkedIn(Scraper):
                 date_posted = datetime.strptime(datetime_str, "%Y-%m-%d")
             except:
                 date_posted = None
-        job_details = {}
-        if full_descr:
-            job_details = self._get_job_details(job_id)
-            description = job_details.get("description")
+        if job_details is None:
+            fetch = full_descr and self._should_fetch_details()
+            job_details = self._get_job_details(job_id) if fetch else {}
+        description = job_details.get("description")
         is_remote = is_job_remote(title, description, location)
 
         return JobPost(
@@ -242,12 +282,43 @@ class LinkedIn(Scraper):
             job_function=job_details.get("job_function"),
         )
 
+    def fetch_job_details(self, job_key: str) -> dict:
+        """
+        :param job_key: LinkedIn job id without the li- prefix
+        :return: dict
+        """
+        job_details = self._get_job_details(job_key)
+        if job_details.get("job_level"):
+            # scrape() lowercases it too
+            job_details["job_level"] = job_details["job_level"].lower()
+        return job_details
+
+    def _submit_job_details(self, job_ids: list[str]) -> list[Future]:
+        """
+        Fetches the details of a page of jobs concurrently on the shared worker
+        pool, as many at a time as the scheduler allows for LinkedIn
+        :return: one future per job id, in the same order
+        """
+        scheduler = get_scheduler()
+        return [
+            scheduler.submit(self.site, self._get_job_details_in_time, job_id)
+            for job_id in job_ids
+        ]
+
+    def _get_job_details_in_time(self, job_id: str) -> dict:
+        """Job details, or an empty dict once the deadline has passed"""
+        return self._get_job_details(job_id) if self._should_fetch_details() else {}
+
     def _get_job_details(self, job_id: str) -> dict:
         """
-        Retrieves job description and other job details by going to the job page url
-        :param job_page_url:
+        Retrieves job description and other job details by going to the job page
+        url, read through the detail cache
+        :param job_id:
         :return: dict
         """
+        return cached_details(self, job_id, lambda: self._request_job_details(job_id))
+
+    def _request_job_details(self, job_id: str) -> dict:
         try:
             response = self.session.get(
                 f"{self.base_url}/jobs/view/{job_id}", timeout=5
@@ -257,8 +328,15 @@ class LinkedIn(Scraper):
             return {}
         if "linkedin.com/signup" in response.url:
             return {}
+        return self._parse_job_details(response.text)
 
-        soup = BeautifulSoup(response.text, "html.parser")
+    def _parse_job_details(self, html: str) -> dict:
+        """
+        Parses the description and job criteria out of a job page
+        :param html:
+        :return: dict
+        """
+        soup = parse_html(html)
         div_content = soup.find(
             "div", class_=lambda x: x and "show-more-less-html__markup" in x
         )
@@ -266,10 +344,9 @@ class LinkedIn(Scraper):
         if div_content is not None:
             div_content = remove_attributes(div_content)
             description = div_content.prettify(formatter="html")
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description = markdown_converter(description)
-            elif self.scraper_input.description_format == DescriptionFormat.PLAIN:
-                description = plain_converter(description)
+            description = convert_description(
+                description, self.scraper_input.description_format
+            )
         h3_tag = soup.find(
             "h3", text=lambda text: text and "Job function" in text.strip()
         )
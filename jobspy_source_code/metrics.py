@@ -0,0 +1,372 @@
+"""
+jobspy.metrics
+~~~~~~~~~~~~~~
+
+Process-wide counters, gauges and histograms for the scraper sessions and
+scrape_jobs, rendered in the Prometheus text exposition format by render().
+Kept dependency-free; the API serves it at GET /metrics.
+
+    jobspy_http_requests_total{site,status}         requests sent, by response status
+    jobspy_http_request_duration_seconds{site}      request latency
+    jobspy_scrapes_in_flight{site}                  scrapes running right now
+    jobspy_scrape_duration_seconds{site}            time per scrape
+    jobspy_scrape_pages{site}                       results pages per scrape
+    jobspy_scrape_jobs_per_second{site}             throughput per scrape
+    jobspy_jobs_scraped_total{site}                 jobs returned
+    jobspy_description_conversion_seconds{format}   time per description / page batch
+    jobspy_dataframe_build_seconds                  time building the result DataFrame
+    jobspy_coalesced_searches_total                 searches that shared one already running
+
+and, read from the rate limiter, circuit breaker and proxy pools when rendered:
+
+    jobspy_host_rate{host}                          current request rate allowed per host
+    jobspy_host_blocked_seconds{host}               time left on a Retry-After pause
+    jobspy_circuit_state{site,state}                1 for the site's current circuit state
+    jobspy_circuit_recent_failures{site}            failures in the circuit's window
+    jobspy_proxy_success_ratio{site,proxy}          share of successful requests per proxy
+    jobspy_proxy_latency_seconds{site,proxy}        smoothed latency per proxy
+    jobspy_proxy_quarantined_seconds{site,proxy}    time left in quarantine per proxy
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from jobspy.circuit import CLOSED, HALF_OPEN, OPEN, get_circuit_breaker
+from jobspy.model import Site
+from jobspy.proxy import proxy_stats
+from jobspy.ratelimit import get_rate_limiter
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+FAST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return f"{{{pairs}}}"
+
+
+class Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> list[tuple[str, dict, float]]:
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for name, labels, value in self._samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            (self.name, dict(zip(self.labelnames, key)), value) for key, value in values
+        ]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def replace(self, samples: list[tuple[dict, float]]) -> None:
+        """Swaps every value for samples of (labels, value), in one go"""
+        values = {self._key(labels): value for labels, value in samples}
+        with self._lock:
+            self._values = values
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value)
+
+    def _samples(self):
+        with self._lock:
+            values = sorted(
+                (key, (list(counts), total))
+                for key, (counts, total) in self._values.items()
+            )
+        samples = []
+        for key, (counts, total) in values:
+            labels = dict(zip(self.labelnames, key))
+            for bound, count in zip(self.buckets, counts):
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        {**labels, "le": _format_value(bound)},
+                        count,
+                    )
+                )
+            samples.append((f"{self.name}_count", labels, counts[-1]))
+            samples.append((f"{self.name}_sum", labels, total))
+        return samples
+
+
+HTTP_REQUESTS = Counter(
+    "jobspy_http_requests_total",
+    "HTTP requests sent by the scrapers, by site and response status",
+    ("site", "status"),
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "jobspy_http_request_duration_seconds",
+    "HTTP request latency, including proxy retries",
+    ("site",),
+)
+SCRAPES_IN_FLIGHT = Gauge(
+    "jobspy_scrapes_in_flight", "Scrapes currently running", ("site",)
+)
+SCRAPE_DURATION = Histogram(
+    "jobspy_scrape_duration_seconds",
+    "Time per scrape of one site",
+    ("site",),
+    buckets=(1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0),
+)
+SCRAPE_PAGES = Histogram(
+    "jobspy_scrape_pages",
+    "Results pages fetched per scrape",
+    ("site",),
+    buckets=(1, 2, 3, 5, 10, 20, 50),
+)
+SCRAPE_JOBS_PER_SECOND = Histogram(
+    "jobspy_scrape_jobs_per_second",
+    "Jobs returned per second of scrape time",
+    ("site",),
+    buckets=(0.5, 1, 2, 5, 10, 25, 50, 100, 250),
+)
+JOBS_SCRAPED = Counter("jobspy_jobs_scraped_total", "Jobs returned", ("site",))
+DESCRIPTION_CONVERSION = Histogram(
+    "jobspy_description_conversion_seconds",
+    "Time converting one description or a page of descriptions",
+    ("format",),
+    buckets=FAST_BUCKETS,
+)
+DATAFRAME_BUILD = Histogram(
+    "jobspy_dataframe_build_seconds",
+    "Time building the scrape_jobs result DataFrame",
+    buckets=FAST_BUCKETS,
+)
+COALESCED_SEARCHES = Counter(
+    "jobspy_coalesced_searches_total",
+    "Searches that waited on an identical search already running instead of scraping",
+)
+
+HOST_RATE = Gauge(
+    "jobspy_host_rate", "Requests per second the rate limiter allows", ("host",)
+)
+HOST_BLOCKED = Gauge(
+    "jobspy_host_blocked_seconds",
+    "Seconds left on a Retry-After pause of the host",
+    ("host",),
+)
+CIRCUIT_STATE = Gauge(
+    "jobspy_circuit_state",
+    "1 for the state the site's circuit is in, 0 for the others",
+    ("site", "state"),
+)
+CIRCUIT_RECENT_FAILURES = Gauge(
+    "jobspy_circuit_recent_failures",
+    "Failed requests in the circuit breaker's window",
+    ("site",),
+)
+PROXY_SUCCESS_RATIO = Gauge(
+    "jobspy_proxy_success_ratio",
+    "Share of requests through the proxy that succeeded, per site",
+    ("site", "proxy"),
+)
+PROXY_LATENCY = Gauge(
+    "jobspy_proxy_latency_seconds",
+    "Smoothed request latency through the proxy, per site",
+    ("site", "proxy"),
+)
+PROXY_QUARANTINED = Gauge(
+    "jobspy_proxy_quarantined_seconds",
+    "Seconds left before a failed proxy is used again, per site",
+    ("site", "proxy"),
+)
+
+METRICS = [
+    HTTP_REQUESTS,
+    HTTP_REQUEST_DURATION,
+    SCRAPES_IN_FLIGHT,
+    SCRAPE_DURATION,
+    SCRAPE_PAGES,
+    SCRAPE_JOBS_PER_SECOND,
+    JOBS_SCRAPED,
+    DESCRIPTION_CONVERSION,
+    DATAFRAME_BUILD,
+    COALESCED_SEARCHES,
+    HOST_RATE,
+    HOST_BLOCKED,
+    CIRCUIT_STATE,
+    CIRCUIT_RECENT_FAILURES,
+    PROXY_SUCCESS_RATIO,
+    PROXY_LATENCY,
+    PROXY_QUARANTINED,
+]
+
+
+def _site_label(site: Site | None) -> str:
+    return site.value if site else "none"
+
+
+def record_request(site: Site | None, status_code: int | None, seconds: float) -> None:
+    """
+    :param status_code: None for a request that failed to get a response
+    """
+    site_label = _site_label(site)
+    status = str(status_code) if status_code is not None else "error"
+    HTTP_REQUESTS.inc(site=site_label, status=status)
+    HTTP_REQUEST_DURATION.observe(seconds, site=site_label)
+
+
+@contextmanager
+def track_scrape(scraper):
+    """
+    Counts the scrape as in flight while the block runs and, if it finishes,
+    records its duration, pages and the "jobs" count set on the yielded dict
+    """
+    site_label = _site_label(scraper.site)
+    result = {"jobs": 0}
+    SCRAPES_IN_FLIGHT.inc(site=site_label)
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        SCRAPES_IN_FLIGHT.dec(site=site_label)
+    seconds = time.perf_counter() - start
+    SCRAPE_DURATION.observe(seconds, site=site_label)
+    SCRAPE_PAGES.observe(scraper.pages, site=site_label)
+    SCRAPE_JOBS_PER_SECOND.observe(result["jobs"] / max(seconds, 1e-6), site=site_label)
+    JOBS_SCRAPED.inc(result["jobs"], site=site_label)
+
+
+@contextmanager
+def timed(histogram: Histogram, **labels):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - start, **labels)
+
+
+def _collect_state() -> None:
+    """Sets the gauges that mirror the rate limiter, circuits and proxies"""
+    hosts = get_rate_limiter().stats()
+    HOST_RATE.replace(
+        [({"host": host}, stats["rate"]) for host, stats in hosts.items()]
+    )
+    HOST_BLOCKED.replace(
+        [({"host": host}, stats["blocked_seconds"]) for host, stats in hosts.items()]
+    )
+    circuits = get_circuit_breaker().stats()
+    CIRCUIT_STATE.replace(
+        [
+            ({"site": site, "state": state}, int(stats["state"] == state))
+            for site, stats in circuits.items()
+            for state in (CLOSED, HALF_OPEN, OPEN)
+        ]
+    )
+    CIRCUIT_RECENT_FAILURES.replace(
+        [({"site": site}, stats["recent_failures"]) for site, stats in circuits.items()]
+    )
+    proxies = [
+        ({"site": site, "proxy": proxy}, stats)
+        for site, site_proxies in proxy_stats().items()
+        for proxy, stats in site_proxies.items()
+    ]
+    PROXY_SUCCESS_RATIO.replace(
+        [
+            (labels, stats["successes"] / stats["requests"])
+            for labels, stats in proxies
+            if stats["requests"]
+        ]
+    )
+    PROXY_LATENCY.replace(
+        [
+            (labels, stats["latency"])
+            for labels, stats in proxies
+            if stats["latency"] is not None
+        ]
+    )
+    PROXY_QUARANTINED.replace(
+        [(labels, stats["quarantined_seconds"]) for labels, stats in proxies]
+    )
+
+
+def render() -> str:
+    """
+    :return: every metric in the Prometheus text exposition format
+    """
+    _collect_state()
+    lines = []
+    for metric in METRICS:
+        lines += metric.render()
+    return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Optional
 from datetime import date
 from enum import Enum
 from pydantic import BaseModel
@@ -320,6 +321,10 @@ class ScraperInput(BaseModel):
 
     results_wanted: int = 15
     hours_old: int | None = None
+    # time.monotonic() value after which scrapers stop paginating / fetching details
+    deadline: float | None = None
+    # card data only, no per-job detail requests (see Scraper.fetch_job_details)
+    listing_only: bool = False
 
 
 class Scraper(ABC):
@@ -330,6 +335,100 @@ class Scraper(ABC):
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.user_agent = user_agent
+        # called with each page of new jobs while scrape() is still running
+        self.page_callback: Callable[[list[JobPost]], None] | None = None
+        self._published = 0
+        # results pages fetched, counted by _publish
+        self.pages = 0
+        self.scraper_input: ScraperInput | None = None
+        # set once the deadline cut the scrape short
+        self.truncated = False
+        # returns which of the given ids an earlier run already delivered
+        self.known_ids: Callable[[list[str]], set[str]] | None = None
+        self.stopped_on_known = False
+        # whether each id was known before this run, asked before it is published
+        self._known_before: dict[str, bool] = {}
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    def _publish(self, job_list: list[JobPost], offset: int = 0) -> None:
+        """
+        Hands the jobs appended to job_list since the last call to page_callback,
+        limited to the offset/results_wanted window scrape() will return
+        :param job_list: all jobs collected so far
+        :param offset: number of leading jobs scrape() slices off
+        """
+        self.pages += 1
+        if self.page_callback is None:
+            return
+        start = max(self._published, offset)
+        end = min(len(job_list), offset + self.scraper_input.results_wanted)
+        if end > start:
+            # the callback's consumer may store these jobs before the scraper
+            # checks the page, so which were already known is asked first
+            self._remember_known(job_list[start:end])
+            self.page_callback(job_list[start:end])
+            self._published = end
+
+    def _remember_known(self, jobs: list[JobPost]) -> None:
+        if self.known_ids is None:
+            return
+        job_ids = [
+            job.id
+            for job in jobs
+            if job.id is not None and job.id not in self._known_before
+        ]
+        if job_ids:
+            known = self.known_ids(job_ids)
+            for job_id in job_ids:
+                self._known_before[job_id] = job_id in known
+
+    def _page_all_known(self, jobs: list[JobPost]) -> bool:
+        """
+        True when known_ids is set and every job on a results page was already
+        delivered by an earlier run, so paginating further only finds older jobs.
+        Jobs this run delivered itself never count as known.
+        """
+        if self.known_ids is None or not jobs:
+            return False
+        job_ids = [job.id for job in jobs]
+        if None in job_ids:
+            return False
+        self._remember_known(jobs)
+        if not all(self._known_before[job_id] for job_id in job_ids):
+            return False
+        self.stopped_on_known = True
+        return True
+
+    def prepare_details(self, scraper_input: ScraperInput) -> None:
+        """Sets the scraper up for fetch_job_details calls outside of scrape()"""
+        self.scraper_input = scraper_input
+
+    def fetch_job_details(self, job_key: str) -> dict:
+        """
+        Second phase of a listing_only scrape: fetches what scrape() would have
+        added to the job from its own page
+        :param job_key: job id without the site prefix, or the job url for sites
+            whose ids aren't prefixed
+        :return: dict of JobPost fields
+        """
+        raise NotImplementedError(
+            f"{self.site.value} returns full job details in the listing"
+        )
+
+    def _should_fetch_details(self) -> bool:
+        """False in listing_only mode or once the deadline has passed"""
+        return not self.scraper_input.listing_only and not self._deadline_reached()
+
+    def _deadline_reached(self) -> bool:
+        """
+        True once scraper_input.deadline has passed, in which case the scrape is
+        marked as truncated. Check it only where the scraper would otherwise do
+        more work, so a site that simply ran out of results isn't flagged.
+        """
+        deadline = self.scraper_input.deadline if self.scraper_input else None
+        if deadline is None or time.monotonic() < deadline:
+            return False
+        self.truncated = True
+        return True
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import math
-import random
-import time
 from datetime import datetime, date, timedelta
 from typing import Optional
 
 import regex as re
 import requests
 
+from jobspy.converter import convert_description
 from jobspy.exception import NaukriException
 from jobspy.naukri.constant import headers as naukri_headers
 from jobspy.naukri.util import (
@@ -30,7 +29,6 @@ from jobspy.model import (
 from jobspy.util import (
     extract_emails_from_text,
     currency_parser,
-    markdown_converter,
     create_session,
     create_logger,
 )
@@ -39,8 +37,6 @@ log = create_logger("Naukri")
 
 class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 20  
 
     def __init__(
@@ -57,6 +53,7 @@ class Naukri(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            site=self.site,
         )
         self.session.headers.update(naukri_headers)
         self.scraper_input = None
@@ -78,8 +75,10 @@ class Naukri(Scraper):
         seconds_old = (
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
-        continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
+        continue_search = lambda: (
+            len(job_list) < scraper_input.results_wanted
+            and page <= 50  # Arbitrary limit
+            and not self._deadline_reached()
         )
 
         while continue_search():
@@ -88,23 +87,7 @@ class Naukri(Scraper):
                 f"Scraping page {request_count} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)} "
                 f"for search term: {scraper_input.search_term}"
             )
-            params = {
-                "noOfResults": self.jobs_per_page,
-                "urlType": "search_by_keyword",
-                "searchType": "adv",
-                "keyword": scraper_input.search_term,
-                "pageNo": page,
-                "k": scraper_input.search_term,
-                "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
-                "src": "jobsearchDesk",
-                "latLong": "",
-                "location": scraper_input.location,
-                "remote": "true" if scraper_input.is_remote else None,
-            }
-            if seconds_old:
-                params["days"] = seconds_old // 86400  # Convert to days
-
-            params = {k: v for k, v in params.items() if v is not None}
+            params = self._search_params(page, seconds_old)
             try:
                 log.debug(f"Sending request to {self.base_url} with params: {params}")
                 response = self.session.get(self.base_url, params=params, timeout=10)
@@ -122,6 +105,7 @@ class Naukri(Scraper):
                 log.error(f"Naukri API request failed: {str(e)}")
                 return JobResponse(jobs=job_list)
 
+            page_start = len(job_list)
             for job in job_details:
                 job_id = job.get("jobId")
                 if not job_id or job_id in seen_ids:
@@ -141,14 +125,39 @@ class Naukri(Scraper):
                     log.error(f"Error processing job ID {job_id}: {str(e)}")
                     raise NaukriException(str(e))
 
+            self._publish(job_list)
+            if self._page_all_known(job_list[page_start:]):
+                break
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 page += 1
 
         job_list = job_list[:scraper_input.results_wanted]
         log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
         return JobResponse(jobs=job_list)
 
+    def _search_params(self, page: int, seconds_old: int | None) -> dict:
+        """
+        Builds the search API query params for a page
+        """
+        scraper_input = self.scraper_input
+        params = {
+            "noOfResults": self.jobs_per_page,
+            "urlType": "search_by_keyword",
+            "searchType": "adv",
+            "keyword": scraper_input.search_term,
+            "pageNo": page,
+            "k": scraper_input.search_term,
+            "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
+            "src": "jobsearchDesk",
+            "latLong": "",
+            "location": scraper_input.location,
+            "remote": "true" if scraper_input.is_remote else None,
+        }
+        if seconds_old:
+            params["days"] = seconds_old // 86400  # Convert to days
+
+        return {k: v for k, v in params.items() if v is not None}
+
     def _process_job(
         self, job: dict, job_id: str, full_descr: bool
     ) -> Optional[JobPost]:
@@ -171,7 +180,9 @@ class Naukri(Scraper):
 
         description = raw_description
         if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
+            description = convert_description(
+                description, DescriptionFormat.MARKDOWN
+            )
 
         is_remote = is_job_remote(title, description or "", location)
         company_logo = job.get("logoPathV3") or job.get("logoPath")
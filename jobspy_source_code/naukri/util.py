@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from bs4 import BeautifulSoup
 from jobspy.model import JobType, Location
-from jobspy.util import get_enum_from_job_type
+from jobspy.util import get_enum_from_job_type, parse_html
 
 
 def parse_job_type(soup: BeautifulSoup |str) -> list[JobType] | None:
@@ -10,7 +10,7 @@ def parse_job_type(soup: BeautifulSoup |str) -> list[JobType] | None:
     Gets the job type from the job page
     """
     if isinstance(soup, str):
-        soup = BeautifulSoup(soup, "html.parser")
+        soup = parse_html(soup)
     job_type_tag = soup.find("span", class_="job-type")
     if job_type_tag:
         job_type_str = job_type_tag.get_text(strip=True).lower().replace("-", "")
@@ -23,7 +23,7 @@ def parse_company_industry(soup: BeautifulSoup | str) -> str | None:
     Gets the company industry from the job page
     """
     if isinstance(soup, str):
-        soup = BeautifulSoup(soup, "html.parser")
+        soup = parse_html(soup)
     industry_tag = soup.find("span", class_="industry")
     return industry_tag.get_text(strip=True) if industry_tag else None
 
@@ -0,0 +1,122 @@
+"""
+jobspy.pipeline
+~~~~~~~~~~~~~~~
+
+Pipelined pagination for cursor-paginated searches. The next page's cursor is
+in the current page's response, so its request can go out while the scraper
+is still processing the current page (converting descriptions, fetching
+details). paginate() follows the cursor chain on the scheduler's lookahead
+pool, up to lookahead pages ahead of the page being processed, and yields the
+raw pages in order.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+from jobspy.scheduler import get_scheduler
+
+_DONE = object()
+
+
+class _Failed:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def paginate(
+    fetch: Callable[[Any], tuple[Any, Any]],
+    cursor: Any = None,
+    max_pages: int | None = None,
+    wanted: int | None = None,
+    count: Callable[[Any], int] = len,
+    deadline: float | None = None,
+    lookahead: int | None = None,
+) -> Iterator[Any]:
+    """
+    Yields the pages of a search in order; it ends at a falsy cursor, after
+    max_pages, or when the caller stops iterating (close it, or use
+    contextlib.closing, so a page fetched ahead isn't waited on)
+    :param fetch: fetch(cursor) -> (page, next page's cursor)
+    :param wanted: once the pages fetched hold this many items (see count),
+        further pages are only fetched when the caller asks for them, since
+        duplicates or filtering may still call for more
+    :param deadline: time.monotonic() value after which nothing is fetched ahead
+    :param lookahead: pages fetched ahead of the one being processed, 0 for
+        strictly sequential; the scheduler's page_lookahead if None
+    """
+    scheduler = get_scheduler()
+    if lookahead is None:
+        lookahead = scheduler.page_lookahead
+    if lookahead <= 0:
+        yield from _sequential(fetch, cursor, max_pages)
+        return
+
+    pages: queue.Queue = queue.Queue()
+    condition = threading.Condition()
+    # pages the caller has asked for so far, including the one it waits on
+    requested = 0
+    stopped = False
+
+    def may_fetch(fetched: int, items: int) -> bool:
+        if stopped:
+            return True
+        if fetched < requested:
+            return True
+        if fetched >= requested + lookahead:
+            return False
+        if wanted is not None and items >= wanted:
+            return False
+        return deadline is None or time.monotonic() < deadline
+
+    def follow(cursor: Any) -> None:
+        fetched = items = 0
+        try:
+            while max_pages is None or fetched < max_pages:
+                with condition:
+                    condition.wait_for(lambda: may_fetch(fetched, items))
+                    if stopped:
+                        return
+                page, cursor = fetch(cursor)
+                fetched += 1
+                items += count(page)
+                pages.put(page)
+                if not cursor:
+                    break
+        except Exception as e:
+            pages.put(_Failed(e))
+        pages.put(_DONE)
+
+    if scheduler.submit_lookahead(follow, cursor) is None:
+        yield from _sequential(fetch, cursor, max_pages)
+        return
+    try:
+        while True:
+            with condition:
+                requested += 1
+                condition.notify()
+            page = pages.get()
+            if page is _DONE:
+                return
+            if isinstance(page, _Failed):
+                raise page.error
+            yield page
+    finally:
+        with condition:
+            stopped = True
+            condition.notify()
+
+
+def _sequential(
+    fetch: Callable[[Any], tuple[Any, Any]], cursor: Any, max_pages: int | None
+) -> Iterator[Any]:
+    fetched = 0
+    while max_pages is None or fetched < max_pages:
+        page, cursor = fetch(cursor)
+        fetched += 1
+        yield page
+        if not cursor:
+            return
@@ -0,0 +1,189 @@
+"""
+jobspy.profiling
+~~~~~~~~~~~~~~~~
+
+Opt-in timing breakdown of one search. Inside ``with profiling() as profile:``
+the sessions, HTML parsing, description conversion and scrape_jobs add the time
+they spend to the profile, per site and phase, along with request counts and
+bytes downloaded. The profile follows the search onto the scheduler's threads
+and asyncio tasks through a context variable, so concurrent searches each get
+their own, and outside of profiling() every hook is a single lookup.
+
+Phases per site (seconds, summed over threads, so they can exceed wall time):
+    scrape      the site's scrape() call, wall time
+    sleep       waiting on the rate limiter
+    queue       waiting for a scheduler request slot
+    network     sending requests and reading responses
+    parse       building HTML trees
+    convert     converting descriptions to markdown / plain text
+    normalize   turning JobPosts into result rows
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from jobspy.model import Site
+
+
+class Profile:
+    def __init__(self, cprofile_path: str | None = None):
+        """
+        :param cprofile_path: also run cProfile on the threads scraping each
+            site and the calling thread, and dump the merged stats here
+        """
+        self.cprofile_path = cprofile_path
+        self.phases: dict[str, float] = {}
+        self.sites: dict[str, dict] = {}
+        self._profilers: list[cProfile.Profile] = []
+        self._start = time.perf_counter()
+        self._seconds: float | None = None
+        self._lock = threading.Lock()
+
+    def _site_stats(self, site: Site) -> dict:
+        if site.value not in self.sites:
+            self.sites[site.value] = {"requests": 0, "bytes": 0}
+        return self.sites[site.value]
+
+    def add(self, phase: str, seconds: float, site: Site | None = None) -> None:
+        with self._lock:
+            phases = self._site_stats(site) if site else self.phases
+            phases[phase] = phases.get(phase, 0.0) + seconds
+
+    def add_request(self, site: Site | None, nbytes: int) -> None:
+        if site is None:
+            return
+        with self._lock:
+            stats = self._site_stats(site)
+            stats["requests"] += 1
+            stats["bytes"] += nbytes
+
+    def to_dict(self) -> dict:
+        seconds = self._seconds
+        if seconds is None:
+            seconds = time.perf_counter() - self._start
+        with self._lock:
+            return {
+                "total_seconds": round(seconds, 4),
+                "phases": {name: round(s, 4) for name, s in self.phases.items()},
+                "sites": {
+                    site: {
+                        name: round(value, 4) if isinstance(value, float) else value
+                        for name, value in stats.items()
+                    }
+                    for site, stats in self.sites.items()
+                },
+                "cprofile": self.cprofile_path,
+            }
+
+    def _finish(self) -> None:
+        self._seconds = time.perf_counter() - self._start
+        if self.cprofile_path and self._profilers:
+            stats = pstats.Stats(self._profilers[0])
+            for profiler in self._profilers[1:]:
+                stats.add(profiler)
+            stats.dump_stats(self.cprofile_path)
+
+
+_profile: ContextVar[Profile | None] = ContextVar("jobspy_profile", default=None)
+_site: ContextVar[Site | None] = ContextVar("jobspy_profile_site", default=None)
+
+
+def get_profile() -> Profile | None:
+    return _profile.get()
+
+
+@contextmanager
+def _cprofile(profile: Profile):
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # this thread is already being profiled, e.g. an async scraper running
+        # on the caller's event loop
+        yield
+        return
+    try:
+        yield
+    finally:
+        profiler.disable()
+        with profile._lock:
+            profile._profilers.append(profiler)
+
+
+@contextmanager
+def profiling(cprofile_path: str | None = None):
+    """
+    Profiles the searches run inside the block
+    :param cprofile_path: file to dump merged cProfile stats to, for pstats
+        or snakeviz
+    :return: the Profile, read it with to_dict() once the block is done
+    """
+    profile = Profile(cprofile_path)
+    token = _profile.set(profile)
+    try:
+        if cprofile_path:
+            with _cprofile(profile):
+                yield profile
+        else:
+            yield profile
+    finally:
+        _profile.reset(token)
+        profile._finish()
+
+
+@contextmanager
+def profile_site(site: Site):
+    """
+    Attributes the phases timed inside the block to site and times it as the
+    site's scrape phase
+    """
+    profile = _profile.get()
+    if profile is None:
+        yield
+        return
+    token = _site.set(site)
+    start = time.perf_counter()
+    try:
+        if profile.cprofile_path:
+            with _cprofile(profile):
+                yield
+        else:
+            yield
+    finally:
+        profile.add("scrape", time.perf_counter() - start, site)
+        _site.reset(token)
+
+
+@contextmanager
+def phase(name: str, site: Site | None = None):
+    """
+    Adds the time spent in the block to phase name of the current profile,
+    for site or the site being scraped
+    """
+    profile = _profile.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(name, time.perf_counter() - start, site or _site.get())
+
+
+def add_phase(name: str, seconds: float, site: Site | None = None) -> None:
+    profile = _profile.get()
+    if profile is not None:
+        profile.add(name, seconds, site or _site.get())
+
+
+def add_request(site: Site | None, nbytes: int) -> None:
+    profile = _profile.get()
+    if profile is not None:
+        profile.add_request(site or _site.get(), nbytes)
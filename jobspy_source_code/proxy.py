@@ -0,0 +1,198 @@
+"""
+jobspy.proxy
+~~~~~~~~~~~~
+
+Health-scored proxy selection for the scraper sessions. Every response (or
+connection error) through a proxy is recorded per proxy and per job board,
+process-wide, so sessions prefer proxies that have been fast and unblocked
+on that site, and a proxy that fails is quarantined with an exponentially
+growing cool-down instead of coming round again on the next request.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+from jobspy.model import Site
+
+# "localhost" in a proxy list means a direct connection
+DIRECT = "http://localhost"
+# blocked, proxy auth, throttled or a failing gateway
+BAD_STATUSES = (403, 407, 429, 502, 503, 504)
+
+
+class ProxyHealth:
+    def __init__(self):
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.throttled = 0
+        self.latency: float | None = None
+        self.strikes = 0
+        self.quarantined_until = 0.0
+        # shared by every session using the proxy for the site, across threads
+        self._lock = threading.Lock()
+
+    def score(self) -> float:
+        """Smoothed success rate squared over average latency, higher is better"""
+        with self._lock:
+            success_rate = (self.successes + 1) / (self.requests + 2)
+            latency = self.latency if self.latency is not None else 1.0
+        return success_rate**2 / max(latency, 0.05)
+
+    def released_at(self) -> float:
+        """time.monotonic() value the quarantine ends at, in the past if none"""
+        with self._lock:
+            return self.quarantined_until
+
+    def record(
+        self,
+        ok: bool,
+        latency: float | None,
+        throttled: bool,
+        base_cooldown: float,
+        max_cooldown: float,
+    ) -> None:
+        with self._lock:
+            self.requests += 1
+            if latency is not None:
+                self.latency = (
+                    latency
+                    if self.latency is None
+                    else 0.7 * self.latency + 0.3 * latency
+                )
+            if ok:
+                self.successes += 1
+                self.strikes = 0
+                return
+            self.failures += 1
+            self.throttled += throttled
+            self.strikes += 1
+            cooldown = min(max_cooldown, base_cooldown * 2 ** (self.strikes - 1))
+            self.quarantined_until = time.monotonic() + cooldown
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "successes": self.successes,
+                "failures": self.failures,
+                "throttled": self.throttled,
+                "latency": (
+                    round(self.latency, 3) if self.latency is not None else None
+                ),
+                "quarantined_seconds": round(
+                    max(0.0, self.quarantined_until - time.monotonic()), 1
+                ),
+            }
+
+
+_health: dict[tuple[str, Site | None], ProxyHealth] = {}
+_health_lock = threading.Lock()
+
+
+def _get_health(proxy: str, site: Site | None) -> ProxyHealth:
+    with _health_lock:
+        key = (proxy, site)
+        if key not in _health:
+            _health[key] = ProxyHealth()
+        return _health[key]
+
+
+def _redact(proxy: str) -> str:
+    parts = urlsplit(proxy)
+    if parts.password is None:
+        return proxy
+    netloc = f"{parts.username}:***@{parts.hostname}"
+    if parts.port:
+        netloc += f":{parts.port}"
+    return parts._replace(netloc=netloc).geturl()
+
+
+def proxy_stats() -> dict[str, dict[str, dict]]:
+    """
+    Health of every proxy used so far, by site, with passwords redacted
+    """
+    with _health_lock:
+        health = dict(_health)
+    stats: dict[str, dict[str, dict]] = {}
+    for (proxy, site), proxy_health in health.items():
+        site_name = site.value if site else "none"
+        stats.setdefault(site_name, {})[_redact(proxy)] = proxy_health.stats()
+    return stats
+
+
+class ProxyPool:
+    def __init__(
+        self,
+        proxies: list[str],
+        site: Site | None = None,
+        pin: bool = False,
+        base_cooldown: float = 15.0,
+        max_cooldown: float = 1800.0,
+    ):
+        """
+        :param proxies: proxy urls, DIRECT for no proxy
+        :param pin: keep using the first proxy chosen until it fails, for
+            flows whose cookies or tokens are bound to the client's IP
+        :param base_cooldown: quarantine after a failure, doubled for every
+            further failure in a row, up to max_cooldown
+        """
+        self.proxies = proxies
+        self.site = site
+        self.pin = pin
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.pinned: str | None = None
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def choose(self, exclude: str | None = None) -> str:
+        """
+        Picks a proxy, weighted by health score among those not quarantined.
+        If every proxy is quarantined, the one released soonest.
+        :param exclude: a proxy that just failed, never picked unless it is the
+            only one
+        """
+        now = time.monotonic()
+        health = {proxy: _get_health(proxy, self.site) for proxy in self.proxies}
+        released_at = {proxy: health[proxy].released_at() for proxy in self.proxies}
+        pinned = self.pinned
+        if pinned is not None and pinned != exclude and released_at[pinned] <= now:
+            return pinned
+        candidates = [
+            proxy
+            for proxy in health
+            if released_at[proxy] <= now and proxy != exclude
+        ]
+        if candidates:
+            weights = [health[proxy].score() for proxy in candidates]
+            proxy = random.choices(candidates, weights=weights)[0]
+        else:
+            fallback = {
+                proxy: released
+                for proxy, released in released_at.items()
+                if proxy != exclude or len(self.proxies) == 1
+            }
+            proxy = min(fallback, key=fallback.get)
+        if self.pin:
+            self.pinned = proxy
+        return proxy
+
+    def record(
+        self,
+        proxy: str,
+        status_code: int | None = None,
+        latency: float | None = None,
+    ) -> None:
+        """
+        :param status_code: None for a request that failed to connect
+        """
+        ok = status_code is not None and status_code not in BAD_STATUSES
+        _get_health(proxy, self.site).record(
+            ok, latency, status_code == 429, self.base_cooldown, self.max_cooldown
+        )
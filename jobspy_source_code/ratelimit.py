@@ -0,0 +1,262 @@
+"""
+jobspy.ratelimit
+~~~~~~~~~~~~~~~~
+
+Process-wide, per-host request pacing for every scraper session, replacing
+the fixed random sleeps between pages. Each host gets a token bucket whose
+rate adapts to the server (AIMD): a 429 / 503 halves it and a Retry-After
+header holds the host until then, while a run of successful responses adds
+back a little at a time, up to max_rate.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+THROTTLE_STATUSES = (429, 503)
+
+HOST_RATES = {
+    # the 3-7 s sleep between pages this replaced; successes ramp it up from there
+    "www.linkedin.com": 0.2,
+    "apis.indeed.com": 4.0,
+    "www.glassdoor.com": 4.0,
+    "api.ziprecruiter.com": 2.0,
+    "www.ziprecruiter.com": 4.0,
+    "www.google.com": 1.0,
+    "www.naukri.com": 1.0,
+    "www.bayt.com": 1.0,
+    "jobs.bdjobs.com": 2.0,
+}
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """
+    Parses a Retry-After header, either delay-seconds or an HTTP date
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostLimiter:
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 4,
+        min_rate: float = 0.1,
+        max_rate: float = 10.0,
+        increase: float = 0.5,
+        ramp_after: int = 20,
+        backoff: float = 0.5,
+        max_retry_after: float = 120.0,
+    ):
+        """
+        :param rate: requests per second to start at
+        :param burst: requests that may go out back to back after a quiet spell
+        :param increase: requests per second added after ramp_after successes
+        :param backoff: factor the rate is multiplied by on a 429 / 503
+        :param max_retry_after: cap on how long a Retry-After may hold the host
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, rate)
+        self.increase = increase
+        self.ramp_after = ramp_after
+        self.backoff = backoff
+        self.max_retry_after = max_retry_after
+        self.requests = 0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+        # the bucket is kept as the time the next request is due (GCRA), so
+        # callers reserve a slot under the lock and sleep outside it
+        self._next = 0.0
+        self._blocked_until = 0.0
+        self._last_backoff = 0.0
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes the next request slot
+        :return: seconds to wait before sending
+        """
+        with self._lock:
+            now = time.monotonic()
+            interval = 1 / self.rate
+            start = max(
+                now,
+                self._next - (self.burst - 1) * interval,
+                self._blocked_until,
+            )
+            self._next = max(self._next, start) + interval
+            wait = start - now
+            self.requests += 1
+            self.waited_seconds += wait
+            return wait
+
+    def record(self, status_code: int, retry_after: float | None = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if status_code in THROTTLE_STATUSES:
+                self.throttled += 1
+                self._successes = 0
+                # responses to requests already in flight report the same
+                # throttling, back off once per interval
+                if now - self._last_backoff >= 1 / self.rate:
+                    self.rate = max(self.min_rate, self.rate * self.backoff)
+                    self._last_backoff = now
+                if retry_after is not None:
+                    self._blocked_until = max(
+                        self._blocked_until,
+                        now + min(retry_after, self.max_retry_after),
+                    )
+            elif status_code < 400:
+                self._successes += 1
+                if self._successes >= self.ramp_after:
+                    self._successes = 0
+                    self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "waited_seconds": round(self.waited_seconds, 3),
+                "blocked_seconds": round(
+                    max(0.0, self._blocked_until - time.monotonic()), 3
+                ),
+            }
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        default_rate: float = 2.0,
+        host_rates: dict[str, float] | None = None,
+        burst: int = 4,
+        min_rate: float = 0.1,
+        max_rate: float = 10.0,
+        increase: float = 0.5,
+        ramp_after: int = 20,
+        backoff: float = 0.5,
+        max_retry_after: float = 120.0,
+        enabled: bool = True,
+    ):
+        """
+        :param default_rate: starting requests per second for hosts missing
+            from host_rates
+        :param host_rates: starting requests per second by host name
+        :param enabled: False sends every request straight away
+        """
+        self.default_rate = default_rate
+        self.host_rates = {**HOST_RATES, **(host_rates or {})}
+        self.enabled = enabled
+        self._options = dict(
+            burst=burst,
+            min_rate=min_rate,
+            max_rate=max_rate,
+            increase=increase,
+            ramp_after=ramp_after,
+            backoff=backoff,
+            max_retry_after=max_retry_after,
+        )
+        self._hosts: dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, url: str) -> HostLimiter:
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            if host not in self._hosts:
+                rate = self.host_rates.get(host, self.default_rate)
+                self._hosts[host] = HostLimiter(rate, **self._options)
+            return self._hosts[host]
+
+    def reserve(self, url: str) -> float:
+        """
+        :return: seconds to wait before sending a request to url
+        """
+        if not self.enabled:
+            return 0.0
+        return self.limiter(url).reserve()
+
+    def wait(self, url: str) -> None:
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    def record(self, url: str, status_code: int, headers=None) -> None:
+        """
+        Feeds a response back into the host's rate
+        """
+        if not self.enabled:
+            return
+        retry_after = next(
+            (
+                value
+                for name, value in (headers or {}).items()
+                if name.lower() == "retry-after"
+            ),
+            None,
+        )
+        self.limiter(url).record(status_code, retry_after_seconds(retry_after))
+
+    def stats(self) -> dict[str, dict]:
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {host: limiter.stats() for host, limiter in sorted(hosts.items())}
+
+
+_rate_limiter = RateLimiter()
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    return _rate_limiter
+
+
+def configure_rate_limiter(
+    default_rate: float = 2.0,
+    host_rates: dict[str, float] | None = None,
+    burst: int = 4,
+    min_rate: float = 0.1,
+    max_rate: float = 10.0,
+    increase: float = 0.5,
+    ramp_after: int = 20,
+    backoff: float = 0.5,
+    max_retry_after: float = 120.0,
+    enabled: bool = True,
+) -> RateLimiter:
+    """
+    Replaces the process-wide rate limiter, starting every host afresh
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = RateLimiter(
+            default_rate=default_rate,
+            host_rates=host_rates,
+            burst=burst,
+            min_rate=min_rate,
+            max_rate=max_rate,
+            increase=increase,
+            ramp_after=ramp_after,
+            backoff=backoff,
+            max_retry_after=max_retry_after,
+            enabled=enabled,
+        )
+    return _rate_limiter
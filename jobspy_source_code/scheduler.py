@@ -0,0 +1,227 @@
+"""
+jobspy.scheduler
+~~~~~~~~~~~~~~~~
+
+Process-wide concurrency control shared by every scrape_jobs call. Each site
+gets a cap on in-flight HTTP requests and on fan-out worker threads (detail
+fetches), and a global cap bounds requests across all sites, so ten concurrent
+API searches share one budget per job board instead of each opening their own.
+It also sets how many results pages the scrapers fetch ahead (jobspy.pipeline)
+and runs the fetch-ahead loops on a pool of their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable
+
+from jobspy.model import Site
+
+DEFAULT_SITE_LIMITS = {
+    Site.LINKEDIN: 4,
+    Site.INDEED: 8,
+    Site.ZIP_RECRUITER: 8,
+    Site.GLASSDOOR: 8,
+    Site.GOOGLE: 4,
+    Site.BAYT: 4,
+    Site.NAUKRI: 4,
+    Site.BDJOBS: 4,
+}
+
+
+class Scheduler:
+    def __init__(
+        self,
+        max_workers: int = 32,
+        site_limits: dict[Site, int] | None = None,
+        default_site_limit: int = 4,
+        max_scrapes: int = 32,
+        page_lookahead: int = 1,
+        max_lookaheads: int = 16,
+    ):
+        """
+        :param max_workers: global cap on in-flight requests and fan-out threads
+        :param site_limits: per-site cap on in-flight requests and fan-out threads
+        :param default_site_limit: cap for sites missing from site_limits
+        :param max_scrapes: number of site scrapes that run at once across calls
+        :param page_lookahead: results pages a scraper fetches ahead of the one
+            it is processing, 0 to paginate strictly one page at a time
+        :param max_lookaheads: scrapes that fetch pages ahead at once; others
+            paginate one page at a time until one finishes
+        """
+        self.max_workers = max_workers
+        self.page_lookahead = page_lookahead
+        self.max_lookaheads = max_lookaheads
+        self.site_limits = {**DEFAULT_SITE_LIMITS, **(site_limits or {})}
+        self.default_site_limit = default_site_limit
+        self._global = threading.BoundedSemaphore(max_workers)
+        self._request_slots: dict[Site, threading.BoundedSemaphore] = {}
+        self._task_slots: dict[Site, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._task_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="jobspy-task"
+        )
+        self._scrape_executor = ThreadPoolExecutor(
+            max_workers=max_scrapes, thread_name_prefix="jobspy-scrape"
+        )
+        self._lookahead_slots = threading.BoundedSemaphore(max_lookaheads)
+        self._lookahead_executor = ThreadPoolExecutor(
+            max_workers=max_lookaheads, thread_name_prefix="jobspy-pages"
+        )
+        self._lookahead_stats = {"running": 0, "started": 0, "declined": 0}
+
+    def site_limit(self, site: Site) -> int:
+        return self.site_limits.get(site, self.default_site_limit)
+
+    def _slot(
+        self, slots: dict[Site, threading.BoundedSemaphore], site: Site
+    ) -> threading.BoundedSemaphore:
+        with self._lock:
+            if site not in slots:
+                slots[site] = threading.BoundedSemaphore(self.site_limit(site))
+            return slots[site]
+
+    @contextmanager
+    def request_slot(self, site: Site | None):
+        """Holds a per-site and a global request slot for the duration of a request"""
+        if site is None:
+            yield
+            return
+        with self._slot(self._request_slots, site):
+            with self._global:
+                yield
+
+    @asynccontextmanager
+    async def async_request_slot(self, site: Site | None):
+        """
+        request_slot for coroutines: the same slots, so async and threaded
+        scrapes share one budget, waited for without blocking the event loop
+        """
+        if site is None:
+            yield
+            return
+        site_slot = self._slot(self._request_slots, site)
+        await _acquire(site_slot)
+        try:
+            await _acquire(self._global)
+            try:
+                yield
+            finally:
+                self._global.release()
+        finally:
+            site_slot.release()
+
+    def submit(self, site: Site, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Runs fn on the shared worker pool. Blocks the caller while the site
+        already has site_limit tasks running, so one page of 30 detail fetches
+        can't take over the pool.
+        """
+        slot = self._slot(self._task_slots, site)
+        slot.acquire()
+        context = contextvars.copy_context()
+        try:
+            future = self._task_executor.submit(context.run, fn, *args, **kwargs)
+        except BaseException:
+            slot.release()
+            raise
+        future.add_done_callback(lambda _: slot.release())
+        return future
+
+    def submit_scrape(self, fn: Callable, *args, **kwargs) -> Future:
+        """Runs a whole site scrape on the shared scrape pool"""
+        context = contextvars.copy_context()
+        return self._scrape_executor.submit(context.run, fn, *args, **kwargs)
+
+    def submit_lookahead(self, fn: Callable, *args, **kwargs) -> Future | None:
+        """
+        Runs a pagination fetch-ahead loop on the lookahead pool. Returns None
+        instead of queueing when max_lookaheads are already running, since the
+        caller would be left waiting on a page nobody is fetching; it then
+        paginates one page at a time.
+        """
+        if not self._lookahead_slots.acquire(blocking=False):
+            with self._lock:
+                self._lookahead_stats["declined"] += 1
+            return None
+        with self._lock:
+            self._lookahead_stats["running"] += 1
+            self._lookahead_stats["started"] += 1
+        context = contextvars.copy_context()
+        try:
+            future = self._lookahead_executor.submit(context.run, fn, *args, **kwargs)
+        except BaseException:
+            self._lookahead_done()
+            raise
+        future.add_done_callback(lambda _: self._lookahead_done())
+        return future
+
+    def _lookahead_done(self):
+        with self._lock:
+            self._lookahead_stats["running"] -= 1
+        self._lookahead_slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookaheads = dict(self._lookahead_stats)
+        return {
+            "page_lookahead": self.page_lookahead,
+            "lookaheads": {**lookaheads, "max": self.max_lookaheads},
+        }
+
+    def shutdown(self, wait: bool = False):
+        self._task_executor.shutdown(wait=wait)
+        self._scrape_executor.shutdown(wait=wait)
+        self._lookahead_executor.shutdown(wait=wait)
+
+
+async def _acquire(semaphore: threading.BoundedSemaphore) -> None:
+    # threading semaphores can't be awaited, so poll with a growing interval
+    delay = 0.001
+    while not semaphore.acquire(blocking=False):
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.05)
+
+
+_scheduler: Scheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = Scheduler()
+        return _scheduler
+
+
+def configure_scheduler(
+    max_workers: int = 32,
+    site_limits: dict[Site, int] | None = None,
+    default_site_limit: int = 4,
+    max_scrapes: int = 32,
+    page_lookahead: int = 1,
+    max_lookaheads: int = 16,
+) -> Scheduler:
+    """
+    Replaces the process-wide scheduler. Work already running on the previous
+    one finishes there.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        previous = _scheduler
+        _scheduler = Scheduler(
+            max_workers=max_workers,
+            site_limits=site_limits,
+            default_site_limit=default_site_limit,
+            max_scrapes=max_scrapes,
+            page_lookahead=page_lookahead,
+            max_lookaheads=max_lookaheads,
+        )
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return _scheduler
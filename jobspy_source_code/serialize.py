@@ -0,0 +1,141 @@
+"""
+jobspy.serialize
+~~~~~~~~~~~~~~~~
+
+JSON encoding of job results. jobs_to_records turns a scrape_jobs DataFrame
+into JSON-ready dicts a column at a time (missing values become None with one
+vectorized step per column instead of a pd.isna call per cell), and dumps
+encodes with orjson when it is installed, which writes dates and datetimes
+natively, falling back to the json module.
+
+dumps_tagged / loads_tagged are for values that must come back as they went
+in (the caches): enums, tuples, dates and datetimes are tagged and restored.
+Unlike pickle, decoding only ever builds plain values and the jobspy.model
+enums, so a tampered cache file can't run code.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+import pandas as pd
+
+from jobspy.model import (
+    CompensationInterval,
+    Country,
+    DescriptionFormat,
+    JobType,
+    SalarySource,
+    Site,
+)
+
+# orjson is optional, it encodes several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    :return: obj as UTF-8 JSON; dates and datetimes as ISO 8601 strings
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_default, ensure_ascii=False).encode()
+
+
+def jobs_to_records(jobs_df: pd.DataFrame) -> list[dict]:
+    """
+    :return: one dict per row, NaN / NaT / None as None and every value a
+        plain Python object dumps can encode
+    """
+    columns = [
+        jobs_df[column].astype(object).where(jobs_df[column].notna(), None).tolist()
+        for column in jobs_df.columns
+    ]
+    names = list(jobs_df.columns)
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+_ENUMS = {
+    cls.__name__: cls
+    for cls in (
+        CompensationInterval,
+        Country,
+        DescriptionFormat,
+        JobType,
+        SalarySource,
+        Site,
+    )
+}
+_TAGS = {"$enum", "$tuple", "$date", "$datetime", "$dict"}
+
+
+def _tag(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return {"$enum": [type(value).__name__, value.name]}
+    if isinstance(value, tuple):
+        return {"$tuple": [_tag(item) for item in value]}
+    if isinstance(value, list):
+        return [_tag(item) for item in value]
+    if isinstance(value, dict):
+        tagged = {key: _tag(item) for key, item in value.items()}
+        # a dict that would read as a tag is wrapped
+        return {"$dict": tagged} if len(value) == 1 and set(value) & _TAGS else tagged
+    # datetime before date, it is a subclass
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    return value
+
+
+def _untag(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_untag(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        ((tag, item),) = value.items()
+        if tag == "$enum":
+            return _ENUMS[item[0]][item[1]]
+        if tag == "$tuple":
+            return tuple(_untag(i) for i in item)
+        if tag == "$date":
+            return date.fromisoformat(item)
+        if tag == "$datetime":
+            return datetime.fromisoformat(item)
+        if tag == "$dict":
+            return {key: _untag(i) for key, i in item.items()}
+    return {key: _untag(item) for key, item in value.items()}
+
+
+def dumps_tagged(obj: Any) -> bytes:
+    """
+    :return: obj as UTF-8 JSON that loads_tagged turns back into an equal
+        value, enums, tuples, dates and datetimes included
+    """
+    return dumps(_tag(obj))
+
+
+def loads_tagged(data: bytes) -> Any:
+    """
+    :raise ValueError: data isn't what dumps_tagged wrote
+    """
+    try:
+        value = orjson.loads(data) if orjson is not None else json.loads(data)
+        return _untag(value)
+    except (KeyError, TypeError, IndexError) as e:
+        raise ValueError(f"not a tagged value: {e}") from e
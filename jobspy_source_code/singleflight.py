@@ -0,0 +1,138 @@
+"""
+jobspy.singleflight
+~~~~~~~~~~~~~~~~~~~
+
+Coalescing of identical concurrent searches. The first scrape_jobs call for a
+search runs it; identical calls that arrive while it is still running wait for
+it and share its result instead of scraping the same boards again. Nothing is
+kept once the search finishes, so a shared result is never stale (repeats
+after that are the result cache's job, see jobspy.cache).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+from jobspy.cache import KEY_EXCLUDE
+from jobspy.metrics import COALESCED_SEARCHES, Counter
+from jobspy.model import ScraperInput
+
+
+def search_key(scraper_input: ScraperInput, **options) -> str:
+    """
+    Canonical hash of a whole search: the ScraperInput, with its sites in any
+    order, plus the scrape_jobs options that change what comes back
+    """
+    fields = scraper_input.model_dump(mode="json", exclude=KEY_EXCLUDE)
+    fields["sites"] = sorted(site.value for site in scraper_input.site_type)
+    fields.update(options)
+    canonical = json.dumps(fields, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self, counter: Counter | None = COALESCED_SEARCHES):
+        """
+        :param counter: metric counting the calls that waited on another, None
+            for none
+        """
+        self.counter = counter
+        self.searches = 0
+        self.coalesced = 0
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> tuple[Any, bool, int]:
+        """
+        Runs fn, unless a call with the same key is already running, in which
+        case waits for that one and returns (or raises) what it did
+        :return: the result, whether it came from another caller's call, and
+            how many callers waited on the call that produced it
+        """
+        call, leader = self._join(key)
+        if not leader:
+            call.done.wait()
+            return self._shared(call)
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._leave(key, call)
+        return call.result, False, call.waiters
+
+    async def do_async(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool, int]:
+        """
+        do for coroutines: fn is awaited, and a waiter waits on a worker thread
+        so the event loop keeps running the leader. Async and threaded calls
+        with the same key coalesce with each other.
+        """
+        call, leader = self._join(key)
+        if not leader:
+            await asyncio.to_thread(call.done.wait)
+            return self._shared(call)
+        try:
+            call.result = await fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._leave(key, call)
+        return call.result, False, call.waiters
+
+    def _join(self, key: Hashable) -> tuple[_Call, bool]:
+        """:return: the running call for key, and whether this caller leads it"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.searches += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+        if not leader and self.counter is not None:
+            self.counter.inc()
+        return call, leader
+
+    @staticmethod
+    def _shared(call: _Call) -> tuple[Any, bool, int]:
+        if call.error is not None:
+            raise call.error
+        return call.result, True, call.waiters
+
+    def _leave(self, key: Hashable, call: _Call) -> None:
+        # callers arriving from here on start a new call
+        with self._lock:
+            del self._calls[key]
+        call.done.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "searches": self.searches,
+                "coalesced": self.coalesced,
+            }
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _single_flight
@@ -0,0 +1,112 @@
+"""
+jobspy.store
+~~~~~~~~~~~~
+
+Local SQLite store of every job row scrape_jobs has returned, keyed by the
+job id (li-…, in-…, gd-…). Lets scheduled runs ask for only the jobs they
+haven't seen before instead of de-duplicating downstream.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Iterable
+
+
+class JobStore:
+    def __init__(self, path: str = "jobspy_jobs.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    site TEXT,
+                    title TEXT,
+                    company TEXT,
+                    date_posted TEXT,
+                    job_url TEXT,
+                    data TEXT NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL
+                )
+                """
+            )
+            for column in ("site", "date_posted", "company"):
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS jobs_{column} ON jobs ({column})"
+                )
+
+    def known_ids(self, job_ids: Iterable[str]) -> set[str]:
+        """
+        :return: the subset of job_ids already in the store
+        """
+        job_ids = [job_id for job_id in job_ids if job_id]
+        known = set()
+        with self._lock:
+            # stay under SQLite's bound parameter limit
+            for i in range(0, len(job_ids), 500):
+                chunk = job_ids[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT id FROM jobs WHERE id IN ({placeholders})", chunk
+                ).fetchall()
+                known.update(row[0] for row in rows)
+        return known
+
+    def upsert(self, rows: list[dict]) -> None:
+        """
+        Inserts new job rows and refreshes the stored copy of known ones,
+        keeping their first_seen time. Rows without an id are skipped.
+        """
+        now = datetime.now().isoformat()
+        values = [
+            (
+                row["id"],
+                row.get("site"),
+                row.get("title"),
+                row.get("company"),
+                str(row["date_posted"]) if row.get("date_posted") else None,
+                row.get("job_url"),
+                json.dumps(row, default=str),
+                now,
+                now,
+            )
+            for row in rows
+            if row.get("id")
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    site = excluded.site,
+                    title = excluded.title,
+                    company = excluded.company,
+                    date_posted = excluded.date_posted,
+                    job_url = excluded.job_url,
+                    data = excluded.data,
+                    last_seen = excluded.last_seen
+                """,
+                values,
+            )
+
+    def get(self, job_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
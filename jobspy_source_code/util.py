@@ -2,19 +2,55 @@ from __future__ import annotations
 
 import logging
 import re
-from itertools import cycle
+import time
 
 import numpy as np
 import requests
 import tls_client
 import urllib3
+from bs4 import BeautifulSoup, SoupStrainer
 from markdownify import markdownify as md
-from requests.adapters import HTTPAdapter, Retry
+from requests.adapters import Retry
 
+from jobspy.cassette import play_request
+from jobspy.circuit import get_circuit_breaker
+from jobspy.metrics import record_request
 from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.profiling import add_phase, add_request, phase
+from jobspy.proxy import DIRECT, ProxyPool
+from jobspy.ratelimit import get_rate_limiter
+from jobspy.scheduler import get_scheduler
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# lxml is optional, it builds trees several times faster than html.parser
+try:
+    import lxml  # noqa: F401
+
+    DEFAULT_HTML_PARSER = "lxml"
+except ImportError:
+    DEFAULT_HTML_PARSER = "html.parser"
+
+_html_parser = DEFAULT_HTML_PARSER
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def is_idempotent(method: str) -> bool:
+    """Whether sending the request twice can't do anything sending it once doesn't"""
+    return method.upper() in Retry.DEFAULT_ALLOWED_METHODS
+
+
+def failed_to_connect(error: BaseException) -> bool:
+    """
+    Whether a requests error happened before the request went out (no
+    connection to the host or proxy), so sending it again can't repeat it
+    """
+    if isinstance(error, (requests.ConnectTimeout, requests.exceptions.ProxyError)):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
 
 def create_logger(name: str):
     logger = logging.getLogger(f"JobSpy:{name}")
@@ -30,17 +66,18 @@ def create_logger(name: str):
 
 
 class RotatingProxySession:
-    def __init__(self, proxies=None):
+    def __init__(self, proxies=None, site=None, pin_proxy=False):
         if isinstance(proxies, str):
-            self.proxy_cycle = cycle([self.format_proxy(proxies)])
-        elif isinstance(proxies, list):
-            self.proxy_cycle = (
-                cycle([self.format_proxy(proxy) for proxy in proxies])
-                if proxies
-                else None
+            proxies = [proxies]
+        self.proxy_pool = (
+            ProxyPool(
+                [self.format_proxy(proxy)["http"] for proxy in proxies],
+                site=site,
+                pin=pin_proxy,
             )
-        else:
-            self.proxy_cycle = None
+            if proxies
+            else None
+        )
 
     @staticmethod
     def format_proxy(proxy):
@@ -51,54 +88,146 @@ class RotatingProxySession:
             return {"http": proxy, "https": proxy}
         return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
 
+    @staticmethod
+    def proxy_dict(proxy: str | None) -> dict | None:
+        if proxy is None:
+            return None
+        return {} if proxy == DIRECT else {"http": proxy, "https": proxy}
+
+    def dispatch(self, method, url, send):
+        """
+        Sends a request through the rate limiter, the site's scheduler slot and
+        the proxy pool, feeding the outcome to the circuit breaker and metrics
+        """
+        rate_limiter = get_rate_limiter()
+        with phase("sleep", self.site):
+            rate_limiter.wait(url)
+        circuit_breaker = get_circuit_breaker()
+        queued = time.perf_counter()
+        with get_scheduler().request_slot(self.site):
+            start = time.perf_counter()
+            add_phase("queue", start - queued, self.site)
+            try:
+                response = self.send_via_proxy(method, send)
+            except Exception:
+                circuit_breaker.record(self.site, None)
+                record_request(self.site, None, time.perf_counter() - start)
+                raise
+        seconds = time.perf_counter() - start
+        add_phase("network", seconds, self.site)
+        add_request(self.site, len(response.content))
+        record_request(self.site, response.status_code, seconds)
+        circuit_breaker.record(self.site, response.status_code)
+        rate_limiter.record(url, response.status_code, response.headers)
+        return response
+
+    def send_via_proxy(self, method, send):
+        """
+        Calls send(proxy) with a proxy from the pool and records how it went.
+        A request that fails to go through is retried once on another proxy,
+        if it is idempotent or never got a connection through the first one.
+        """
+        if self.proxy_pool is None:
+            return send(None)
+        attempts = min(2, len(self.proxy_pool))
+        proxy = None
+        for attempt in range(attempts):
+            proxy = self.proxy_pool.choose(exclude=proxy)
+            start = time.perf_counter()
+            try:
+                response = send(proxy)
+            except Exception as e:
+                self.proxy_pool.record(proxy)
+                if attempt == attempts - 1:
+                    raise
+                if not (is_idempotent(method) or failed_to_connect(e)):
+                    raise
+                continue
+            self.proxy_pool.record(
+                proxy, response.status_code, time.perf_counter() - start
+            )
+            return response
+
 
 class RequestsRotating(RotatingProxySession, requests.Session):
-    def __init__(self, proxies=None, has_retry=False, delay=1, clear_cookies=False):
-        RotatingProxySession.__init__(self, proxies=proxies)
+    def __init__(
+        self,
+        proxies=None,
+        has_retry=False,
+        delay=1,
+        clear_cookies=False,
+        site=None,
+        pin_proxy=False,
+    ):
+        RotatingProxySession.__init__(
+            self, proxies=proxies, site=site, pin_proxy=pin_proxy
+        )
         requests.Session.__init__(self)
+        self.site = site
         self.clear_cookies = clear_cookies
         self.allow_redirects = True
         self.setup_session(has_retry, delay)
 
     def setup_session(self, has_retry, delay):
-        if has_retry:
-            retries = Retry(
-                total=3,
-                connect=3,
-                status=3,
-                status_forcelist=[500, 502, 503, 504, 429],
-                backoff_factor=delay,
-            )
-            adapter = HTTPAdapter(max_retries=retries)
-            self.mount("http://", adapter)
-            self.mount("https://", adapter)
+        # retried in _execute rather than by a urllib3 Retry on the adapter, so
+        # each attempt takes its own scheduler slot and backoff holds none
+        self.retries = 3 if has_retry else 0
+        self.delay = delay
 
     def request(self, method, url, **kwargs):
         if self.clear_cookies:
             self.cookies.clear()
+        return play_request(
+            method, url, kwargs, lambda: self._execute(method, url, **kwargs)
+        )
 
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
+    def _execute(self, method, url, **kwargs):
+        def send(proxy):
+            return requests.Session.request(
+                self, method, url, proxies=self.proxy_dict(proxy), **kwargs
+            )
+
+        # a request that may have reached the site is only sent again when
+        # that's harmless; one that never got a connection always can be
+        idempotent = is_idempotent(method)
+        attempt = 0
+        while True:
+            try:
+                response = self.dispatch(method, url, send)
+            except requests.ConnectionError as e:
+                if attempt >= self.retries or not (idempotent or failed_to_connect(e)):
+                    raise
             else:
-                self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
+                if not idempotent or response.status_code not in RETRY_STATUSES:
+                    return response
+                if attempt >= self.retries:
+                    return response
+            with phase("sleep", self.site):
+                time.sleep(self.delay * (2**attempt))
+            attempt += 1
 
 
 class TLSRotating(RotatingProxySession, tls_client.Session):
-    def __init__(self, proxies=None):
-        RotatingProxySession.__init__(self, proxies=proxies)
+    def __init__(self, proxies=None, site=None, pin_proxy=False):
+        RotatingProxySession.__init__(
+            self, proxies=proxies, site=site, pin_proxy=pin_proxy
+        )
         tls_client.Session.__init__(self, random_tls_extension_order=True)
+        self.site = site
 
-    def execute_request(self, *args, **kwargs):
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
+    def execute_request(self, method, url, **kwargs):
+        return play_request(
+            method, url, kwargs, lambda: self._execute(method, url, **kwargs)
+        )
+
+    def _execute(self, method, url, **kwargs):
+        response = self.dispatch(
+            method,
+            url,
+            lambda proxy: tls_client.Session.execute_request(
+                self, method, url, proxy=self.proxy_dict(proxy), **kwargs
+            ),
+        )
         response.ok = response.status_code in range(200, 400)
         return response
 
@@ -111,19 +240,27 @@ def create_session(
     has_retry: bool = False,
     delay: int = 1,
     clear_cookies: bool = False,
+    site: Site | None = None,
+    pin_proxy: bool = False,
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
-    :return: A session object
+    :param site: requests wait for one of the site's slots in the process-wide scheduler
+        and are paced per host by jobspy.ratelimit
+    :param pin_proxy: stick to one proxy while it stays healthy, for cookie or token
+        bound flows; otherwise each request picks from the jobspy.proxy pool
+    :return: A session object, whose requests go through jobspy.cassette when one is in use
     """
     if is_tls:
-        session = TLSRotating(proxies=proxies)
+        session = TLSRotating(proxies=proxies, site=site, pin_proxy=pin_proxy)
     else:
         session = RequestsRotating(
             proxies=proxies,
             has_retry=has_retry,
             delay=delay,
             clear_cookies=clear_cookies,
+            site=site,
+            pin_proxy=pin_proxy,
         )
 
     if ca_cert:
@@ -151,6 +288,26 @@ def set_logger_level(verbose: int):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
+def set_html_parser(parser: str = DEFAULT_HTML_PARSER):
+    """
+    Selects the BeautifulSoup tree builder parse_html uses for every scraper:
+    "lxml" (default when installed), "html.parser" or "html5lib"
+    """
+    global _html_parser
+    BeautifulSoup("", parser)  # raises FeatureNotFound for a missing parser
+    _html_parser = parser
+
+
+def parse_html(markup: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    """
+    Parses markup with the configured parser
+    :param parse_only: builds only the matching elements (and their children)
+        into the tree, for pages where a handful of nodes are needed
+    """
+    with phase("parse"):
+        return BeautifulSoup(markup, _html_parser, parse_only=parse_only)
+
+
 def markdown_converter(description_html: str):
     if description_html is None:
         return None
@@ -158,10 +315,9 @@ def markdown_converter(description_html: str):
     return markdown.strip()
 
 def plain_converter(decription_html:str):
-    from bs4 import BeautifulSoup
     if decription_html is None:
         return None
-    soup = BeautifulSoup(decription_html, "html.parser")
+    soup = parse_html(decription_html)
     text = soup.get_text(separator=" ")
     text = re.sub(r'\s+',' ',text)
     return text.strip()
@@ -3,19 +3,20 @@ from __future__ import annotations
 import json
 import math
 import re
-import time
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
+from jobspy.cache import cached_details
+from jobspy.converter import convert_description
+from jobspy.pipeline import paginate
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
+from jobspy.scheduler import get_scheduler
 from jobspy.util import (
     extract_emails_from_text,
     create_session,
-    markdown_converter,
     remove_attributes,
     create_logger,
+    parse_html,
 )
 from jobspy.model import (
     JobPost,
@@ -46,11 +47,10 @@ class ZipRecruiter(Scraper):
         super().__init__(Site.ZIP_RECRUITER, proxies=proxies)
 
         self.scraper_input = None
-        self.session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session = create_session(proxies=proxies, ca_cert=ca_cert, site=self.site)
         self.session.headers.update(headers)
         self._get_cookies()
 
-        self.delay = 5
         self.jobs_per_page = 20
         self.seen_urls = set()
 
@@ -62,37 +62,40 @@ class ZipRecruiter(Scraper):
         """
         self.scraper_input = scraper_input
         job_list: list[JobPost] = []
-        continue_token = None
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
-        for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
-                break
-            if page > 1:
-                time.sleep(self.delay)
-            log.info(f"search page: {page} / {max_pages}")
-            jobs_on_page, continue_token = self._find_jobs_in_page(
-                scraper_input, continue_token
-            )
-            if jobs_on_page:
-                job_list.extend(jobs_on_page)
-            else:
-                break
-            if not continue_token:
-                break
+        # the next page is requested while this one's jobs are processed
+        pages = paginate(
+            self._fetch_page,
+            max_pages=max_pages,
+            wanted=scraper_input.results_wanted,
+            deadline=scraper_input.deadline,
+        )
+        with closing(pages):
+            for page, jobs_json in enumerate(pages, 1):
+                log.info(f"search page: {page} / {max_pages}")
+                jobs_on_page = self._process_page(jobs_json)
+                if jobs_on_page:
+                    job_list.extend(jobs_on_page)
+                    self._publish(job_list)
+                else:
+                    break
+                if self._page_all_known(jobs_on_page):
+                    break
+                if len(job_list) >= scraper_input.results_wanted:
+                    break
+                if self._deadline_reached():
+                    break
         return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
-    def _find_jobs_in_page(
-        self, scraper_input: ScraperInput, continue_token: str | None = None
-    ) -> tuple[list[JobPost], str | None]:
+    def _fetch_page(self, continue_token: str | None = None) -> tuple[list[dict], str]:
         """
-        Scrapes a page of ZipRecruiter for jobs with scraper_input criteria
-        :param scraper_input:
+        Requests a page of ZipRecruiter search results
         :param continue_token:
-        :return: jobs found on page
+        :return: the page's job dicts and the next page's token
         """
         jobs_list = []
-        params = add_params(scraper_input)
+        params = add_params(self.scraper_input)
         if continue_token:
             params["continue_from"] = continue_token
         try:
@@ -113,13 +116,14 @@ class ZipRecruiter(Scraper):
             return jobs_list, ""
 
         res_data = res.json()
-        jobs_list = res_data.get("jobs", [])
-        next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
+        return res_data.get("jobs", []), res_data.get("continue", None)
 
-        job_list = list(filter(None, (result.result() for result in job_results)))
-        return job_list, next_continue_token
+    def _process_page(self, jobs_list: list[dict]) -> list[JobPost]:
+        scheduler = get_scheduler()
+        job_results = [
+            scheduler.submit(self.site, self._process_job, job) for job in jobs_list
+        ]
+        return list(filter(None, (result.result() for result in job_results)))
 
     def _process_job(self, job: dict) -> JobPost | None:
         """
@@ -134,7 +138,7 @@ class ZipRecruiter(Scraper):
         description = job.get("job_description", "").strip()
         listing_type = job.get("buyer_type", "")
         description = (
-            markdown_converter(description)
+            convert_description(description, DescriptionFormat.MARKDOWN)
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN
             else description
         )
@@ -154,7 +158,9 @@ class ZipRecruiter(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
+        description_full, job_url_direct = (
+            self._get_descr(job_url) if self._should_fetch_details() else (None, None)
+        )
 
         return JobPost(
             id=f'zr-{job["listing_key"]}',
@@ -176,38 +182,61 @@ class ZipRecruiter(Scraper):
             listing_type=listing_type,
         )
 
+    def fetch_job_details(self, job_key: str) -> dict:
+        """
+        :param job_key: ZipRecruiter listing key without the zr- prefix
+        :return: dict
+        """
+        description, job_url_direct = self._get_descr(
+            f"{self.base_url}/jobs//j?lvk={job_key}"
+        )
+        return {"description": description, "job_url_direct": job_url_direct}
+
     def _get_descr(self, job_url):
+        """Description and direct url of a job page, read through the detail cache"""
+        return cached_details(self, job_url, lambda: self._request_descr(job_url))
+
+    def _request_descr(self, job_url):
         res = self.session.get(job_url, allow_redirects=True)
-        description_full = job_url_direct = None
-        if res.ok:
-            soup = BeautifulSoup(res.text, "html.parser")
-            job_descr_div = soup.find("div", class_="job_description")
-            company_descr_section = soup.find("section", class_="company_description")
-            job_description_clean = (
-                remove_attributes(job_descr_div).prettify(formatter="html")
-                if job_descr_div
-                else ""
-            )
-            company_description_clean = (
-                remove_attributes(company_descr_section).prettify(formatter="html")
-                if company_descr_section
-                else ""
+        if not res.ok:
+            return None, None
+        return self._parse_descr(res.text)
+
+    def _parse_descr(self, html: str):
+        """
+        Parses the job and company description and the direct job url out of a job page
+        """
+        job_url_direct = None
+        soup = parse_html(html)
+        job_descr_div = soup.find("div", class_="job_description")
+        company_descr_section = soup.find("section", class_="company_description")
+        job_description_clean = (
+            remove_attributes(job_descr_div).prettify(formatter="html")
+            if job_descr_div
+            else ""
+        )
+        company_description_clean = (
+            remove_attributes(company_descr_section).prettify(formatter="html")
+            if company_descr_section
+            else ""
+        )
+        description_full = job_description_clean + company_description_clean
+
+        try:
+            script_tag = soup.find("script", type="application/json")
+            if script_tag:
+                job_json = json.loads(script_tag.string)
+                job_url_val = job_json["model"].get("saveJobURL", "")
+                m = re.search(r"job_url=(.+)", job_url_val)
+                if m:
+                    job_url_direct = m.group(1)
+        except:
+            job_url_direct = None
+
+        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            description_full = convert_description(
+                description_full, DescriptionFormat.MARKDOWN
             )
-            description_full = job_description_clean + company_description_clean
-
-            try:
-                script_tag = soup.find("script", type="application/json")
-                if script_tag:
-                    job_json = json.loads(script_tag.string)
-                    job_url_val = job_json["model"].get("saveJobURL", "")
-                    m = re.search(r"job_url=(.+)", job_url_val)
-                    if m:
-                        job_url_direct = m.group(1)
-            except:
-                job_url_direct = None
-
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description_full = markdown_converter(description_full)
 
         return description_full, job_url_direct
 
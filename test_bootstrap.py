@@ -0,0 +1,112 @@
+"""
+Tests for jobspy.glassdoor.bootstrap
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jobspy.glassdoor.bootstrap import BootstrapCache
+from jobspy.metrics import COALESCED_SEARCHES
+
+KEY = ("https://www.glassdoor.com", None)
+
+
+def age(cache: BootstrapCache, kind: str, seconds: float):
+    """Backdates the cached entry by seconds"""
+    fetched_at, value = cache._entries[(kind, KEY)]
+    cache._entries[(kind, KEY)] = (fetched_at - seconds, value)
+
+
+def wait_for_refresh(cache: BootstrapCache):
+    deadline = time.monotonic() + 5
+    while cache._refreshing:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_serves_a_stale_token_while_refreshing_it():
+    cache = BootstrapCache(token_ttl=10, refresh_after=0.5)
+    assert cache.token(KEY, lambda: "first") == "first"
+    age(cache, "token", 6)
+    refreshed = threading.Event()
+
+    def refresh():
+        refreshed.set()
+        return "second"
+
+    def no_fetch():
+        pytest.fail("fetched inline")
+
+    assert cache.token(KEY, no_fetch, refresh) == "first"
+    assert refreshed.wait(5)
+    wait_for_refresh(cache)
+    assert cache.token(KEY, no_fetch, refresh) == "second"
+    assert cache.stats()["token"] == {"hits": 2, "misses": 1, "entries": 1}
+
+
+def test_without_a_refresh_callable_the_entry_lasts_until_it_expires():
+    cache = BootstrapCache(token_ttl=10, refresh_after=0.5)
+    cache.token(KEY, lambda: "first")
+    age(cache, "token", 6)
+    assert cache.token(KEY, lambda: "second") == "first"
+    assert not cache._refreshing
+    age(cache, "token", 5)
+    assert cache.token(KEY, lambda: "second") == "second"
+
+
+def test_a_failed_refresh_keeps_the_entry():
+    cache = BootstrapCache(token_ttl=10, refresh_after=0.5)
+    cache.token(KEY, lambda: "first")
+    age(cache, "token", 6)
+
+    def refresh():
+        raise ConnectionError("board down")
+
+    assert cache.token(KEY, lambda: "second", refresh) == "first"
+    wait_for_refresh(cache)
+    assert cache.token(KEY, lambda: "second") == "first"
+
+
+def test_failed_lookups_are_not_cached():
+    cache = BootstrapCache()
+    assert cache.token(KEY, lambda: None) is None
+    assert cache.token(KEY, lambda: "token") == "token"
+    assert cache.location(KEY, lambda: (None, None)) == (None, None)
+    assert cache.location(KEY, lambda: (1234, "C")) == (1234, "C")
+    assert cache.location(KEY, lambda: pytest.fail("fetched")) == (1234, "C")
+
+
+def test_invalidated_tokens_are_fetched_again():
+    cache = BootstrapCache()
+    cache.token(KEY, lambda: "rejected")
+    cache.invalidate_token(KEY)
+    assert cache.token(KEY, lambda: "fresh") == "fresh"
+    # locations are kept
+    cache.location(KEY, lambda: (1234, "C"))
+    cache.invalidate_token(KEY)
+    assert cache.stats()["location"]["entries"] == 1
+
+
+def test_concurrent_misses_share_one_fetch():
+    cache = BootstrapCache()
+    release = threading.Event()
+    fetches = []
+    coalesced_searches = COALESCED_SEARCHES._samples()
+
+    def fetch():
+        fetches.append(1)
+        release.wait()
+        return "token"
+
+    with ThreadPoolExecutor(4) as pool:
+        calls = [pool.submit(cache.token, KEY, fetch) for _ in range(4)]
+        while cache._flight.stats()["coalesced"] < 3:
+            time.sleep(0.005)
+        release.set()
+    assert [call.result() for call in calls] == ["token"] * 4
+    assert fetches == [1]
+    # bootstrap lookups aren't searches
+    assert COALESCED_SEARCHES._samples() == coalesced_searches
@@ -0,0 +1,151 @@
+"""
+Tests for jobspy.cache
+"""
+
+import pickle
+import time
+from datetime import date
+
+import pytest
+
+from jobspy.cache import DetailCache, DiskCache, MemoryCache, ResultCache, cache_key
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    DescriptionFormat,
+    JobPost,
+    JobType,
+    Location,
+    ScraperInput,
+    Site,
+)
+
+
+def search(**fields) -> ScraperInput:
+    return ScraperInput(
+        **{"site_type": [Site.INDEED], "search_term": "designer", **fields}
+    )
+
+
+@pytest.fixture(params=["memory", "disk"])
+def make_backend(request, tmp_path):
+    def make(**limits):
+        if request.param == "memory":
+            return MemoryCache(**limits)
+        return DiskCache(str(tmp_path / "cache.db"), **limits)
+
+    return make
+
+
+def test_cache_key_is_stable():
+    # entries on disk outlive the process, so the key format must not drift
+    assert cache_key(search(), Site.INDEED) == (
+        "e02a59304754d01838a6920ef7ffb509ca6c284a7ea5a88955d0ce970072fa35"
+    )
+
+
+def test_cache_key_ignores_excluded_fields_and_enum_spelling():
+    key = cache_key(search(), Site.INDEED)
+    assert key == cache_key(
+        search(
+            site_type=[Site.LINKEDIN, Site.INDEED],
+            deadline=time.monotonic(),
+            request_timeout=5,
+            description_format="markdown",
+        ),
+        Site.INDEED,
+    )
+    assert key == cache_key(
+        search(description_format=DescriptionFormat.MARKDOWN), Site.INDEED
+    )
+    assert key != cache_key(search(), Site.LINKEDIN)
+    assert key != cache_key(search(search_term="engineer"), Site.INDEED)
+    assert key != cache_key(search(results_wanted=50), Site.INDEED)
+
+
+def test_entries_expire(make_backend):
+    backend = make_backend()
+    backend.set("short", b"value", ttl=0.05)
+    backend.set("long", b"value", ttl=60)
+    assert backend.get("short") == b"value"
+    time.sleep(0.06)
+    assert backend.get("short") is None
+    assert backend.get("long") == b"value"
+
+
+def test_evicts_least_recently_used_by_count(make_backend):
+    backend = make_backend(max_entries=2)
+    backend.set("a", b"1", ttl=60)
+    time.sleep(0.001)
+    backend.set("b", b"2", ttl=60)
+    time.sleep(0.001)
+    assert backend.get("a") == b"1"
+    time.sleep(0.001)
+    backend.set("c", b"3", ttl=60)
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+    assert backend.get("c") == b"3"
+    assert len(backend) == 2
+
+
+def test_evicts_by_total_size(make_backend):
+    backend = make_backend(max_bytes=10)
+    backend.set("a", b"1234", ttl=60)
+    time.sleep(0.001)
+    backend.set("b", b"5678", ttl=60)
+    time.sleep(0.001)
+    backend.set("c", b"9012", ttl=60)
+    assert backend.get("a") is None
+    assert backend.size_bytes == 8
+    # a value over the whole budget isn't stored at all
+    backend.set("huge", b"x" * 11, ttl=60)
+    assert backend.get("huge") is None
+    assert len(backend) == 2
+
+
+def job(job_id: str) -> JobPost:
+    return JobPost(
+        id=job_id,
+        title="Designer",
+        company_name="Acme",
+        job_url=f"https://example.com/{job_id}",
+        location=Location(city="Austin", state="TX"),
+        job_type=[JobType.FULL_TIME, JobType.CONTRACT],
+        compensation=Compensation(
+            interval=CompensationInterval.YEARLY, min_amount=90000, max_amount=120000
+        ),
+        date_posted=date(2024, 5, 17),
+        emails=["jobs@example.com"],
+        is_remote=False,
+    )
+
+
+def test_result_cache_round_trips_job_posts(make_backend):
+    cache = ResultCache(make_backend())
+    key = cache_key(search(), Site.INDEED)
+    jobs = [job("in-1"), job("in-2")]
+    assert cache.get(key, Site.INDEED) is None
+    cache.set(key, Site.INDEED, jobs)
+    assert cache.get(key, Site.INDEED) == jobs
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["sites"]["indeed"] == {"hits": 1, "misses": 1}
+
+
+def test_result_cache_treats_pickled_entries_as_misses(make_backend):
+    backend = make_backend()
+    cache = ResultCache(backend)
+    backend.set("key", pickle.dumps([job("in-1")]), ttl=60)
+    assert cache.get("key", Site.INDEED) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_detail_cache_keeps_details_but_not_failures(make_backend):
+    cache = DetailCache(make_backend())
+    details = ("description", [JobType.FULL_TIME], None)
+    cache.set(Site.LINKEDIN, "1", "markdown", details)
+    assert cache.get(Site.LINKEDIN, "1", "markdown") == details
+    assert cache.get(Site.LINKEDIN, "1", "html") is None
+    cache.set(Site.LINKEDIN, "2", "markdown", {"description": None})
+    cache.set(Site.LINKEDIN, "3", "markdown", (None, None))
+    assert len(cache.backend) == 1
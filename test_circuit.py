@@ -0,0 +1,89 @@
+"""
+Tests for jobspy.circuit
+"""
+
+import time
+
+from jobspy.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, SiteCircuit
+from jobspy.model import Site
+
+
+def open_circuit(cooldown: float = 0.05) -> SiteCircuit:
+    circuit = SiteCircuit(min_requests=4, cooldown=cooldown, max_cooldown=0.15)
+    for ok in (True, False, False, True):
+        circuit.record(ok)
+    assert circuit.state == OPEN
+    return circuit
+
+
+def test_stays_closed_below_min_requests():
+    circuit = SiteCircuit(min_requests=4)
+    for _ in range(3):
+        circuit.record(False)
+    assert circuit.state == CLOSED
+    assert circuit.allow()
+
+
+def test_opens_at_the_failure_rate_and_skips():
+    circuit = open_circuit()
+    assert not circuit.allow()
+    assert circuit.stats()["skipped"] == 1
+
+
+def test_half_open_lets_one_trial_through_then_closes():
+    circuit = open_circuit()
+    time.sleep(0.06)
+    assert circuit.allow()
+    assert circuit.state == HALF_OPEN
+    # a second search waits for the trial's outcome
+    assert not circuit.allow()
+    circuit.record(True)
+    assert circuit.state == CLOSED
+    assert circuit.allow()
+
+
+def test_failed_trial_reopens_for_twice_as_long():
+    circuit = open_circuit()
+    time.sleep(0.06)
+    assert circuit.allow()
+    circuit.record(False)
+    assert circuit.state == OPEN
+    assert 0.09 < circuit._open_until - time.monotonic() <= 0.1
+    assert circuit.stats()["opened"] == 2
+
+
+def test_cooldown_is_capped_and_reset_once_closed():
+    circuit = open_circuit()
+    for _ in range(3):
+        circuit._open_until = 0.0
+        assert circuit.allow()
+        circuit.record(False)
+    assert circuit._cooldown == 0.15
+    circuit._open_until = 0.0
+    assert circuit.allow()
+    circuit.record(True)
+    assert circuit._cooldown == 0.05
+
+
+def test_outcomes_recorded_while_open_are_ignored():
+    circuit = open_circuit()
+    circuit.record(True)
+    assert circuit.state == OPEN
+    assert circuit.stats()["recent_requests"] == 0
+
+
+def test_breaker_maps_statuses_per_site():
+    breaker = CircuitBreaker(min_requests=2)
+    for status in (429, None):
+        breaker.record(Site.INDEED, status)
+    breaker.record(Site.LINKEDIN, 200)
+    breaker.record(Site.LINKEDIN, 404)
+    assert not breaker.allow(Site.INDEED)
+    assert breaker.allow(Site.LINKEDIN)
+    assert breaker.stats()["indeed"]["state"] == OPEN
+
+
+def test_disabled_breaker_allows_everything():
+    breaker = CircuitBreaker(min_requests=1, enabled=False)
+    breaker.record(Site.INDEED, 503)
+    assert breaker.allow(Site.INDEED)
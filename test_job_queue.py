@@ -0,0 +1,146 @@
+"""
+Tests for jobspy.job_queue
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from jobspy.job_queue import DONE, FAILED, QUEUED, RUNNING, QueueFull, SearchQueue
+
+
+def wait_for(queue: SearchQueue, task_id: str, status: str, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        task = queue.get(task_id)
+        if task["status"] == status:
+            return task
+        time.sleep(0.02)
+    raise AssertionError(f"{task_id} never got to {status}: {queue.get(task_id)}")
+
+
+def test_runs_tasks_and_reports_results_and_errors(tmp_path):
+    def handler(params, progress):
+        progress["sites"] = 1
+        if params.get("fail"):
+            raise RuntimeError("board down")
+        return {"jobs": params["n"]}
+
+    queue = SearchQueue(handler, path=str(tmp_path / "q.db"), workers=1)
+    try:
+        ok = queue.submit({"n": 3})
+        failed = queue.submit({"fail": True})
+        task = wait_for(queue, ok, DONE)
+        assert task["result"] == {"jobs": 3}
+        assert task["progress"] == {"sites": 1}
+        assert wait_for(queue, failed, FAILED)["error"] == "board down"
+        assert queue.get("unknown") is None
+    finally:
+        queue.close()
+
+
+def test_submit_refuses_past_max_pending(tmp_path):
+    queue = SearchQueue(
+        lambda *_: {}, path=str(tmp_path / "q.db"), workers=0, max_pending=2
+    )
+    try:
+        queue.submit({})
+        queue.submit({})
+        with pytest.raises(QueueFull):
+            queue.submit({})
+    finally:
+        queue.close()
+
+
+def test_queued_tasks_survive_a_restart(tmp_path):
+    path = str(tmp_path / "q.db")
+    first = SearchQueue(lambda *_: {}, path=path, workers=0)
+    task_ids = [first.submit({"n": n}) for n in range(3)]
+    assert first.get(task_ids[2])["position"] == 2
+    first.close()
+
+    second = SearchQueue(lambda params, _: params, path=path, workers=1)
+    try:
+        for n, task_id in enumerate(task_ids):
+            assert wait_for(second, task_id, DONE)["result"] == {"n": n}
+    finally:
+        second.close()
+
+
+def test_only_stale_running_tasks_are_queued_again(tmp_path):
+    path = str(tmp_path / "q.db")
+    release = threading.Event()
+
+    def blocking(params, progress):
+        release.wait()
+        return {"by": "first"}
+
+    first = SearchQueue(blocking, path=path, workers=1, heartbeat_interval=0.05)
+    task_id = first.submit({})
+    wait_for(first, task_id, RUNNING)
+
+    # a second process starting up leaves the first one's live task alone
+    second = SearchQueue(lambda *_: {"by": "second"}, path=path, workers=0)
+    assert second.get(task_id)["status"] == RUNNING
+    second.close()
+
+    # the first process stops heartbeating, as if it had died
+    first._stopped.set()
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE tasks SET heartbeat_at = 0 WHERE id = ?", (task_id,))
+    third = SearchQueue(lambda *_: {"by": "third"}, path=path, workers=1)
+    try:
+        assert wait_for(third, task_id, DONE)["result"] == {"by": "third"}
+        # the first process finishing late doesn't overwrite the rerun
+        release.set()
+        first.close()
+        assert third.get(task_id)["result"] == {"by": "third"}
+    finally:
+        third.close()
+
+
+def test_restart_requeues_tasks_from_files_without_heartbeats(tmp_path):
+    path = str(tmp_path / "q.db")
+    first = SearchQueue(lambda *_: {}, path=path, workers=0)
+    task_id = first.submit({})
+    first.close()
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE tasks SET status = ?", (RUNNING,))
+
+    second = SearchQueue(lambda *_: {}, path=path, workers=0)
+    try:
+        assert second.get(task_id)["status"] == QUEUED
+    finally:
+        second.close()
+
+
+def test_tasks_whose_process_keeps_dying_fail(tmp_path):
+    path = str(tmp_path / "q.db")
+    first = SearchQueue(lambda *_: {}, path=path, workers=0)
+    crashing, retried = first.submit({}), first.submit({})
+    first.close()
+    # both were running when their process died, one on its last attempt
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE tasks SET status = ?, heartbeat_at = 0", (RUNNING,))
+        conn.execute("UPDATE tasks SET attempts = 2 WHERE id = ?", (crashing,))
+        conn.execute("UPDATE tasks SET attempts = 1 WHERE id = ?", (retried,))
+
+    second = SearchQueue(lambda *_: {}, path=path, workers=0, max_attempts=2)
+    try:
+        task = second.get(crashing)
+        assert task["status"] == FAILED
+        assert "2 attempts" in task["error"]
+        assert second.get(retried)["status"] == QUEUED
+    finally:
+        second.close()
+
+
+def test_claiming_counts_attempts(tmp_path):
+    queue = SearchQueue(lambda *_: {}, path=str(tmp_path / "q.db"), workers=1)
+    try:
+        task_id = queue.submit({})
+        assert wait_for(queue, task_id, DONE)["attempts"] == 1
+    finally:
+        queue.close()
@@ -0,0 +1,114 @@
+"""
+Tests for jobspy.pipeline
+"""
+
+import threading
+import time
+
+import pytest
+
+from jobspy import scheduler
+from jobspy.pipeline import paginate
+from jobspy.scheduler import Scheduler
+
+
+class Board:
+    """Endless cursor-paginated search, five items a page, recording each fetch"""
+
+    def __init__(self, fail_on: int | None = None):
+        self.fetched = []
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def fetch(self, cursor):
+        page = cursor or 0
+        if page == self.fail_on:
+            raise RuntimeError("board down")
+        with self._lock:
+            self.fetched.append(page)
+        return [page] * 5, page + 1
+
+    def wait_for(self, count: int):
+        deadline = time.monotonic() + 5
+        while len(self.fetched) < count:
+            assert time.monotonic() < deadline, self.fetched
+            time.sleep(0.005)
+        # give a fetch that shouldn't happen the chance to
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = Scheduler(max_lookaheads=1)
+    monkeypatch.setattr(scheduler, "_scheduler", pool)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def test_fetches_lookahead_pages_ahead_in_order(pool):
+    board = Board()
+    pages = paginate(board.fetch, max_pages=6, lookahead=2)
+    assert next(pages) == [0] * 5
+    board.wait_for(3)
+    assert board.fetched == [0, 1, 2]
+    assert [page[0] for page in pages] == [1, 2, 3, 4, 5]
+    assert board.fetched == list(range(6))
+
+
+def test_lookahead_stops_at_wanted(pool):
+    board = Board()
+    pages = paginate(board.fetch, wanted=10, lookahead=3)
+    next(pages)
+    board.wait_for(2)
+    assert board.fetched == [0, 1]
+    # past wanted, a page is only fetched when it is asked for
+    next(pages)
+    next(pages)
+    board.wait_for(3)
+    assert board.fetched == [0, 1, 2]
+    pages.close()
+
+
+def test_close_stops_the_lookahead_and_frees_its_slot(pool):
+    board = Board()
+    pages = paginate(board.fetch, lookahead=1)
+    next(pages)
+    board.wait_for(2)
+    assert pool.stats()["lookaheads"]["running"] == 1
+    pages.close()
+    deadline = time.monotonic() + 5
+    while pool.stats()["lookaheads"]["running"]:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+    assert board.fetched == [0, 1]
+    assert pool.stats()["lookaheads"]["started"] == 1
+
+
+def test_errors_reach_the_caller_in_order(pool):
+    board = Board(fail_on=2)
+    pages = paginate(board.fetch, lookahead=2)
+    assert [next(pages)[0], next(pages)[0]] == [0, 1]
+    with pytest.raises(RuntimeError, match="board down"):
+        next(pages)
+
+
+def test_zero_lookahead_fetches_on_demand(pool):
+    board = Board()
+    pages = paginate(board.fetch, lookahead=0)
+    next(pages)
+    board.wait_for(1)
+    assert board.fetched == [0]
+    assert pool.stats()["lookaheads"]["started"] == 0
+
+
+def test_paginates_sequentially_once_the_pool_is_full(pool):
+    first, second = Board(), Board()
+    busy = paginate(first.fetch, lookahead=1)
+    next(busy)
+    pages = paginate(second.fetch, max_pages=3, lookahead=1)
+    next(pages)
+    second.wait_for(1)
+    assert second.fetched == [0]
+    assert [page[0] for page in pages] == [1, 2]
+    assert pool.stats()["lookaheads"]["declined"] == 1
+    busy.close()
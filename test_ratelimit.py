@@ -0,0 +1,87 @@
+"""
+Tests for jobspy.ratelimit
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from jobspy.ratelimit import HostLimiter, RateLimiter, retry_after_seconds
+
+
+def test_throttling_halves_the_rate_once_per_interval():
+    limiter = HostLimiter(rate=4.0)
+    limiter.record(429)
+    assert limiter.rate == 2.0
+    # in-flight requests reporting the same throttling don't halve it again
+    limiter.record(503)
+    assert limiter.rate == 2.0
+    limiter._last_backoff -= 1
+    limiter.record(429)
+    assert limiter.rate == 1.0
+
+
+def test_rate_never_drops_below_min_rate():
+    limiter = HostLimiter(rate=0.15, min_rate=0.1)
+    limiter.record(429)
+    assert limiter.rate == 0.1
+
+
+def test_successes_ramp_the_rate_up_to_max_rate():
+    limiter = HostLimiter(rate=1.0, increase=0.5, ramp_after=3, max_rate=1.5)
+    for _ in range(3):
+        limiter.record(200)
+    assert limiter.rate == 1.5
+    for _ in range(3):
+        limiter.record(200)
+    assert limiter.rate == 1.5
+
+
+def test_bucket_allows_a_burst_then_paces():
+    limiter = HostLimiter(rate=10.0, burst=2)
+    waits = [limiter.reserve() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert 0.05 < waits[2] <= 0.1
+    assert 0.15 < waits[3] <= 0.2
+
+
+def test_retry_after_holds_the_host():
+    limiter = HostLimiter(rate=10.0)
+    limiter.record(429, retry_after=5)
+    assert 4.9 < limiter.reserve() <= 5.0
+
+
+def test_retry_after_is_capped():
+    limiter = HostLimiter(rate=10.0, max_retry_after=2)
+    limiter.record(503, retry_after=600)
+    assert limiter.reserve() <= 2.0
+
+
+def test_retry_after_header_formats():
+    assert retry_after_seconds("7") == 7.0
+    assert retry_after_seconds("-3") == 0.0
+    assert retry_after_seconds("soon") is None
+    assert retry_after_seconds(None) is None
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 28 < retry_after_seconds(format_datetime(when, usegmt=True)) <= 30
+
+
+def test_rate_limiter_reads_retry_after_per_host():
+    rate_limiter = RateLimiter(default_rate=10.0)
+    rate_limiter.record("https://a.example/jobs", 429, {"Retry-After": "5"})
+    assert rate_limiter.reserve("https://a.example/next") > 4.9
+    assert rate_limiter.reserve("https://b.example/jobs") == 0.0
+
+
+def test_disabled_rate_limiter_never_waits():
+    rate_limiter = RateLimiter(enabled=False)
+    rate_limiter.record("https://a.example/", 429, {"Retry-After": "5"})
+    assert rate_limiter.reserve("https://a.example/") == 0.0
+
+
+def test_linkedin_starts_at_the_old_sleep_pace():
+    rate_limiter = RateLimiter()
+    limiter = rate_limiter.limiter("https://www.linkedin.com/jobs-guest/jobs/api/")
+    assert limiter.rate <= 0.2
+    for _ in range(20):
+        limiter.record(200)
+    assert limiter.rate > 0.2
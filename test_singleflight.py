@@ -0,0 +1,106 @@
+"""
+Tests for jobspy.singleflight
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jobspy.model import ScraperInput, Site
+from jobspy.singleflight import SingleFlight, search_key
+
+
+def run_together(flight: SingleFlight, fn, callers: int = 4):
+    """Calls flight.do from several threads while fn is held running"""
+    started = threading.Event()
+    release = threading.Event()
+
+    def leader_fn():
+        started.set()
+        release.wait()
+        return fn()
+
+    with ThreadPoolExecutor(callers) as pool:
+        leader = pool.submit(flight.do, "key", leader_fn)
+        started.wait()
+        followers = [
+            pool.submit(flight.do, "key", lambda: pytest.fail("ran twice"))
+            for _ in range(callers - 1)
+        ]
+        while flight.stats()["coalesced"] < callers - 1:
+            time.sleep(0.005)
+        release.set()
+    return leader, followers
+
+
+def test_identical_calls_share_the_leaders_result():
+    flight = SingleFlight()
+    leader, followers = run_together(flight, lambda: ["job"])
+    assert leader.result() == (["job"], False, 3)
+    for follower in followers:
+        assert follower.result() == (["job"], True, 3)
+    assert flight.stats() == {"in_flight": 0, "searches": 1, "coalesced": 3}
+
+
+def test_waiters_receive_the_leaders_error():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError("board down")
+
+    leader, followers = run_together(flight, fail)
+    for future in (leader, *followers):
+        with pytest.raises(RuntimeError, match="board down"):
+            future.result()
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_calls_after_the_leader_finished_run_again():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == (1, False, 0)
+    assert flight.do("key", lambda: 2) == (2, False, 0)
+
+
+def test_async_calls_coalesce_with_each_other_and_threads():
+    flight = SingleFlight()
+    release = threading.Event()
+    runs = []
+
+    async def search():
+        runs.append(1)
+        await asyncio.to_thread(release.wait)
+        return ["job"]
+
+    async def main():
+        calls = [asyncio.ensure_future(flight.do_async("key", search))]
+        while not runs:
+            await asyncio.sleep(0.005)
+        calls.append(asyncio.ensure_future(flight.do_async("key", search)))
+        threaded = asyncio.to_thread(flight.do, "key", lambda: pytest.fail("ran"))
+        calls.append(asyncio.ensure_future(threaded))
+        while flight.stats()["coalesced"] < 2:
+            await asyncio.sleep(0.005)
+        release.set()
+        return await asyncio.gather(*calls)
+
+    leader, follower, threaded = asyncio.run(main())
+    assert leader == (["job"], False, 2)
+    assert follower == threaded == (["job"], True, 2)
+    assert runs == [1]
+
+
+def test_search_key_ignores_site_order_and_deadline():
+    first = ScraperInput(
+        site_type=[Site.INDEED, Site.LINKEDIN], search_term="designer", deadline=1.0
+    )
+    second = ScraperInput(
+        site_type=[Site.LINKEDIN, Site.INDEED], search_term="designer", deadline=2.0
+    )
+    assert search_key(first) == search_key(second)
+    assert search_key(first) != search_key(first, only_new=True)
+    assert search_key(first) != search_key(
+        ScraperInput(site_type=[Site.INDEED], search_term="designer")
+    )
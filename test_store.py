@@ -0,0 +1,96 @@
+"""
+Tests for jobspy.store and scrape_jobs(only_new=True)
+"""
+
+import asyncio
+import sqlite3
+import time
+
+import jobspy
+from jobspy import JobStore, scrape_jobs, scrape_jobs_async
+from jobspy.model import JobPost, JobResponse, Location, Scraper, Site
+
+
+def row(job_id: str, title: str = "Designer") -> dict:
+    return {"id": job_id, "site": "indeed", "title": title, "job_url": job_id}
+
+
+def first_seen(path: str, job_id: str) -> str:
+    with sqlite3.connect(path) as conn:
+        return conn.execute(
+            "SELECT first_seen FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()[0]
+
+
+def test_upsert_keeps_first_seen(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    store = JobStore(path)
+    store.upsert([row("in-1")])
+    seen = first_seen(path, "in-1")
+    time.sleep(0.01)
+    store.upsert([row("in-1", title="Senior Designer"), row("in-2")])
+    assert first_seen(path, "in-1") == seen
+    assert store.get("in-1")["title"] == "Senior Designer"
+    assert len(store) == 2
+
+
+def test_known_ids(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.upsert([row("in-1"), {"title": "no id"}])
+    assert store.known_ids(["in-1", "in-2", None]) == {"in-1"}
+    assert len(store) == 1
+
+
+class PagedScraper(Scraper):
+    """Three pages of five jobs, pausing so the consumer stores each page first"""
+
+    def __init__(self, proxies=None, ca_cert=None, user_agent=None):
+        super().__init__(Site.INDEED, proxies=proxies)
+
+    def scrape(self, scraper_input):
+        self.scraper_input = scraper_input
+        job_list = []
+        for page in range(3):
+            jobs = [
+                JobPost(
+                    id=f"in-{page}-{i}",
+                    title="Designer",
+                    company_name="Acme",
+                    job_url=f"https://example.com/{page}/{i}",
+                    location=Location(city="Austin"),
+                )
+                for i in range(5)
+            ]
+            job_list += jobs
+            self._publish(job_list)
+            time.sleep(0.05)
+            if self._page_all_known(jobs):
+                break
+        return JobResponse(jobs=job_list)
+
+
+def test_only_new_ignores_jobs_from_its_own_run(tmp_path, monkeypatch):
+    monkeypatch.setitem(jobspy.SCRAPER_MAPPING, Site.INDEED, PagedScraper)
+    store = JobStore(str(tmp_path / "jobs.db"))
+    search = dict(site_name=["indeed"], results_wanted=15, job_store=store)
+
+    jobs = scrape_jobs(**search, only_new=True)
+    assert len(jobs) == 15
+
+    # everything is known now: the first page stops the scrape
+    assert len(scrape_jobs(**search, only_new=True)) == 0
+
+
+def test_scrape_jobs_async_records_and_filters(tmp_path, monkeypatch):
+    monkeypatch.setitem(jobspy.SCRAPER_MAPPING, Site.INDEED, PagedScraper)
+    monkeypatch.delitem(jobspy.ASYNC_SCRAPER_MAPPING, Site.INDEED)
+    store = JobStore(str(tmp_path / "jobs.db"))
+    search = dict(site_name=["indeed"], results_wanted=15, job_store=store)
+
+    metadata = {}
+    jobs = asyncio.run(scrape_jobs_async(**search, only_new=True, metadata=metadata))
+    assert len(jobs) == 15
+    assert len(store) == 15
+    assert metadata["sites"]["indeed"]["jobs"] == 15
+
+    assert len(asyncio.run(scrape_jobs_async(**search, only_new=True))) == 0